@@ -0,0 +1,101 @@
+"""
+---------------------------------------------------
+---------- Benchmark - Cópia de arquivos ----------
+---------------------------------------------------
+Script responsável por comparar a cópia de arquivos
+um a um através de copia_arquivo() (com e sem
+validação de presença na origem) com a cópia em lote
+de copia_arquivos(), variando a quantidade de threads
+
+Execução
+---------------------------------------------------
+python -m benchmarks.bench_copia --n-arquivos 2000 --tamanho 65536
+
+Sumário
+---------------------------------------------------
+1. Configuração inicial
+    1.1 Importando bibliotecas
+2. Cenários comparados
+3. Execução do benchmark
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+
+# Filescope
+from filescope.manager import copia_arquivo, copia_arquivos, logger
+from benchmarks.utils import mede_tempo
+
+
+"""
+---------------------------------------------------
+------------- 2. CENÁRIOS COMPARADOS --------------
+---------------------------------------------------
+"""
+
+def copia_um_a_um(pares, destino, valida_presenca):
+    shutil.rmtree(destino, ignore_errors=True)
+    for origem, dst in pares:
+        copia_arquivo(origem=origem, destino=dst, valida_presenca=valida_presenca)
+
+def copia_em_lote(pares, destino, workers):
+    shutil.rmtree(destino, ignore_errors=True)
+    copia_arquivos(pares=pares, workers=workers)
+
+
+"""
+---------------------------------------------------
+------------ 3. EXECUÇÃO DO BENCHMARK --------------
+---------------------------------------------------
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de cópia de arquivos')
+    parser.add_argument('--n-arquivos', type=int, default=2000)
+    parser.add_argument('--tamanho', type=int, default=65536)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 16])
+    args = parser.parse_args()
+
+    # Silenciando logs por arquivo durante as medições
+    logger.setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        origem = os.path.join(tmp, 'origem')
+        destino = os.path.join(tmp, 'destino')
+        os.makedirs(origem)
+        conteudo = os.urandom(args.tamanho)
+        for i in range(args.n_arquivos):
+            with open(os.path.join(origem, f'arquivo{i}.bin'), 'wb') as f:
+                f.write(conteudo)
+        pares = [(os.path.join(origem, f'arquivo{i}.bin'), os.path.join(destino, f'sub{i % 20}', f'arquivo{i}.bin'))
+                 for i in range(args.n_arquivos)]
+        volume_mb = args.n_arquivos * args.tamanho / 1024**2
+        print(f'{args.n_arquivos} arquivos de {args.tamanho} bytes ({volume_mb:.1f} MB)')
+
+        cenarios = [
+            ('copia_arquivo', copia_um_a_um, {'valida_presenca': False}),
+            ('copia_arquivo (valida_presenca)', copia_um_a_um, {'valida_presenca': True}),
+        ] + [(f'copia_arquivos (workers={w})', copia_em_lote, {'workers': w}) for w in args.workers]
+
+        print(f'\n{"cenário":<36}{"tempo (s)":>12}{"MB/s":>10}{"arq/s":>10}')
+        for nome, func, kwargs in cenarios:
+            tempo = mede_tempo(func, repeticoes=args.repeticoes, pares=pares, destino=destino, **kwargs)
+            print(f'{nome:<36}{tempo:>12.4f}{volume_mb / tempo:>10.1f}{args.n_arquivos / tempo:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
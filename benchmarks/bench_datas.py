@@ -0,0 +1,114 @@
+"""
+---------------------------------------------------
+---- Benchmark - Derivação de colunas de datas ----
+---------------------------------------------------
+Script responsável por comparar a construção original
+das colunas dt_* e dias_desde_* do report de controle
+de diretório (time.strftime por linha + pd.to_datetime
++ subtração) com a conversão vetorizada realizada por
+filescope.manager.epoch_para_datetime()
+
+Execução
+---------------------------------------------------
+python -m benchmarks.bench_datas --n-linhas 5000000
+
+Sumário
+---------------------------------------------------
+1. Configuração inicial
+    1.1 Importando bibliotecas
+2. Abordagens comparadas
+3. Execução do benchmark
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import argparse
+import time
+from datetime import datetime
+
+# Bibliotecas de terceiros
+import numpy as np
+import pandas as pd
+
+# Filescope
+from filescope.manager import epoch_para_datetime
+
+
+"""
+---------------------------------------------------
+------------ 2. ABORDAGENS COMPARADAS -------------
+---------------------------------------------------
+"""
+
+DATE_COLS = [('dt_criacao', 'dias_desde_criacao'),
+             ('dt_ult_modif', 'dias_desde_ult_modif'),
+             ('dt_ult_acesso', 'dias_desde_ult_acesso')]
+
+# Abordagem original: strftime por linha, parsing e subtração
+def datas_original(epochs):
+    df = pd.DataFrame()
+    for dt_col, _ in DATE_COLS:
+        df[dt_col] = [time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ts)) for ts in epochs[dt_col] / 1e9]
+    df['dt_relatorio'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    for col in [dt_col for dt_col, _ in DATE_COLS] + ['dt_relatorio']:
+        df[col] = pd.to_datetime(df[col])
+    for dt_col, dias_col in DATE_COLS:
+        df[dias_col] = (df['dt_relatorio'] - df[dt_col]).dt.days
+    return df
+
+# Abordagem vetorizada a partir dos timestamps em nanosegundos
+def datas_vetorizadas(epochs, tz=None):
+    df = pd.DataFrame()
+    dt_relatorio = epoch_para_datetime([time.time_ns()], tz=tz)[0]
+    for dt_col, dias_col in DATE_COLS:
+        datas = epoch_para_datetime(epochs[dt_col], tz=tz)
+        df[dt_col] = datas
+        df[dias_col] = (dt_relatorio - datas) // np.timedelta64(1, 'D')
+    df['dt_relatorio'] = dt_relatorio
+    return df
+
+
+"""
+---------------------------------------------------
+------------ 3. EXECUÇÃO DO BENCHMARK --------------
+---------------------------------------------------
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de derivação de colunas de datas')
+    parser.add_argument('--n-linhas', type=int, default=5000000)
+    parser.add_argument('--sem-original', action='store_true', help='Ignora a abordagem original (lenta)')
+    args = parser.parse_args()
+
+    # Timestamps aleatórios nos últimos 5 anos (em nanosegundos)
+    agora = time.time_ns()
+    rng = np.random.default_rng(42)
+    cinco_anos = 5 * 365 * 86400 * 10**9
+    epochs = {dt_col: agora - rng.integers(0, cinco_anos, args.n_linhas) for dt_col, _ in DATE_COLS}
+    print(f'Derivando colunas de datas para {args.n_linhas} linhas')
+
+    cenarios = [('vetorizada (fuso local)', datas_vetorizadas, {}),
+                ('vetorizada (tz=UTC)', datas_vetorizadas, {'tz': 'UTC'})]
+    if not args.sem_original:
+        cenarios.insert(0, ('original (strftime + to_datetime)', datas_original, {}))
+
+    print(f'\n{"abordagem":<36}{"tempo (s)":>12}{"speedup":>10}')
+    tempo_base = None
+    for nome, func, kwargs in cenarios:
+        inicio = time.perf_counter()
+        func(epochs, **kwargs)
+        tempo = time.perf_counter() - inicio
+        tempo_base = tempo_base or tempo
+        print(f'{nome:<36}{tempo:>12.3f}{tempo_base / tempo:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
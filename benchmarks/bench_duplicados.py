@@ -0,0 +1,113 @@
+"""
+---------------------------------------------------
+------- Benchmark - Arquivos duplicados -----------
+---------------------------------------------------
+Script responsável por comparar a detecção ingênua
+de duplicados (checksum completo de todos os
+arquivos) com a detecção em etapas de
+duplicados_de_diretorio() (tamanho, checksum parcial
+e checksum completo), com e sem cache de checksums
+
+A árvore sintética contém arquivos com tamanhos
+repetidos e conteúdo diferente (descartados pelo
+checksum parcial) e grupos de cópias idênticas
+
+Execução
+---------------------------------------------------
+python -m benchmarks.bench_duplicados --n-arquivos 400 --tamanho 1048576
+
+Sumário
+---------------------------------------------------
+1. Configuração inicial
+    1.1 Importando bibliotecas
+2. Cenários comparados
+3. Execução do benchmark
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import argparse
+import logging
+import os
+import tempfile
+
+# Filescope
+from filescope.manager import controle_de_diretorio, duplicados_de_diretorio, logger
+from filescope.copia import checksum_arquivo
+from benchmarks.utils import mede_tempo
+
+
+"""
+---------------------------------------------------
+------------- 2. CENÁRIOS COMPARADOS --------------
+---------------------------------------------------
+"""
+
+# Detecção ingênua: checksum completo de todos os arquivos
+def duplicados_ingenuo(df, **kwargs):
+    grupos = {}
+    for diretorio, arquivo in zip(df['diretorio'].astype(str), df['arquivo']):
+        caminho = os.path.join(diretorio, arquivo)
+        grupos.setdefault(checksum_arquivo(caminho), []).append(caminho)
+    return [g for g in grupos.values() if len(g) > 1]
+
+# Detecção em etapas
+def duplicados_etapas(df, workers, cache=None):
+    return duplicados_de_diretorio(df, workers=workers, cache=cache)
+
+
+"""
+---------------------------------------------------
+------------ 3. EXECUÇÃO DO BENCHMARK --------------
+---------------------------------------------------
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de detecção de arquivos duplicados')
+    parser.add_argument('--n-arquivos', type=int, default=400)
+    parser.add_argument('--tamanho', type=int, default=1024**2)
+    parser.add_argument('--fracao-copias', type=float, default=.1)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    # Silenciando logs durante as medições
+    logger.setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, 'root')
+        os.makedirs(root)
+        qtd_copias = int(args.n_arquivos * args.fracao_copias)
+        original = os.urandom(args.tamanho)
+        for i in range(args.n_arquivos):
+            conteudo = original if i < qtd_copias else os.urandom(args.tamanho)
+            with open(os.path.join(root, f'arquivo{i}.bin'), 'wb') as f:
+                f.write(conteudo)
+        df = controle_de_diretorio(root)
+        volume_mb = args.n_arquivos * args.tamanho / 1024**2
+        print(f'{args.n_arquivos} arquivos de mesmo tamanho ({volume_mb:.1f} MB), {qtd_copias} cópias idênticas')
+
+        cache = os.path.join(tmp, 'hashes.db')
+        duplicados_etapas(df, workers=args.workers, cache=cache)
+        cenarios = [
+            ('checksum completo de todos', duplicados_ingenuo, {}),
+            ('duplicados_de_diretorio', duplicados_etapas, {'workers': args.workers}),
+            ('duplicados_de_diretorio (cache)', duplicados_etapas, {'workers': args.workers, 'cache': cache}),
+        ]
+
+        print(f'\n{"cenário":<36}{"tempo (s)":>12}')
+        for nome, func, kwargs in cenarios:
+            tempo = mede_tempo(func, repeticoes=args.repeticoes, df=df, **kwargs)
+            print(f'{nome:<36}{tempo:>12.4f}')
+
+
+if __name__ == '__main__':
+    main()
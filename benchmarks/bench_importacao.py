@@ -0,0 +1,136 @@
+"""
+---------------------------------------------------
+------- Benchmark - Tempo de importação -----------
+---------------------------------------------------
+Script responsável por medir o tempo de importação
+dos módulos do filescope através da opção
+`python -X importtime`, em subprocessos isolados, e
+por verificar que as funções de validação e cópia de
+arquivos não importam as bibliotecas de análise e
+visualização (numpy, pandas, matplotlib e seaborn)
+
+O script retorna código de saída 1 quando alguma das
+bibliotecas pesadas é importada por um dos cenários
+do núcleo ou quando o tempo de importação ultrapassa
+o limite informado, permitindo seu uso como teste de
+regressão
+
+Execução
+---------------------------------------------------
+python -m benchmarks.bench_importacao --limite-ms 150
+
+Sumário
+---------------------------------------------------
+1. Configuração inicial
+    1.1 Importando bibliotecas
+2. Medição de importação
+3. Execução do benchmark
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import argparse
+import subprocess
+import sys
+
+
+"""
+---------------------------------------------------
+----------- 2. MEDIÇÃO DE IMPORTAÇÃO --------------
+---------------------------------------------------
+"""
+
+# Bibliotecas que não devem ser importadas pelo núcleo de validação e cópia
+BIBLIOTECAS_PESADAS = ['numpy', 'pandas', 'matplotlib', 'seaborn']
+
+# Cenários medidos: (nome, código executado, flag de cenário do núcleo)
+CENARIOS = [
+    ('import filescope.manager', 'import filescope.manager', True),
+    ('valida_arquivo_origem()', 'from filescope.manager import valida_arquivo_origem\n'
+                                'valida_arquivo_origem(".", "setup.py")', True),
+    ('copia_arquivos()', 'import os, tempfile\n'
+                         'from filescope.manager import copia_arquivos\n'
+                         'with tempfile.TemporaryDirectory() as tmp:\n'
+                         '    copia_arquivos([("setup.py", os.path.join(tmp, "setup.py"))])', True),
+    ('import filescope.assincrono', 'import filescope.assincrono', True),
+    ('import pandas + matplotlib + seaborn', 'import pandas, matplotlib.pyplot, seaborn', False),
+]
+
+def mede_importacao(codigo):
+    """
+    Executa um trecho de código em um subprocesso com -X importtime
+
+    Parâmetros
+    ----------
+    :param codigo: código python a ser executado [type: string]
+
+    Retorno
+    -------
+    :return total_ms: soma dos tempos de importação de primeiro nível (em ms) [type: float]
+    :return maiores: cinco módulos com maior tempo acumulado [type: list of tuples (modulo, ms)]
+    :return pesadas: bibliotecas pesadas importadas [type: list]
+    """
+
+    verificacao = f'\nimport sys\nprint(",".join(m for m in {BIBLIOTECAS_PESADAS!r} if m in sys.modules))'
+    saida = subprocess.run([sys.executable, '-X', 'importtime', '-c', codigo + verificacao],
+                           capture_output=True, text=True, check=True)
+
+    # Linhas no formato "import time: self [us] | cumulative | imported package"
+    total_us, modulos = 0, []
+    for linha in saida.stderr.splitlines():
+        if not linha.startswith('import time:') or 'self [us]' in linha:
+            continue
+        _, acumulado, nome = linha[len('import time:'):].split('|')
+        acumulado = int(acumulado)
+        modulos.append((nome.strip(), acumulado / 1000))
+        if not nome.startswith('  '):
+            total_us += acumulado
+
+    maiores = sorted(modulos, key=lambda m: m[1], reverse=True)[:5]
+    pesadas = [m for m in saida.stdout.strip().splitlines()[-1].split(',') if m] if saida.stdout.strip() else []
+    return total_us / 1000, maiores, pesadas
+
+
+"""
+---------------------------------------------------
+------------ 3. EXECUÇÃO DO BENCHMARK --------------
+---------------------------------------------------
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de tempo de importação')
+    parser.add_argument('--limite-ms', type=float, default=None,
+                        help='Tempo máximo de importação dos cenários do núcleo (opcional)')
+    parser.add_argument('--detalhes', action='store_true', help='Exibe os módulos com maior tempo de importação')
+    args = parser.parse_args()
+
+    falhas = []
+    print(f'{"cenário":<40}{"importação (ms)":>18}  bibliotecas pesadas')
+    for nome, codigo, nucleo in CENARIOS:
+        total_ms, maiores, pesadas = mede_importacao(codigo)
+        print(f'{nome:<40}{total_ms:>18.1f}  {", ".join(pesadas) or "-"}')
+        if args.detalhes:
+            for modulo, ms in maiores:
+                print(f'    {modulo:<36}{ms:>18.1f}')
+        if nucleo and pesadas:
+            falhas.append(f'{nome}: importa {", ".join(pesadas)}')
+        if nucleo and args.limite_ms is not None and total_ms > args.limite_ms:
+            falhas.append(f'{nome}: {total_ms:.1f} ms acima do limite de {args.limite_ms} ms')
+
+    if falhas:
+        print('\nRegressões encontradas:')
+        for falha in falhas:
+            print(f'  - {falha}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""
+---------------------------------------------------
+--- Benchmark - Memória do report de diretórios ---
+---------------------------------------------------
+Script responsável por comparar o pico de memória
+(RSS) da construção original do report de controle
+de diretório (listas Python paralelas + colunas
+adicionadas uma a uma) com o armazenamento colunar
+compacto utilizado por controle_de_diretorio()
+
+Cada abordagem é executada em um subprocesso isolado,
+garantindo que o pico de memória medido corresponda
+apenas à abordagem avaliada
+
+Execução
+---------------------------------------------------
+python -m benchmarks.bench_memoria --n-dirs 2000 --n-arquivos 100
+
+Sumário
+---------------------------------------------------
+1. Configuração inicial
+    1.1 Importando bibliotecas
+2. Abordagens comparadas
+3. Execução do benchmark
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pwd import getpwuid
+
+# Filescope
+from benchmarks.utils import cria_arvore_sintetica
+
+
+"""
+---------------------------------------------------
+------------ 2. ABORDAGENS COMPARADAS -------------
+---------------------------------------------------
+"""
+
+# Construção original do report (listas paralelas e colunas adicionadas uma a uma)
+def report_original(root):
+    import pandas as pd
+    from filescope.manager import calc_filescope_score
+
+    root_manager = pd.DataFrame()
+    all_files, all_sizes, all_cdt, all_mdt, all_adt, all_owners = [], [], [], [], [], []
+    for path, _, files in os.walk(root):
+        for name in files:
+            caminho = os.path.join(path, name)
+            all_files.append(caminho)
+            all_sizes.append(os.path.getsize(caminho))
+            all_cdt.append(os.path.getctime(caminho))
+            all_mdt.append(os.path.getmtime(caminho))
+            all_adt.append(os.path.getatime(caminho))
+            all_owners.append(getpwuid(os.stat(caminho).st_uid).pw_name)
+
+    root_manager['diretorio'] = [os.path.split(f)[0] for f in all_files]
+    root_manager['arquivo'] = [os.path.split(f)[-1] for f in all_files]
+    root_manager['tamanho_kb'] = [size / 1000 for size in all_sizes]
+    root_manager['usuario_owner'] = all_owners
+    root_manager['dt_criacao'] = [time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(cdt)) for cdt in all_cdt]
+    root_manager['dt_ult_modif'] = [time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mdt)) for mdt in all_mdt]
+    root_manager['dt_ult_acesso'] = [time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(adt)) for adt in all_adt]
+    root_manager['dt_relatorio'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    for col in [col for col in root_manager.columns if 'dt_' in col]:
+        root_manager[col] = pd.to_datetime(root_manager[col])
+    root_manager['dias_desde_criacao'] = (root_manager['dt_relatorio'] - root_manager['dt_criacao']).dt.days
+    root_manager['dias_desde_ult_modif'] = (root_manager['dt_relatorio'] - root_manager['dt_ult_modif']).dt.days
+    root_manager['dias_desde_ult_acesso'] = (root_manager['dt_relatorio'] - root_manager['dt_ult_acesso']).dt.days
+
+    return calc_filescope_score(df=root_manager)
+
+# Construção colunar atual
+def report_colunar(root):
+    from filescope.manager import controle_de_diretorio
+    return controle_de_diretorio(root=root)
+
+
+ABORDAGENS = {'original': report_original, 'colunar': report_colunar}
+
+
+"""
+---------------------------------------------------
+------------ 3. EXECUÇÃO DO BENCHMARK --------------
+---------------------------------------------------
+"""
+
+def executa_abordagem(abordagem, root):
+    """Executa uma abordagem e imprime linhas, memória do DataFrame e pico de RSS (em MB)"""
+
+    # Pico de memória antes da execução (importações)
+    import pandas  # noqa: F401
+    import filescope.manager  # noqa: F401
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    df = ABORDAGENS[abordagem](root)
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    mem_df = df.memory_usage(deep=True).sum() / 1024**2
+    print(f'{len(df)};{mem_df:.1f};{(pico - base) / 1024:.1f};{pico / 1024:.1f}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de memória do report de controle de diretório')
+    parser.add_argument('--n-dirs', type=int, default=2000)
+    parser.add_argument('--n-arquivos', type=int, default=100)
+    parser.add_argument('--root', default=None, help='Diretório existente a ser varrido (opcional)')
+    parser.add_argument('--abordagem', choices=list(ABORDAGENS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Execução interna (subprocesso)
+    if args.abordagem is not None:
+        executa_abordagem(args.abordagem, args.root)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.root
+        if root is None:
+            root = tmp
+            qtd = cria_arvore_sintetica(root, n_dirs=args.n_dirs, n_arquivos=args.n_arquivos, tamanho=0)
+            print(f'Árvore sintética criada com {qtd} arquivos em {args.n_dirs} diretórios')
+
+        print(f'\n{"abordagem":<12}{"linhas":>10}{"df (MB)":>10}{"Δ pico RSS (MB)":>18}{"pico RSS (MB)":>16}')
+        for abordagem in ABORDAGENS:
+            saida = subprocess.run([sys.executable, '-m', 'benchmarks.bench_memoria', '--abordagem', abordagem,
+                                    '--root', root], capture_output=True, text=True, check=True)
+            linhas, mem_df, delta, pico = saida.stdout.strip().splitlines()[-1].split(';')
+            print(f'{abordagem:<12}{linhas:>10}{mem_df:>10}{delta:>18}{pico:>16}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+---------------------------------------------------
+---- Benchmark - Consolidação por diretórios ------
+---------------------------------------------------
+Script responsável por comparar a consolidação por
+diretórios construída durante a varredura
+(rollup_de_diretorio()) com a abordagem posterior:
+report de arquivos completo seguido de groupby sobre
+os caminhos em texto de cada diretório ancestral
+
+Execução
+---------------------------------------------------
+python -m benchmarks.bench_rollup --n-dirs 2000 --n-arquivos 50
+
+Sumário
+---------------------------------------------------
+1. Configuração inicial
+    1.1 Importando bibliotecas
+2. Abordagens comparadas
+3. Execução do benchmark
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import argparse
+import logging
+import os
+import tempfile
+
+# Filescope
+from filescope.manager import controle_de_diretorio, rollup_de_diretorio, logger, pd
+from benchmarks.utils import cria_arvore_sintetica, mede_tempo
+
+
+"""
+---------------------------------------------------
+------------ 2. ABORDAGENS COMPARADAS -------------
+---------------------------------------------------
+"""
+
+# Consolidação posterior: report completo + groupby por diretório ancestral
+def rollup_posterior(root):
+    df = controle_de_diretorio(root)
+    root = os.path.abspath(root)
+    df = df.assign(diretorio=df['diretorio'].astype(str))
+    ancestrais = []
+    for diretorio in df['diretorio'].unique():
+        atual = os.path.abspath(diretorio)
+        while True:
+            ancestrais.append((diretorio, atual))
+            if atual == root:
+                break
+            atual = os.path.dirname(atual)
+    df = df.merge(pd.DataFrame(ancestrais, columns=['diretorio', 'ancestral']), on='diretorio')
+    return df.groupby('ancestral').agg({'arquivo': 'count', 'tamanho_kb': 'sum',
+                                        'dias_desde_ult_acesso': ['max', 'mean']})
+
+# Consolidação durante a varredura
+def rollup_varredura(root):
+    return rollup_de_diretorio(root)
+
+
+"""
+---------------------------------------------------
+------------ 3. EXECUÇÃO DO BENCHMARK --------------
+---------------------------------------------------
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de consolidação por diretórios')
+    parser.add_argument('--n-dirs', type=int, default=2000)
+    parser.add_argument('--n-arquivos', type=int, default=50)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    # Silenciando logs durante as medições
+    logger.setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as root:
+        qtd = cria_arvore_sintetica(root, n_dirs=args.n_dirs, n_arquivos=args.n_arquivos, profundidade=4)
+        print(f'Árvore com {args.n_dirs} diretórios e {qtd} arquivos')
+
+        cenarios = [
+            ('report + groupby por ancestral', rollup_posterior),
+            ('rollup_de_diretorio', rollup_varredura),
+        ]
+
+        print(f'\n{"cenário":<34}{"tempo (s)":>12}')
+        for nome, func in cenarios:
+            tempo = mede_tempo(func, repeticoes=args.repeticoes, root=root)
+            print(f'{nome:<34}{tempo:>12.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+"""
+---------------------------------------------------
+------- Benchmark - Varredura de diretórios -------
+---------------------------------------------------
+Script responsável por comparar a varredura original
+do report de controle de diretório (os.walk + cinco
+chamadas stat por arquivo) com os backends do módulo
+filescope.scanner, medindo a quantidade de chamadas
+stat realizadas e o tempo total de execução
+
+Execução
+---------------------------------------------------
+python -m benchmarks.bench_scanner --n-dirs 200 --n-arquivos 100
+
+A contagem de chamadas é feita por instrumentação de
+os.stat() e dos objetos DirEntry. Para conferência no
+nível do kernel, é possível executar o mesmo script
+com `strace -c -f -e trace=%stat python -m ...`
+
+Sumário
+---------------------------------------------------
+1. Configuração inicial
+    1.1 Importando bibliotecas
+2. Funções de varredura comparadas
+3. Instrumentação de chamadas stat
+4. Execução do benchmark
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import argparse
+import os
+import tempfile
+
+# Filescope
+from filescope.scanner import varre_diretorio
+from benchmarks.utils import cria_arvore_sintetica, mede_tempo
+
+
+"""
+---------------------------------------------------
+------- 2. FUNÇÕES DE VARREDURA COMPARADAS --------
+---------------------------------------------------
+"""
+
+# Varredura original (cinco chamadas stat por arquivo)
+def varredura_original(root):
+    registros = []
+    for path, _, files in os.walk(root):
+        for name in files:
+            caminho = os.path.join(path, name)
+            registros.append((caminho, os.path.getsize(caminho), os.path.getctime(caminho),
+                              os.path.getmtime(caminho), os.path.getatime(caminho), os.stat(caminho).st_uid))
+    return registros
+
+# Varredura a partir dos backends do filescope (uma chamada stat por arquivo)
+def varredura_filescope(root, backend):
+    registros = []
+    for path, name, st in varre_diretorio(root, backend=backend):
+        registros.append((path, name, st.st_size, st.st_ctime, st.st_mtime, st.st_atime, st.st_uid))
+    return registros
+
+
+"""
+---------------------------------------------------
+------- 3. INSTRUMENTAÇÃO DE CHAMADAS STAT --------
+---------------------------------------------------
+"""
+
+class _EntryInstrumentada:
+    """Proxy de os.DirEntry que contabiliza chamadas stat não cacheadas"""
+
+    def __init__(self, entry, contador):
+        self._entry = entry
+        self._contador = contador
+        self._stat = None
+
+    def __getattr__(self, attr):
+        return getattr(self._entry, attr)
+
+    def stat(self, **kwargs):
+        if self._stat is None:
+            self._contador['stat'] += 1
+            self._stat = self._entry.stat(**kwargs)
+        return self._stat
+
+
+class _ScandirInstrumentado:
+    """Proxy do iterador de os.scandir() que contabiliza listagens de diretório"""
+
+    def __init__(self, it, contador):
+        self._it = it
+        self._contador = contador
+        contador['scandir'] += 1
+
+    def __iter__(self):
+        for entry in self._it:
+            yield _EntryInstrumentada(entry, self._contador)
+
+    def __next__(self):
+        return _EntryInstrumentada(next(self._it), self._contador)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._it.close()
+
+    def close(self):
+        self._it.close()
+
+
+def conta_chamadas(func, **kwargs):
+    """
+    Executa uma função de varredura contabilizando chamadas stat e listagens de diretório
+
+    Parâmetros
+    ----------
+    :param func: função de varredura [type: callable]
+    :param **kwargs: argumentos repassados para a função
+
+    Retorno
+    -------
+    :return contador: dicionário com a quantidade de chamadas 'stat' e 'scandir' [type: dict]
+    """
+
+    contador = {'stat': 0, 'scandir': 0}
+    stat_original = os.stat
+    scandir_original = os.scandir
+
+    def stat_instrumentado(*args, **kw):
+        contador['stat'] += 1
+        return stat_original(*args, **kw)
+
+    def scandir_instrumentado(*args, **kw):
+        return _ScandirInstrumentado(scandir_original(*args, **kw), contador)
+
+    os.stat = stat_instrumentado
+    os.scandir = scandir_instrumentado
+    try:
+        func(**kwargs)
+    finally:
+        os.stat = stat_original
+        os.scandir = scandir_original
+
+    return contador
+
+
+"""
+---------------------------------------------------
+------------ 4. EXECUÇÃO DO BENCHMARK --------------
+---------------------------------------------------
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de varredura de diretórios')
+    parser.add_argument('--n-dirs', type=int, default=200)
+    parser.add_argument('--n-arquivos', type=int, default=100)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--root', default=None, help='Diretório existente a ser varrido (opcional)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.root
+        if root is None:
+            root = tmp
+            qtd = cria_arvore_sintetica(root, n_dirs=args.n_dirs, n_arquivos=args.n_arquivos)
+            print(f'Árvore sintética criada com {qtd} arquivos em {args.n_dirs} diretórios')
+
+        cenarios = [
+            ('original (os.walk + 5 stat)', varredura_original, {'root': root}),
+            ('filescope backend=walk', varredura_filescope, {'root': root, 'backend': 'walk'}),
+            ('filescope backend=scandir', varredura_filescope, {'root': root, 'backend': 'scandir'}),
+        ]
+
+        print(f'\n{"cenário":<32}{"arquivos":>10}{"stat":>10}{"stat/arq":>10}{"scandir":>10}{"tempo (s)":>12}')
+        for nome, func, kwargs in cenarios:
+            qtd_arquivos = len(func(**kwargs))
+            contador = conta_chamadas(func, **kwargs)
+            tempo = mede_tempo(func, repeticoes=args.repeticoes, **kwargs)
+            por_arquivo = contador['stat'] / max(qtd_arquivos, 1)
+            print(f'{nome:<32}{qtd_arquivos:>10}{contador["stat"]:>10}{por_arquivo:>10.2f}'
+                  f'{contador["scandir"]:>10}{tempo:>12.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""
+---------------------------------------------------
+---- Benchmark - Varredura paralela de diretórios --
+---------------------------------------------------
+Script responsável por medir a escalabilidade da
+varredura paralela do módulo filescope.scanner em
+uma árvore sintética, variando a quantidade de threads
+do pool entre 1 e 64
+
+Execução
+---------------------------------------------------
+python -m benchmarks.bench_scanner_paralelo --n-dirs 500 --latencia-ms 1
+
+Em discos locais a listagem de diretórios é servida
+pelo cache do kernel e o ganho com threads é pequeno.
+O parâmetro --latencia-ms adiciona uma espera artificial
+a cada listagem de diretório e a cada chamada stat,
+simulando o comportamento de sistemas de arquivos de
+rede (NFS/SMB), cenário alvo da varredura paralela
+
+Sumário
+---------------------------------------------------
+1. Configuração inicial
+    1.1 Importando bibliotecas
+2. Simulação de latência
+3. Execução do benchmark
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import argparse
+import os
+import tempfile
+import time
+
+# Filescope
+from filescope.scanner import varre_diretorio
+from benchmarks.utils import cria_arvore_sintetica, mede_tempo
+
+
+"""
+---------------------------------------------------
+------------ 2. SIMULAÇÃO DE LATÊNCIA -------------
+---------------------------------------------------
+"""
+
+class _EntryComLatencia:
+    """Proxy de os.DirEntry que adiciona latência à chamada stat"""
+
+    def __init__(self, entry, latencia):
+        self._entry = entry
+        self._latencia = latencia
+
+    def __getattr__(self, attr):
+        return getattr(self._entry, attr)
+
+    def stat(self, **kwargs):
+        time.sleep(self._latencia)
+        return self._entry.stat(**kwargs)
+
+
+class _ScandirComLatencia:
+    """Proxy do iterador de os.scandir() que adiciona latência à listagem"""
+
+    def __init__(self, it, latencia):
+        time.sleep(latencia)
+        self._it = it
+        self._latencia = latencia
+
+    def __iter__(self):
+        for entry in self._it:
+            yield _EntryComLatencia(entry, self._latencia)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._it.close()
+
+
+def simula_latencia(latencia):
+    """
+    Substitui os.scandir() por uma versão com latência artificial
+
+    Parâmetros
+    ----------
+    :param latencia: latência adicionada por chamada (em segundos) [type: float]
+
+    Retorno
+    -------
+    :return restaura: função que restaura o os.scandir() original [type: callable]
+    """
+
+    scandir_original = os.scandir
+
+    def scandir_com_latencia(*args, **kwargs):
+        return _ScandirComLatencia(scandir_original(*args, **kwargs), latencia)
+
+    os.scandir = scandir_com_latencia
+
+    def restaura():
+        os.scandir = scandir_original
+
+    return restaura
+
+
+"""
+---------------------------------------------------
+------------ 3. EXECUÇÃO DO BENCHMARK --------------
+---------------------------------------------------
+"""
+
+def varredura(root, workers):
+    return sum(1 for _ in varre_diretorio(root, backend='scandir', workers=workers))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de varredura paralela de diretórios')
+    parser.add_argument('--n-dirs', type=int, default=500)
+    parser.add_argument('--n-arquivos', type=int, default=20)
+    parser.add_argument('--latencia-ms', type=float, default=0.0)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32, 64])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        qtd = cria_arvore_sintetica(root, n_dirs=args.n_dirs, n_arquivos=args.n_arquivos)
+        print(f'Árvore sintética criada com {qtd} arquivos em {args.n_dirs} diretórios '
+              f'(latência simulada: {args.latencia_ms} ms)')
+
+        restaura = simula_latencia(args.latencia_ms / 1000) if args.latencia_ms > 0 else None
+        try:
+            print(f'\n{"workers":>8}{"arquivos":>10}{"tempo (s)":>12}{"arq/s":>12}{"speedup":>10}')
+            tempo_base = None
+            for workers in args.workers:
+                qtd_arquivos = varredura(root, workers)
+                tempo = mede_tempo(varredura, repeticoes=args.repeticoes, root=root, workers=workers)
+                tempo_base = tempo_base or tempo
+                print(f'{workers:>8}{qtd_arquivos:>10}{tempo:>12.4f}{qtd_arquivos / tempo:>12.0f}'
+                      f'{tempo_base / tempo:>10.2f}')
+        finally:
+            if restaura is not None:
+                restaura()
+
+
+if __name__ == '__main__':
+    main()
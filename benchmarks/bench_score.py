@@ -0,0 +1,122 @@
+"""
+---------------------------------------------------
+------- Benchmark - Cálculo do score filescope -----
+---------------------------------------------------
+Script responsável por comparar o cálculo original do
+score filescope (cópia das colunas, normalização com
+pandas e merge pelas colunas diretorio e arquivo) com o
+cálculo vetorizado atual de calc_filescope_score(), que
+opera coluna a coluna com numpy e atribui o score por
+posição
+
+Execução
+---------------------------------------------------
+python -m benchmarks.bench_score --linhas 1000000 10000000 50000000
+
+A abordagem original exige as colunas de chave em
+memória e um hash join sobre strings, sendo executada
+apenas até o limite definido por --max-original
+
+Sumário
+---------------------------------------------------
+1. Configuração inicial
+    1.1 Importando bibliotecas
+2. Abordagens comparadas
+3. Execução do benchmark
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import argparse
+import gc
+import time
+
+# Bibliotecas de terceiros
+import numpy as np
+import pandas as pd
+
+# Filescope
+from filescope.manager import calc_filescope_score, SCORE_COLS
+
+
+"""
+---------------------------------------------------
+------------ 2. ABORDAGENS COMPARADAS -------------
+---------------------------------------------------
+"""
+
+# Cálculo original do score (cópia, normalização em pandas e merge)
+def score_original(df, peso_tkb=2, peso_ddc=1, peso_dda=2, peso_ddm=1):
+    key_cols = ['diretorio', 'arquivo']
+    df_score = df.loc[:, key_cols + SCORE_COLS]
+    for col in SCORE_COLS:
+        col_max = df_score[col].max()
+        col_min = df_score[col].min()
+        df_score[col] = (df_score[col] - col_min) / (col_max - col_min)
+    tkb = peso_tkb * df_score['tamanho_kb']
+    ddc = peso_ddc * df_score['dias_desde_criacao']
+    dda = peso_dda * df_score['dias_desde_ult_acesso']
+    ddm = peso_ddm * df_score['dias_desde_ult_modif']
+    df_score['filescope_score'] = (tkb * ddc * dda * ddm) / (peso_tkb * peso_ddc * peso_dda * peso_ddm)
+    score_max = df_score['filescope_score'].max()
+    score_min = df_score['filescope_score'].min()
+    df_score['filescope_score'] = 100 * (df_score['filescope_score'] - score_min) / (score_max - score_min)
+    df_score = df_score.loc[:, key_cols + ['filescope_score']]
+    return df.merge(df_score, how='left', on=key_cols)
+
+
+# Base sintética com as colunas do score
+def base_sintetica(n_linhas, chaves=False, seed=42):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'tamanho_kb': rng.lognormal(3, 2, n_linhas),
+        'dias_desde_criacao': rng.integers(0, 3650, n_linhas),
+        'dias_desde_ult_modif': rng.integers(0, 3650, n_linhas),
+        'dias_desde_ult_acesso': rng.integers(0, 3650, n_linhas)
+    })
+    if chaves:
+        df['diretorio'] = pd.Categorical.from_codes(rng.integers(0, 1000, n_linhas),
+                                                    categories=[f'/mnt/share/dir{i}' for i in range(1000)])
+        df['arquivo'] = [f'arquivo{i}.txt' for i in range(n_linhas)]
+    return df
+
+
+"""
+---------------------------------------------------
+------------ 3. EXECUÇÃO DO BENCHMARK --------------
+---------------------------------------------------
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark do cálculo do score filescope')
+    parser.add_argument('--linhas', type=int, nargs='+', default=[1000000, 10000000, 50000000])
+    parser.add_argument('--max-original', type=int, default=10000000)
+    args = parser.parse_args()
+
+    print(f'{"linhas":>12}{"abordagem":>14}{"tempo (s)":>12}')
+    for n_linhas in args.linhas:
+        cenarios = [('vetorizada', calc_filescope_score)]
+        if n_linhas <= args.max_original:
+            cenarios.insert(0, ('original', score_original))
+
+        for nome, func in cenarios:
+            df = base_sintetica(n_linhas, chaves=(nome == 'original'))
+            gc.collect()
+            inicio = time.perf_counter()
+            func(df)
+            tempo = time.perf_counter() - inicio
+            print(f'{n_linhas:>12}{nome:>14}{tempo:>12.3f}')
+            del df
+            gc.collect()
+
+
+if __name__ == '__main__':
+    main()
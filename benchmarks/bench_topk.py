@@ -0,0 +1,93 @@
+"""
+---------------------------------------------------
+------- Benchmark - Seleção dos top k arquivos -----
+---------------------------------------------------
+Script responsável por comparar a seleção original
+das k primeiras linhas do report (ordenação completa
+seguida de head) com a seleção parcial de top_k(),
+tanto sobre um DataFrame quanto sobre um iterável de
+lotes, como os retornados por iter_scan()
+
+Execução
+---------------------------------------------------
+python -m benchmarks.bench_topk --n-linhas 2000000 --k 100
+
+Sumário
+---------------------------------------------------
+1. Configuração inicial
+    1.1 Importando bibliotecas
+2. Cenários comparados
+3. Execução do benchmark
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import argparse
+
+# Filescope
+from filescope.manager import top_k, np, pd
+from benchmarks.utils import mede_tempo
+
+
+"""
+---------------------------------------------------
+------------- 2. CENÁRIOS COMPARADOS --------------
+---------------------------------------------------
+"""
+
+# Seleção original (ordenação completa)
+def ordenacao_completa(df, k, col):
+    return df.sort_values(by=col, ascending=False).head(k)
+
+# Seleção parcial sobre o DataFrame
+def selecao_parcial(df, k, col):
+    return top_k(df, k, col=col)
+
+# Seleção parcial sobre lotes da base
+def selecao_em_lotes(df, k, col, batch_size=100000):
+    return top_k((df.iloc[i:i + batch_size] for i in range(0, len(df), batch_size)), k, col=col)
+
+
+"""
+---------------------------------------------------
+------------ 3. EXECUÇÃO DO BENCHMARK --------------
+---------------------------------------------------
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de seleção dos top k arquivos')
+    parser.add_argument('--n-linhas', type=int, default=2000000)
+    parser.add_argument('--k', type=int, default=100)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({
+        'arquivo': [f'arquivo{i}.txt' for i in range(args.n_linhas)],
+        'tamanho_kb': rng.lognormal(mean=4, sigma=2, size=args.n_linhas),
+        'filescope_score': rng.uniform(0, 100, size=args.n_linhas),
+    })
+    print(f'Base com {len(df)} linhas, k={args.k}')
+
+    cenarios = [
+        ('sort_values + head', ordenacao_completa),
+        ('top_k (DataFrame)', selecao_parcial),
+        ('top_k (lotes de 100000)', selecao_em_lotes),
+    ]
+
+    print(f'\n{"cenário":<32}{"tempo (s)":>12}')
+    for nome, func in cenarios:
+        tempo = mede_tempo(func, repeticoes=args.repeticoes, df=df, k=args.k, col='filescope_score')
+        print(f'{nome:<32}{tempo:>12.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+---------------------------------------------------
+--- Benchmark - Validação de arquivos na origem ---
+---------------------------------------------------
+Script responsável por comparar a validação original
+de presença de arquivos (os.listdir + busca linear na
+lista) com a validação por stat de
+valida_arquivo_origem() e com a validação em lote de
+valida_arquivos_origem() (listagem cacheada em
+conjunto), em um diretório com muitas entradas
+
+Execução
+---------------------------------------------------
+python -m benchmarks.bench_validacao --n-entradas 100000 --n-consultas 100
+
+Sumário
+---------------------------------------------------
+1. Configuração inicial
+    1.1 Importando bibliotecas
+2. Cenários comparados
+3. Execução do benchmark
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import argparse
+import logging
+import os
+import tempfile
+
+# Filescope
+from filescope.manager import valida_arquivo_origem, valida_arquivos_origem, limpa_cache_listagens, logger
+from benchmarks.utils import mede_tempo
+
+
+"""
+---------------------------------------------------
+------------- 2. CENÁRIOS COMPARADOS --------------
+---------------------------------------------------
+"""
+
+# Validação original (listagem completa e busca linear a cada consulta)
+def validacao_original(diretorio, nomes):
+    return [nome in os.listdir(diretorio) for nome in nomes]
+
+# Validação por stat (uma chamada por consulta)
+def validacao_stat(diretorio, nomes):
+    return [valida_arquivo_origem(diretorio, nome) for nome in nomes]
+
+# Validação em lote sem cache (uma listagem por lote)
+def validacao_lote(diretorio, nomes):
+    limpa_cache_listagens()
+    return valida_arquivos_origem(diretorio, nomes)
+
+# Validação em lote com listagem em cache (monitoramento periódico)
+def validacao_lote_cache(diretorio, nomes):
+    return valida_arquivos_origem(diretorio, nomes)
+
+
+"""
+---------------------------------------------------
+------------ 3. EXECUÇÃO DO BENCHMARK --------------
+---------------------------------------------------
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de validação de arquivos na origem')
+    parser.add_argument('--n-entradas', type=int, default=100000)
+    parser.add_argument('--n-consultas', type=int, default=100)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    # Silenciando logs por arquivo durante as medições
+    logger.setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        for i in range(args.n_entradas):
+            open(os.path.join(diretorio, f'arquivo{i}.txt'), 'wb').close()
+        passo = max(1, args.n_entradas // args.n_consultas)
+        nomes = [f'arquivo{i}.txt' for i in range(0, args.n_entradas, passo)][:args.n_consultas]
+        print(f'Diretório com {args.n_entradas} entradas, {len(nomes)} consultas por execução')
+
+        cenarios = [
+            ('original (listdir + in)', validacao_original),
+            ('valida_arquivo_origem (stat)', validacao_stat),
+            ('valida_arquivos_origem', validacao_lote),
+            ('valida_arquivos_origem (cache)', validacao_lote_cache),
+        ]
+
+        print(f'\n{"cenário":<34}{"tempo (s)":>12}{"consultas/s":>14}')
+        for nome, func in cenarios:
+            tempo = mede_tempo(func, repeticoes=args.repeticoes, diretorio=diretorio, nomes=nomes)
+            print(f'{nome:<34}{tempo:>12.4f}{len(nomes) / tempo:>14.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+---------------------------------------------------
+------- Benchmark - Report visual de diretórios ----
+---------------------------------------------------
+Script responsável por comparar a renderização das
+visões de generate_visual_report() no processo atual
+(processos=1) e em processos paralelos, além de
+acompanhar a memória residente (RSS) do processo ao
+longo de execuções repetidas, evidenciando que as
+figuras são liberadas após o salvamento. Bases acima
+de --max-pontos linhas utilizam a renderização
+agregada/amostrada das visões de diretório e usuários
+
+Execução
+---------------------------------------------------
+python -m benchmarks.bench_visual --n-linhas 1000000 --dpi 100 --max-pontos 50000
+
+Sumário
+---------------------------------------------------
+1. Configuração inicial
+    1.1 Importando bibliotecas
+2. Base sintética
+3. Execução do benchmark
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import argparse
+import logging
+import os
+import tempfile
+
+# Filescope
+from filescope.manager import generate_visual_report, logger, np, pd, MAX_PONTOS_PLOT
+from benchmarks.utils import mede_tempo
+
+
+"""
+---------------------------------------------------
+--------------- 2. BASE SINTÉTICA -----------------
+---------------------------------------------------
+"""
+
+def cria_report_sintetico(n_linhas, n_usuarios=8, semente=42):
+    rng = np.random.default_rng(semente)
+    return pd.DataFrame({
+        'arquivo': [f'arquivo{i}.txt' for i in range(n_linhas)],
+        'usuario_owner': rng.choice([f'usuario{i}' for i in range(n_usuarios)], size=n_linhas),
+        'tamanho_kb': rng.lognormal(mean=4, sigma=2, size=n_linhas),
+        'dias_desde_criacao': rng.integers(0, 2000, size=n_linhas),
+        'dias_desde_ult_acesso': rng.integers(0, 1000, size=n_linhas),
+        'filescope_score': rng.uniform(0, 100, size=n_linhas),
+    })
+
+# Memória residente atual do processo (em MB)
+def rss_atual_mb():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024**2
+
+
+"""
+---------------------------------------------------
+------------ 3. EXECUÇÃO DO BENCHMARK --------------
+---------------------------------------------------
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark do report visual')
+    parser.add_argument('--n-linhas', type=int, default=5000)
+    parser.add_argument('--dpi', type=int, default=100)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--max-pontos', type=int, default=MAX_PONTOS_PLOT)
+    args = parser.parse_args()
+
+    # Silenciando logs por imagem durante as medições
+    logger.setLevel(logging.ERROR)
+
+    df = cria_report_sintetico(args.n_linhas)
+    print(f'Report sintético com {len(df)} linhas, dpi={args.dpi} ({os.cpu_count()} CPUs)')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f'\n{"cenário":<32}{"tempo (s)":>12}{"RSS (MB)":>12}')
+        for nome, processos in [('processo atual', 1), ('processos paralelos', None)]:
+            tempo = mede_tempo(generate_visual_report, repeticoes=args.repeticoes, df=df, output_path=tmp,
+                               dpi=args.dpi, processos=processos, max_pontos=args.max_pontos)
+            print(f'{nome:<32}{tempo:>12.3f}{rss_atual_mb():>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+---------------------------------------------------
+------------ Benchmarks - Funções úteis -----------
+---------------------------------------------------
+Script responsável por alocar funções auxiliares
+compartilhadas entre os benchmarks do pacote, como a
+criação de árvores sintéticas de diretórios e a
+medição de tempo de execução
+
+Sumário
+---------------------------------------------------
+1. Configuração inicial
+    1.1 Importando bibliotecas
+2. Funções auxiliares
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import os
+import time
+
+
+"""
+---------------------------------------------------
+------------- 2. FUNÇÕES AUXILIARES ---------------
+---------------------------------------------------
+"""
+
+# Criando árvore sintética de diretórios
+def cria_arvore_sintetica(base, n_dirs=100, n_arquivos=50, profundidade=3, tamanho=128):
+    """
+    Cria uma árvore de diretórios sintética para execução dos benchmarks
+
+    Parâmetros
+    ----------
+    :param base: diretório raíz da árvore a ser criada [type: string]
+    :param n_dirs: quantidade total de diretórios criados [type: int, default=100]
+    :param n_arquivos: quantidade de arquivos por diretório [type: int, default=50]
+    :param profundidade: profundidade máxima da árvore [type: int, default=3]
+    :param tamanho: tamanho (em bytes) de cada arquivo criado [type: int, default=128]
+
+    Retorno
+    -------
+    :return qtd_arquivos: quantidade total de arquivos criados [type: int]
+    """
+
+    conteudo = b'x' * tamanho
+    qtd_arquivos = 0
+    for i in range(n_dirs):
+        # Distribuindo diretórios em níveis para simular subpastas
+        partes = [f'nivel{nivel}_{(i // (nivel + 1)) % 10}' for nivel in range(i % profundidade)]
+        diretorio = os.path.join(base, *partes, f'dir{i}')
+        os.makedirs(diretorio, exist_ok=True)
+        for j in range(n_arquivos):
+            with open(os.path.join(diretorio, f'arquivo{j}.txt'), 'wb') as f:
+                f.write(conteudo)
+            qtd_arquivos += 1
+
+    return qtd_arquivos
+
+# Medindo tempo de execução
+def mede_tempo(func, repeticoes=3, **kwargs):
+    """
+    Executa uma função repetidas vezes e retorna o menor tempo observado
+
+    Parâmetros
+    ----------
+    :param func: função a ser medida [type: callable]
+    :param repeticoes: quantidade de execuções [type: int, default=3]
+    :param **kwargs: argumentos repassados para a função
+
+    Retorno
+    -------
+    :return tempo: menor tempo de execução observado (em segundos) [type: float]
+    """
+
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func(**kwargs)
+        tempos.append(time.perf_counter() - inicio)
+
+    return min(tempos)
@@ -0,0 +1,337 @@
+"""
+---------------------------------------------------
+---------- TÓPICO: Interface Assíncrona -----------
+---------------------------------------------------
+Script python responsável por alocar versões
+assíncronas (asyncio) das principais funções do
+módulo filescope.manager, permitindo que múltiplas
+varreduras, validações e cópias compartilhem um
+mesmo event loop.
+
+As chamadas ao sistema de arquivos são executadas
+em um pool de threads gerenciado, com limites de
+concorrência por tipo de operação. Varreduras e
+cópias verificadas podem ser canceladas durante a
+execução e informam o seu progresso através de
+funções de callback, executadas no próprio event
+loop.
+
+Sumário
+---------------------------------------------------
+1. Configuração Inicial
+    1.1 Importando bibliotecas
+2. Executor Gerenciado
+3. Funções Assíncronas
+    3.1 Validação de arquivos
+    3.2 Controle de diretórios
+    3.3 Cópia de arquivos
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Importando bibliotecas
+import asyncio
+import os
+import threading
+import weakref
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+
+# Filescope
+from filescope.rollup import RollupDiretorios
+from filescope.manager import valida_arquivo_origem, valida_dt_mod_arquivo, copia_arquivo, \
+    copia_arquivo_verificado, ResultadoCopia, CopiaCancelada, iter_scan, valida_backend, valida_col_tamanho, monta_report, \
+    salva_report, logger
+
+
+"""
+---------------------------------------------------
+------------ 2. EXECUTOR GERENCIADO ---------------
+---------------------------------------------------
+"""
+
+# Limites padrão de operações simultâneas por categoria
+LIMITES_PADRAO = {'varredura': 2, 'copia': 8, 'validacao': 32}
+
+
+class ExecutorFilescope:
+    """
+    Classe responsável por executar as chamadas bloqueantes do filescope em um pool de
+    threads, limitando a quantidade de operações simultâneas de cada categoria (varredura,
+    cópia e validação) e mantendo contadores de operações em execução e concluídas
+
+    Parâmetros
+    ----------
+    :param max_workers: quantidade de threads do pool [type: int, default=16]
+    :param limites: limites de operações simultâneas por categoria [type: dict, default=LIMITES_PADRAO]
+
+    Aplicação
+    ---------
+    async with ExecutorFilescope(max_workers=16, limites={'copia': 4}) as executor:
+        resultados = await asyncio.gather(*[copia_arquivo_async(o, d, executor=executor) for o, d in pares])
+    """
+
+    def __init__(self, max_workers=16, limites=None):
+        self.max_workers = max_workers
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='filescope')
+        self.limites = dict(LIMITES_PADRAO, **(limites or {}))
+        self.semaforos = weakref.WeakKeyDictionary()
+        self.em_execucao = Counter()
+        self.concluidas = Counter()
+
+    def _semaforo(self, categoria):
+        # Semáforos criados sob demanda para cada event loop em execução (o executor pode ser
+        # compartilhado entre event loops sucessivos, ex: chamadas repetidas de asyncio.run())
+        semaforos = self.semaforos.setdefault(asyncio.get_running_loop(), {})
+        if categoria not in semaforos:
+            semaforos[categoria] = asyncio.Semaphore(self.limites.get(categoria, self.max_workers))
+        return semaforos[categoria]
+
+    @asynccontextmanager
+    async def vaga(self, categoria):
+        """
+        Reserva uma vaga da categoria durante o bloco, respeitando o limite de operações simultâneas
+        e contabilizando o bloco como uma operação nos contadores de status
+
+        Aplicação
+        ---------
+        async with executor.vaga('varredura'):
+            resultado = await executor.executa_no_pool(func, *args)
+        """
+        async with self._semaforo(categoria):
+            self.em_execucao[categoria] += 1
+            try:
+                yield
+            finally:
+                self.em_execucao[categoria] -= 1
+                self.concluidas[categoria] += 1
+
+    async def executa(self, categoria, func, *args, **kwargs):
+        """Executa uma função bloqueante no pool, respeitando o limite da categoria"""
+        async with self.vaga(categoria):
+            return await self.executa_no_pool(func, *args, **kwargs)
+
+    async def executa_no_pool(self, func, *args, **kwargs):
+        """Executa uma função bloqueante no pool, sem reservar vaga (utilizada dentro de um bloco vaga())"""
+        return await asyncio.get_running_loop().run_in_executor(self.pool, partial(func, *args, **kwargs))
+
+    def status(self):
+        """Retorna as quantidades de operações em execução e concluídas por categoria"""
+        return {'em_execucao': dict(self.em_execucao), 'concluidas': dict(self.concluidas)}
+
+    def close(self):
+        self.pool.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+
+# Executor compartilhado entre as chamadas sem executor explícito
+_executor_padrao = None
+
+def executor_padrao():
+    """Retorna o executor compartilhado do processo, criado na primeira utilização"""
+    global _executor_padrao
+    if _executor_padrao is None:
+        _executor_padrao = ExecutorFilescope()
+    return _executor_padrao
+
+
+"""
+---------------------------------------------------
+------------ 3. FUNÇÕES ASSÍNCRONAS ---------------
+            3.1 Validação de arquivos
+---------------------------------------------------
+"""
+
+async def valida_arquivo_origem_async(dir_origem, nome_arquivo, executor=None):
+    """
+    Versão assíncrona de valida_arquivo_origem()
+
+    Parâmetros
+    ----------
+    :param dir_origem: caminho do diretório origem alvo da validação [type: string]
+    :param nome_arquivo: nome do arquivo (com extensão) a ser validado [type: string]
+    :param executor: executor das chamadas bloqueantes [type: ExecutorFilescope, default=None (compartilhado)]
+
+    Retorno
+    -------
+    :return flag: flag indicativo da presença do arquivo no diretório origem [type: bool]
+    """
+
+    executor = executor or executor_padrao()
+    return await executor.executa('validacao', valida_arquivo_origem, dir_origem, nome_arquivo)
+
+async def valida_dt_mod_arquivo_async(dir_origem, nome_arquivo, janela, dt_valida, executor=None):
+    """
+    Versão assíncrona de valida_dt_mod_arquivo()
+
+    Parâmetros
+    ----------
+    :param dir_origem: caminho do diretório origem alvo da validação [type: string]
+    :param nome_arquivo: nome do arquivo (com extensão) a ser validado [type: string]
+    :param janela: referência sobre janela de validação ('ano', 'anomes' ou 'anomesdia') [type: string]
+    :param dt_valida: valor relacionado a janela de validação [type: int]
+    :param executor: executor das chamadas bloqueantes [type: ExecutorFilescope, default=None (compartilhado)]
+
+    Retorno
+    -------
+    :return flag: flag indicativo da presença e a atualização do arquivo na origem [type: bool]
+    """
+
+    executor = executor or executor_padrao()
+    return await executor.executa('validacao', valida_dt_mod_arquivo, dir_origem, nome_arquivo, janela, dt_valida)
+
+
+"""
+---------------------------------------------------
+------------ 3. FUNÇÕES ASSÍNCRONAS ---------------
+            3.2 Controle de diretórios
+---------------------------------------------------
+"""
+
+async def controle_de_diretorio_async(root, sort_col='filescope_score', ascending=False, backend='scandir',
+                                      workers=1, grupo_owner=False, tz=None, indice=None, verifica_arquivos=False,
+                                      batch_size=100000, top_n=None, rollup=False, profundidade=None,
+                                      col_tamanho='tamanho_kb', executor=None, progresso=None, **kwargs):
+    """
+    Versão assíncrona de controle_de_diretorio(). A varredura é consumida lote a lote em
+    uma thread dedicada, permitindo o cancelamento da tarefa entre lotes e o acompanhamento
+    do progresso a partir da quantidade de arquivos varridos. A quantidade de varreduras
+    simultâneas é limitada pela categoria 'varredura' do executor
+
+    Parâmetros
+    ----------
+    Os mesmos parâmetros de controle_de_diretorio(), além de:
+    :param executor: executor das chamadas bloqueantes [type: ExecutorFilescope, default=None (compartilhado)]
+    :param progresso: função chamada a cada lote no formato progresso(qtd_arquivos) [type: callable, default=None]
+
+    Retorno
+    -------
+    :returns root_manager: report de controle do diretório [type: pd.DataFrame]
+    :returns df_rollup: report consolidado por diretórios, apenas com rollup=True [type: pd.DataFrame]
+
+    Aplicação
+    ---------
+    tarefa = asyncio.create_task(controle_de_diretorio_async('/mnt/share', progresso=print))
+    ...
+    tarefa.cancel()
+    """
+
+    # Validando backend de varredura e coluna de tamanho
+    if not valida_backend(backend, workers) or not valida_col_tamanho(col_tamanho):
+        return
+
+    executor = executor or executor_padrao()
+    rollup_dirs = RollupDiretorios(root) if rollup else None
+    lotes = iter_scan(root, batch_size=batch_size, backend=backend, workers=workers, grupo_owner=grupo_owner, tz=tz,
+                      indice=indice, verifica_arquivos=verifica_arquivos, rollup=rollup_dirs)
+    async with executor.vaga('varredura'):
+        # Consumindo lotes em uma thread dedicada (o gerador e o índice SQLite permanecem em uma única thread)
+        thread_varredura = ThreadPoolExecutor(max_workers=1, thread_name_prefix='filescope-varredura')
+        lista_lotes, qtd_arquivos = [], 0
+        try:
+            while True:
+                df_lote = await asyncio.wrap_future(thread_varredura.submit(next, lotes, None))
+                if df_lote is None:
+                    break
+                lista_lotes.append(df_lote)
+                qtd_arquivos += len(df_lote)
+                if progresso is not None:
+                    progresso(qtd_arquivos)
+        except asyncio.CancelledError:
+            # Encerrando a varredura após a conclusão do lote em andamento
+            logger.warning(f'Varredura do diretório {root} cancelada após {qtd_arquivos} arquivos')
+            thread_varredura.submit(lotes.close)
+            raise
+        finally:
+            thread_varredura.shutdown(wait=False)
+
+        root_manager = await executor.executa_no_pool(monta_report, lista_lotes, sort_col=sort_col, ascending=ascending,
+                                                      grupo_owner=grupo_owner, top_n=top_n, col_tamanho=col_tamanho)
+        del lista_lotes
+        df_rollup = await executor.executa_no_pool(rollup_dirs.para_dataframe, profundidade=profundidade) \
+            if rollup else None
+
+    # Validando salvamento dos resultados
+    if 'save' in kwargs and bool(kwargs['save']):
+        await executor.executa('copia', salva_report, root_manager, root, indice=indice, df_rollup=df_rollup, **kwargs)
+
+    if rollup:
+        return root_manager, df_rollup
+    return root_manager
+
+
+"""
+---------------------------------------------------
+------------ 3. FUNÇÕES ASSÍNCRONAS ---------------
+              3.3 Cópia de arquivos
+---------------------------------------------------
+"""
+
+async def copia_arquivo_async(origem, destino, valida_presenca=False, verificada=False, executor=None,
+                              progresso=None, **kwargs):
+    """
+    Versão assíncrona de copia_arquivo() e copia_arquivo_verificado(). Cópias verificadas
+    (verificada=True) informam o progresso a cada bloco copiado e podem ser canceladas
+    durante a execução, mantendo o arquivo parcial para retomada posterior. Cópias simples
+    não podem ser interrompidas: o cancelamento da tarefa é imediato, mas a cópia em
+    andamento no pool de threads prossegue até o fim
+
+    Parâmetros
+    ----------
+    :param origem: definição do arquivo origem (caminho + nome do arquivo) [type: string]
+    :param destino: definição do destino da cópia (caminho + nome do arquivo) [type: string]
+    :param valida_presenca: flag para validar existência do arquivo na origem [type: bool, default=False]
+    :param verificada: flag para cópia retomável com checksum (ver copia_arquivo_verificado()) [type: bool, default=False]
+    :param executor: executor das chamadas bloqueantes [type: ExecutorFilescope, default=None (compartilhado)]
+    :param progresso: função chamada no formato progresso(qtd_copiada, qtd_total), apenas para cópias
+            verificadas [type: callable, default=None]
+    :param **kwargs: demais parâmetros de copia_arquivo_verificado()
+
+    Retorno
+    -------
+    :return resultado: None para cópias simples ou o resultado de copia_arquivo_verificado(), com sucesso=False
+        caso o arquivo não esteja presente na origem (valida_presenca=True) [type: ResultadoCopia]
+    """
+
+    executor = executor or executor_padrao()
+    if not verificada:
+        return await executor.executa('copia', copia_arquivo, origem, destino, valida_presenca=valida_presenca)
+
+    # Validando presença do arquivo na origem
+    if valida_presenca:
+        dir_origem, nome_arquivo = os.path.split(origem)
+        if not await executor.executa('validacao', valida_arquivo_origem, dir_origem, nome_arquivo):
+            logger.error(f'Arquivo {nome_arquivo} inexistente na origem {dir_origem}')
+            return ResultadoCopia(origem, destino, False, 0, 0.0, None,
+                                  FileNotFoundError(f'Arquivo {origem} inexistente na origem'))
+
+    # Repassando progresso ao event loop e interrompendo a cópia em caso de cancelamento
+    loop = asyncio.get_running_loop()
+    cancelada = threading.Event()
+
+    def progresso_copia(qtd_copiada, qtd_total):
+        if cancelada.is_set():
+            raise CopiaCancelada(f'Cópia de {origem} cancelada')
+        if progresso is not None:
+            loop.call_soon_threadsafe(progresso, qtd_copiada, qtd_total)
+
+    try:
+        return await executor.executa('copia', copia_arquivo_verificado, origem, destino, progresso=progresso_copia,
+                                      **kwargs)
+    except asyncio.CancelledError:
+        cancelada.set()
+        raise
@@ -0,0 +1,418 @@
+"""
+---------------------------------------------------
+-------------- TÓPICO: Cópia de Arquivos ----------
+---------------------------------------------------
+Script python responsável por alocar o motor de
+cópia de arquivos em lote. O conteúdo dos arquivos é
+copiado pelo próprio kernel (os.copy_file_range ou
+os.sendfile) sempre que disponível, evitando a
+passagem dos dados pelo espaço de usuário, e as
+cópias de um lote são distribuídas em um pool de
+threads.
+
+Sumário
+---------------------------------------------------
+1. Configuração Inicial
+    1.1 Importando bibliotecas
+2. Cópia de Arquivos
+    2.1 Cópia de conteúdo
+    2.2 Cópia verificada de arquivos grandes
+    2.3 Cópia em lote
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Importando bibliotecas
+import errno
+import hashlib
+import json
+import os
+import shutil
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Algoritmos xxhash opcionais para cálculo de checksums
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+"""
+---------------------------------------------------
+-------------- 2. CÓPIA DE ARQUIVOS ---------------
+             2.1 Cópia de conteúdo
+---------------------------------------------------
+"""
+
+# Erros indicativos de cópia pelo kernel indisponível para o par de arquivos
+ERROS_SEM_SUPORTE = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF,
+                     errno.EPERM}
+
+# Tamanho máximo de cada chamada de cópia pelo kernel
+TAMANHO_BLOCO_KERNEL = 2**30
+
+# Cópia de um descritor para outro através de uma chamada de sistema do kernel
+def _copia_kernel(chamada, fd_origem, fd_destino, tamanho):
+    copiado = 0
+    while copiado < tamanho:
+        try:
+            if chamada == 'copy_file_range':
+                n = os.copy_file_range(fd_origem, fd_destino, min(tamanho - copiado, TAMANHO_BLOCO_KERNEL))
+            else:
+                n = os.sendfile(fd_destino, fd_origem, copiado, min(tamanho - copiado, TAMANHO_BLOCO_KERNEL))
+        except OSError as e:
+            # Sem suporte para o par de arquivos: nenhuma alteração no destino, cópia delegada ao próximo método
+            if copiado == 0 and e.errno in ERROS_SEM_SUPORTE:
+                return False
+            raise
+        if n == 0:
+            break
+        copiado += n
+
+    return copiado > 0
+
+# Validando que origem e destino não são o mesmo arquivo (a abertura do destino truncaria a origem)
+def _valida_arquivos_distintos(origem, destino):
+    try:
+        mesmo_arquivo = os.path.samefile(origem, destino)
+    except OSError:
+        return
+    if mesmo_arquivo:
+        raise shutil.SameFileError(f'{origem} e {destino} são o mesmo arquivo')
+
+# Cópia do conteúdo de um arquivo
+def copia_conteudo(origem, destino, tamanho_bloco=1024**2):
+    """
+    Função responsável por copiar o conteúdo de um arquivo origem para um arquivo destino,
+    utilizando, nesta ordem, os.copy_file_range() (permite cópias no servidor em sistemas de
+    arquivos de rede e reflinks), os.sendfile() e a cópia em blocos no espaço de usuário.
+    Os metadados do arquivo (permissões e datas) não são copiados, assim como em
+    shutil.copyfile(), e uma origem e um destino que correspondem ao mesmo arquivo resultam
+    em shutil.SameFileError
+
+    Parâmetros
+    ----------
+    :param origem: caminho do arquivo origem [type: string]
+    :param destino: caminho do arquivo destino [type: string]
+    :param tamanho_bloco: tamanho dos blocos da cópia no espaço de usuário [type: int, default=1MB]
+
+    Retorno
+    -------
+    :return qtd_bytes: quantidade de bytes copiados [type: int]
+    :return metodo: método de cópia utilizado [type: string]
+    """
+
+    _valida_arquivos_distintos(origem, destino)
+    with open(origem, 'rb') as f_origem, open(destino, 'wb') as f_destino:
+        tamanho = os.fstat(f_origem.fileno()).st_size
+
+        # Arquivos vazios ou com tamanho não informado pelo sistema (ex: procfs) são lidos até o fim no espaço de usuário
+        for chamada in ('copy_file_range', 'sendfile') if tamanho > 0 else ():
+            if hasattr(os, chamada) and _copia_kernel(chamada, f_origem.fileno(), f_destino.fileno(), tamanho):
+                return os.fstat(f_destino.fileno()).st_size, chamada
+        shutil.copyfileobj(f_origem, f_destino, tamanho_bloco)
+        return f_destino.tell(), 'usuario'
+
+
+"""
+---------------------------------------------------
+-------------- 2. CÓPIA DE ARQUIVOS ---------------
+     2.2 Cópia verificada de arquivos grandes
+---------------------------------------------------
+"""
+
+# Exceção utilizada para interromper uma cópia verificada a partir da função de progresso (ex: cancelamento
+# de tarefas asyncio), mantendo o arquivo parcial para retomada posterior
+class CopiaCancelada(Exception):
+    pass
+
+# Resultado da cópia de um arquivo
+ResultadoCopia = namedtuple('ResultadoCopia', ['origem', 'destino', 'sucesso', 'qtd_bytes', 'segundos', 'metodo',
+                                               'erro', 'checksum'], defaults=[None])
+
+# Instanciando algoritmo de checksum (hashlib ou xxhash)
+def cria_hash(algoritmo='blake2b'):
+    """
+    Função responsável por instanciar um objeto de cálculo incremental de checksum a partir
+    do nome do algoritmo. Algoritmos iniciados por 'xxh' (ex: 'xxh3_64', 'xxh64') exigem o
+    pacote xxhash; os demais são obtidos através de hashlib.new()
+
+    Parâmetros
+    ----------
+    :param algoritmo: nome do algoritmo de checksum [type: string, default='blake2b']
+
+    Retorno
+    -------
+    :return hash: objeto com os métodos update() e hexdigest() [type: object]
+    """
+
+    if algoritmo.startswith('xxh'):
+        if xxhash is None:
+            raise ValueError(f'Algoritmo {algoritmo} exige a instalação do pacote xxhash')
+        return getattr(xxhash, algoritmo)()
+    return hashlib.new(algoritmo)
+
+# Caminhos auxiliares da cópia verificada (arquivo parcial e metadados do checksum). Sem um diretório de estado, os
+# metadados da cópia parcial ficam ao lado do arquivo parcial e nenhum registro é mantido após a cópia
+def _caminhos_auxiliares(destino, dir_estado=None):
+    diretorio, nome = os.path.split(destino)
+    parcial = os.path.join(diretorio, f'.{nome}.parcial')
+    if dir_estado is None:
+        return parcial, f'{parcial}.filescope', None
+    chave = hashlib.blake2b(os.path.abspath(destino).encode(), digest_size=16).hexdigest()
+    return parcial, os.path.join(dir_estado, f'{chave}.parcial.json'), os.path.join(dir_estado, f'{chave}.json')
+
+def _le_metadados(caminho):
+    try:
+        with open(caminho, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _grava_metadados(caminho, metadados):
+    with open(caminho, 'w') as f:
+        json.dump(metadados, f)
+
+# Checksum de um arquivo completo
+def checksum_arquivo(caminho, algoritmo='blake2b', tamanho_bloco=8 * 1024**2):
+    """
+    Função responsável por calcular o checksum de um arquivo, lido em blocos
+
+    Parâmetros
+    ----------
+    :param caminho: caminho do arquivo [type: string]
+    :param algoritmo: nome do algoritmo de checksum [type: string, default='blake2b']
+    :param tamanho_bloco: tamanho dos blocos de leitura [type: int, default=8MB]
+
+    Retorno
+    -------
+    :return checksum: checksum do arquivo em formato hexadecimal [type: string]
+    """
+
+    h = cria_hash(algoritmo)
+    buffer = memoryview(bytearray(tamanho_bloco))
+    with open(caminho, 'rb') as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            h.update(buffer[:n])
+    return h.hexdigest()
+
+# Cópia retomável com cálculo de checksum
+def copia_verificada(origem, destino, algoritmo='blake2b', retoma=True, verifica_hash=False, verifica_destino=False,
+                     tamanho_bloco=8 * 1024**2, progresso=None, dir_estado=None):
+    """
+    Função responsável pela cópia de arquivos grandes em blocos, calculando o checksum do
+    conteúdo durante a própria cópia. A cópia é feita em um arquivo parcial oculto no
+    diretório destino, renomeado para o destino final apenas ao término. O destino recebe
+    a data de modificação da origem.
+
+    Em execuções repetidas (ex: rotinas de sincronização), a cópia é ignorada quando o
+    destino possui o mesmo tamanho e data de modificação da origem, exigindo apenas chamadas
+    stat. Com verifica_hash=True, o checksum da origem é recalculado e comparado ao do
+    destino antes de ignorar a cópia. Informando dir_estado, o checksum e os metadados da
+    origem são registrados nesse diretório (nenhum arquivo auxiliar é mantido ao lado do
+    destino) e a comparação com verifica_hash utiliza o checksum registrado, sem reler o
+    destino.
+
+    Uma cópia interrompida é retomada a partir do tamanho do arquivo parcial, desde que a
+    origem não tenha sido alterada (tamanho e data de modificação) desde o seu início.
+
+    Parâmetros
+    ----------
+    :param origem: caminho do arquivo origem [type: string]
+    :param destino: caminho do arquivo destino [type: string]
+    :param algoritmo: algoritmo de checksum (hashlib ou xxhash) [type: string, default='blake2b']
+    :param retoma: flag para retomar cópias interrompidas [type: bool, default=True]
+    :param verifica_hash: flag para comparar os checksums de origem e destino antes de ignorar uma cópia [type: bool, default=False]
+    :param verifica_destino: flag para reler o destino após a cópia e comparar os checksums [type: bool, default=False]
+    :param tamanho_bloco: tamanho dos blocos da cópia [type: int, default=8MB]
+    :param progresso: função chamada a cada bloco no formato progresso(qtd_copiada, qtd_total) [type: callable, default=None]
+    :param dir_estado: diretório de registro dos checksums das cópias [type: string, default=None]
+
+    Retorno
+    -------
+    :return resultado: resultado da cópia, com metodo 'ignorado', 'retomado' ou 'completo' e qtd_bytes com os
+        bytes gravados nesta chamada (sem o trecho já copiado de uma cópia retomada). Cópias ignoradas sem
+        checksum registrado ou calculado retornam checksum=None [type: ResultadoCopia]
+    """
+
+    inicio = time.perf_counter()
+    _valida_arquivos_distintos(origem, destino)
+    if dir_estado is not None:
+        os.makedirs(dir_estado, exist_ok=True)
+    parcial, meta_parcial, meta_destino = _caminhos_auxiliares(destino, dir_estado)
+    st_origem = os.stat(origem)
+    assinatura = {'algoritmo': algoritmo, 'tamanho': st_origem.st_size, 'mtime_ns': st_origem.st_mtime_ns}
+
+    # Ignorando cópia quando o destino já corresponde à origem
+    try:
+        st_destino = os.stat(destino)
+    except FileNotFoundError:
+        st_destino = None
+    if st_destino is not None and \
+            (st_destino.st_size, st_destino.st_mtime_ns) == (st_origem.st_size, st_origem.st_mtime_ns):
+        metadados = _le_metadados(meta_destino) if meta_destino is not None else None
+        if metadados is not None and any(metadados.get(chave) != valor for chave, valor in assinatura.items()):
+            metadados = None
+        checksum = metadados['checksum'] if metadados is not None else None
+        if not verifica_hash:
+            return ResultadoCopia(origem, destino, True, 0, time.perf_counter() - inicio, 'ignorado', None, checksum)
+        checksum_origem = checksum_arquivo(origem, algoritmo, tamanho_bloco)
+        if checksum_origem == (checksum or checksum_arquivo(destino, algoritmo, tamanho_bloco)):
+            return ResultadoCopia(origem, destino, True, 0, time.perf_counter() - inicio, 'ignorado', None,
+                                  checksum_origem)
+
+    # Retomando cópia parcial de uma origem inalterada (o checksum do trecho já copiado é recalculado)
+    h = cria_hash(algoritmo)
+    buffer = memoryview(bytearray(tamanho_bloco))
+    copiado = 0
+    if retoma and os.path.exists(parcial) and _le_metadados(meta_parcial) == assinatura:
+        with open(parcial, 'rb') as f:
+            while copiado < st_origem.st_size:
+                n = f.readinto(buffer[:min(tamanho_bloco, st_origem.st_size - copiado)])
+                if not n:
+                    break
+                h.update(buffer[:n])
+                copiado += n
+    else:
+        _grava_metadados(meta_parcial, assinatura)
+    metodo = 'retomado' if copiado > 0 else 'completo'
+    retomado = copiado
+
+    # Copiando blocos restantes e atualizando o checksum
+    with open(origem, 'rb') as f_origem, open(parcial, 'r+b' if copiado > 0 else 'wb') as f_parcial:
+        f_origem.seek(copiado)
+        f_parcial.seek(copiado)
+        f_parcial.truncate()
+        while True:
+            n = f_origem.readinto(buffer)
+            if not n:
+                break
+            h.update(buffer[:n])
+            f_parcial.write(buffer[:n])
+            copiado += n
+            if progresso is not None:
+                progresso(copiado, st_origem.st_size)
+        f_parcial.flush()
+        os.fsync(f_parcial.fileno())
+    checksum = h.hexdigest()
+
+    # Validando origem e destino após a cópia
+    st_final = os.stat(origem)
+    if (st_final.st_size, st_final.st_mtime_ns) != (st_origem.st_size, st_origem.st_mtime_ns) or \
+            copiado != st_origem.st_size:
+        os.remove(parcial)
+        os.remove(meta_parcial)
+        raise RuntimeError(f'Arquivo {origem} alterado durante a cópia')
+    if verifica_destino and checksum_arquivo(parcial, algoritmo, tamanho_bloco) != checksum:
+        os.remove(parcial)
+        os.remove(meta_parcial)
+        raise RuntimeError(f'Checksum do destino {destino} divergente da origem após a cópia')
+
+    # Publicando destino com a data de modificação da origem e registrando o checksum no diretório de estado
+    os.utime(parcial, ns=(st_origem.st_atime_ns, st_origem.st_mtime_ns))
+    os.replace(parcial, destino)
+    if meta_destino is not None:
+        _grava_metadados(meta_destino, dict(assinatura, checksum=checksum))
+    os.remove(meta_parcial)
+
+    # Apenas os bytes efetivamente gravados nesta chamada (o trecho retomado é apenas relido)
+    return ResultadoCopia(origem, destino, True, copiado - retomado, time.perf_counter() - inicio, metodo, None,
+                          checksum)
+
+
+"""
+---------------------------------------------------
+-------------- 2. CÓPIA DE ARQUIVOS ---------------
+               2.3 Cópia em lote
+---------------------------------------------------
+"""
+
+# Cópia de um arquivo do lote
+def _copia_par(origem, destino, dirs_com_falha, valida_presenca, verificada, dir_estado):
+    inicio = time.perf_counter()
+    try:
+        dir_destino = os.path.dirname(destino)
+        if dir_destino in dirs_com_falha:
+            raise dirs_com_falha[dir_destino]
+        if valida_presenca and not os.path.isfile(origem):
+            raise FileNotFoundError(errno.ENOENT, 'Arquivo inexistente na origem', origem)
+        if verificada:
+            return copia_verificada(origem, destino, dir_estado=dir_estado)
+        qtd_bytes, metodo = copia_conteudo(origem, destino)
+        return ResultadoCopia(origem, destino, True, qtd_bytes, time.perf_counter() - inicio, metodo, None)
+    except Exception as e:
+        return ResultadoCopia(origem, destino, False, 0, time.perf_counter() - inicio, None, e)
+
+# Cópia de múltiplos arquivos
+def copia_lote(pares, workers=8, valida_presenca=False, verificada=False, dir_estado=None):
+    """
+    Função responsável por copiar um lote de arquivos a partir de pares (origem, destino).
+    Os diretórios destino são criados uma única vez antes do início das cópias, que são
+    distribuídas em um pool de threads. Falhas em um arquivo não interrompem as demais
+    cópias e são retornadas no resultado de cada par. Com verificada=True, cada arquivo é
+    copiado através de copia_verificada(), ignorando arquivos já sincronizados
+
+    Parâmetros
+    ----------
+    :param pares: iterável de tuplas (origem, destino) com caminhos completos [type: iterable]
+    :param workers: quantidade de threads de cópia [type: int, default=8]
+    :param valida_presenca: flag para validar existência do arquivo na origem [type: bool, default=False]
+    :param verificada: flag para cópia retomável com checksum [type: bool, default=False]
+    :param dir_estado: diretório de registro dos checksums das cópias verificadas [type: string, default=None]
+
+    Retorno
+    -------
+    :return resultados: resultado de cada par, na ordem de entrada [type: list of ResultadoCopia]
+    :return estatisticas: dicionário com quantidades, volume copiado e vazão do lote [type: dict]
+
+    Aplicação
+    ---------
+    pares = [('/mnt/origem/a.txt', '/mnt/destino/a.txt'), ('/mnt/origem/b.txt', '/mnt/destino/b.txt')]
+    resultados, estatisticas = copia_lote(pares, workers=16)
+    """
+
+    pares = list(pares)
+    inicio = time.perf_counter()
+
+    # Criando diretórios destino uma única vez
+    dirs_com_falha = {}
+    for dir_destino in sorted({os.path.dirname(destino) for _, destino in pares}):
+        try:
+            if dir_destino:
+                os.makedirs(dir_destino, exist_ok=True)
+        except OSError as e:
+            dirs_com_falha[dir_destino] = e
+
+    # Executando cópias no pool de threads
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        resultados = list(pool.map(lambda par: _copia_par(par[0], par[1], dirs_com_falha, valida_presenca,
+                                                             verificada, dir_estado),
+                                   pares))
+
+    # Consolidando estatísticas do lote
+    segundos = time.perf_counter() - inicio
+    qtd_bytes = sum(r.qtd_bytes for r in resultados)
+    qtd_sucesso = sum(r.sucesso for r in resultados)
+    estatisticas = {
+        'qtd_arquivos': len(resultados),
+        'qtd_sucesso': qtd_sucesso,
+        'qtd_falhas': len(resultados) - qtd_sucesso,
+        'qtd_bytes': qtd_bytes,
+        'segundos': segundos,
+        'mb_por_segundo': qtd_bytes / 1024**2 / segundos if segundos > 0 else 0.0,
+        'arquivos_por_segundo': len(resultados) / segundos if segundos > 0 else 0.0
+    }
+
+    return resultados, estatisticas
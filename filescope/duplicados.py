@@ -0,0 +1,320 @@
+"""
+---------------------------------------------------
+---------- TÓPICO: Arquivos Duplicados ------------
+---------------------------------------------------
+Script python responsável por alocar o motor de
+detecção de arquivos duplicados por conteúdo. A
+detecção é feita em etapas, de modo que apenas os
+arquivos que permanecem candidatos são lidos por
+completo:
+
+    1. Agrupamento por tamanho (em bytes), com os
+       hard links de um mesmo arquivo (st_dev,
+       st_ino) tratados como um único arquivo;
+    2. Checksum parcial do primeiro e do último
+       bloco de cada arquivo;
+    3. Checksum completo, em paralelo, apenas dos
+       arquivos com checksum parcial repetido.
+
+Os checksums calculados podem ser armazenados em um
+cache SQLite, indexado por (st_dev, st_ino, tamanho,
+mtime), evitando nova leitura de arquivos inalterados
+em execuções posteriores.
+
+Sumário
+---------------------------------------------------
+1. Configuração Inicial
+    1.1 Importando bibliotecas
+2. Checksums de Arquivos
+    2.1 Cache de checksums
+    2.2 Checksums parcial e completo
+3. Detecção de Duplicados
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Importando bibliotecas
+import mmap
+import os
+import sqlite3
+import stat
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Filescope
+from filescope.copia import cria_hash, checksum_arquivo
+
+
+"""
+---------------------------------------------------
+----------- 2. CHECKSUMS DE ARQUIVOS --------------
+             2.1 Cache de checksums
+---------------------------------------------------
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    algoritmo TEXT NOT NULL,
+    tamanho INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    parcial TEXT,
+    completo TEXT,
+    PRIMARY KEY (dev, ino, algoritmo)
+);
+"""
+
+
+class CacheHashes:
+    """
+    Classe responsável por armazenar os checksums parciais e completos calculados na
+    detecção de duplicados, indexados por (st_dev, st_ino) e válidos enquanto o tamanho
+    e a data de modificação do arquivo permanecerem iguais. Sem caminho, o cache é
+    mantido apenas em memória
+
+    O cache deve ser utilizado apenas pela thread que o criou (conexão SQLite)
+
+    Parâmetros
+    ----------
+    :param caminho: caminho do arquivo SQLite do cache [type: string, default=None (em memória)]
+    :param algoritmo: algoritmo dos checksums armazenados [type: string, default='blake2b']
+
+    Aplicação
+    ---------
+    with CacheHashes('/var/cache/filescope/hashes.db') as cache:
+        grupos, falhas = encontra_duplicados(caminhos, cache=cache)
+    """
+
+    def __init__(self, caminho=None, algoritmo='blake2b'):
+        self.algoritmo = algoritmo
+        self.caminho = caminho
+        if caminho is not None:
+            diretorio = os.path.dirname(os.path.abspath(caminho))
+            os.makedirs(diretorio, exist_ok=True)
+        self.con = sqlite3.connect(caminho if caminho is not None else ':memory:')
+        self.con.execute('PRAGMA synchronous=NORMAL')
+        self.con.executescript(SCHEMA)
+
+    def busca(self, st):
+        """Retorna os checksums (parcial, completo) registrados para o arquivo ou (None, None)"""
+        linha = self.con.execute('SELECT tamanho, mtime_ns, parcial, completo FROM hashes '
+                                 'WHERE dev = ? AND ino = ? AND algoritmo = ?',
+                                 (st.st_dev, st.st_ino, self.algoritmo)).fetchone()
+        if linha is None or linha[0] != st.st_size or linha[1] != st.st_mtime_ns:
+            return None, None
+        return linha[2], linha[3]
+
+    def grava(self, registros):
+        """Registra checksums a partir de tuplas (stat, parcial, completo)"""
+        self.con.executemany('INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?, ?)',
+                             [(st.st_dev, st.st_ino, self.algoritmo, st.st_size, st.st_mtime_ns, parcial, completo)
+                              for st, parcial, completo in registros])
+        self.con.commit()
+
+    def close(self):
+        self.con.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+"""
+---------------------------------------------------
+----------- 2. CHECKSUMS DE ARQUIVOS --------------
+         2.2 Checksums parcial e completo
+---------------------------------------------------
+"""
+
+# Tamanho dos blocos inicial e final do checksum parcial
+TAMANHO_BLOCO_PARCIAL = 64 * 1024
+
+# Checksum do primeiro e do último bloco de um arquivo
+def checksum_parcial(caminho, tamanho, algoritmo='blake2b', tamanho_bloco=TAMANHO_BLOCO_PARCIAL):
+    """
+    Função responsável por calcular o checksum do primeiro e do último bloco de um arquivo.
+    Para arquivos de até dois blocos, todo o conteúdo é lido e o resultado é igual ao
+    checksum completo do arquivo
+
+    Parâmetros
+    ----------
+    :param caminho: caminho do arquivo [type: string]
+    :param tamanho: tamanho do arquivo em bytes [type: int]
+    :param algoritmo: nome do algoritmo de checksum [type: string, default='blake2b']
+    :param tamanho_bloco: tamanho de cada bloco lido [type: int, default=64KB]
+
+    Retorno
+    -------
+    :return checksum: checksum parcial em formato hexadecimal [type: string]
+    """
+
+    h = cria_hash(algoritmo)
+    with open(caminho, 'rb') as f:
+        h.update(f.read(tamanho_bloco))
+        if tamanho > tamanho_bloco:
+            f.seek(max(tamanho - tamanho_bloco, tamanho_bloco))
+            h.update(f.read(tamanho_bloco))
+
+    return h.hexdigest()
+
+# Checksum completo de um arquivo via mmap
+def checksum_completo(caminho, algoritmo='blake2b', usa_mmap=True, tamanho_bloco=8 * 1024**2):
+    """
+    Função responsável por calcular o checksum completo de um arquivo. Com usa_mmap=True, o
+    arquivo é mapeado em memória e processado em fatias, sem cópias para buffers do Python;
+    caso contrário (ou se o mapeamento falhar), o arquivo é lido em blocos grandes
+
+    Parâmetros
+    ----------
+    :param caminho: caminho do arquivo [type: string]
+    :param algoritmo: nome do algoritmo de checksum [type: string, default='blake2b']
+    :param usa_mmap: flag para leitura via mmap [type: bool, default=True]
+    :param tamanho_bloco: tamanho das fatias processadas por chamada [type: int, default=8MB]
+
+    Retorno
+    -------
+    :return checksum: checksum do arquivo em formato hexadecimal [type: string]
+    """
+
+    if usa_mmap:
+        try:
+            with open(caminho, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                if hasattr(m, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    m.madvise(mmap.MADV_SEQUENTIAL)
+                h = cria_hash(algoritmo)
+                with memoryview(m) as dados:
+                    for inicio in range(0, len(dados), tamanho_bloco):
+                        h.update(dados[inicio:inicio + tamanho_bloco])
+                return h.hexdigest()
+        except (ValueError, OSError):
+            # Arquivos vazios ou sem suporte a mapeamento (ex: alguns sistemas de arquivos de rede)
+            pass
+
+    return checksum_arquivo(caminho, algoritmo=algoritmo, tamanho_bloco=tamanho_bloco)
+
+
+"""
+---------------------------------------------------
+---------- 3. DETECÇÃO DE DUPLICADOS --------------
+---------------------------------------------------
+"""
+
+# Grupo de arquivos com conteúdo idêntico
+GrupoDuplicados = namedtuple('GrupoDuplicados', ['tamanho', 'checksum', 'arquivos', 'hard_links'])
+GrupoDuplicados.__doc__ = """
+Grupo de arquivos distintos (inodes diferentes) com conteúdo idêntico
+
+:attr tamanho: tamanho de cada arquivo em bytes [type: int]
+:attr checksum: checksum completo do conteúdo [type: string]
+:attr arquivos: um caminho por arquivo distinto [type: list]
+:attr hard_links: caminhos adicionais que apontam para algum dos arquivos do grupo [type: list]
+"""
+
+# Agrupando itens por chave, mantendo apenas grupos com mais de um item
+def _agrupa(itens, chave):
+    grupos = {}
+    for item in itens:
+        grupos.setdefault(chave(item), []).append(item)
+    return [grupo for grupo in grupos.values() if len(grupo) > 1]
+
+# Calculando checksums em paralelo e registrando falhas
+def _calcula(pool, func, candidatos, falhas):
+    resultados = []
+    futuros = [(candidato, pool.submit(func, candidato)) for candidato in candidatos]
+    for candidato, futuro in futuros:
+        try:
+            resultados.append((candidato, futuro.result()))
+        except OSError as e:
+            falhas[candidato['caminho']] = e
+    return resultados
+
+def encontra_duplicados(caminhos, algoritmo='blake2b', workers=8, cache=None, usa_mmap=True,
+                        tamanho_bloco=TAMANHO_BLOCO_PARCIAL):
+    """
+    Função responsável por encontrar arquivos com conteúdo idêntico em uma lista de caminhos,
+    em etapas de custo crescente: agrupamento por tamanho, checksum parcial (primeiro e último
+    bloco) e checksum completo apenas dos candidatos restantes, calculados em um pool de
+    threads. Hard links de um mesmo arquivo não são considerados duplicados entre si
+
+    Parâmetros
+    ----------
+    :param caminhos: caminhos completos dos arquivos [type: iterable]
+    :param algoritmo: nome do algoritmo de checksum (ver filescope.copia.cria_hash()) [type: string, default='blake2b']
+    :param workers: quantidade de threads de leitura [type: int, default=8]
+    :param cache: cache de checksums [type: CacheHashes, default=None]
+    :param usa_mmap: flag para leitura dos checksums completos via mmap [type: bool, default=True]
+    :param tamanho_bloco: tamanho dos blocos do checksum parcial [type: int, default=64KB]
+
+    Retorno
+    -------
+    :return grupos: grupos de arquivos duplicados, do maior para o menor espaço recuperável [type: list of GrupoDuplicados]
+    :return falhas: dicionário {caminho: exceção} dos arquivos que não puderam ser lidos [type: dict]
+    """
+
+    # Etapa 1: stat dos arquivos, agrupamento de hard links e agrupamento por tamanho
+    falhas, inodes = {}, {}
+    for caminho in caminhos:
+        try:
+            st = os.stat(caminho)
+        except OSError as e:
+            falhas[caminho] = e
+            continue
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            continue
+        chave = (st.st_dev, st.st_ino)
+        if chave in inodes:
+            inodes[chave]['links'].append(caminho)
+        else:
+            inodes[chave] = {'caminho': caminho, 'st': st, 'links': [], 'parcial': None, 'completo': None}
+    candidatos = [c for grupo in _agrupa(inodes.values(), lambda c: c['st'].st_size) for c in grupo]
+
+    # Checksums registrados no cache
+    if cache is not None:
+        for candidato in candidatos:
+            candidato['parcial'], candidato['completo'] = cache.busca(candidato['st'])
+    novos = []
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        # Etapa 2: checksum parcial
+        pendentes = [c for c in candidatos if c['parcial'] is None]
+        for candidato, checksum in _calcula(pool, lambda c: checksum_parcial(c['caminho'], c['st'].st_size, algoritmo,
+                                                                             tamanho_bloco), pendentes, falhas):
+            candidato['parcial'] = checksum
+            novos.append(candidato)
+        candidatos = [c for c in candidatos if c['parcial'] is not None]
+        candidatos = [c for grupo in _agrupa(candidatos, lambda c: (c['st'].st_size, c['parcial'])) for c in grupo]
+
+        # Arquivos de até dois blocos foram lidos por completo na etapa anterior
+        for candidato in candidatos:
+            if candidato['completo'] is None and candidato['st'].st_size <= 2 * tamanho_bloco:
+                candidato['completo'] = candidato['parcial']
+
+        # Etapa 3: checksum completo dos candidatos restantes
+        pendentes = [c for c in candidatos if c['completo'] is None]
+        for candidato, checksum in _calcula(pool, lambda c: checksum_completo(c['caminho'], algoritmo, usa_mmap),
+                                            pendentes, falhas):
+            candidato['completo'] = checksum
+            novos.append(candidato)
+
+    # Registrando checksums calculados no cache
+    if cache is not None and novos:
+        cache.grava([(c['st'], c['parcial'], c['completo']) for c in {id(c): c for c in novos}.values()])
+
+    # Consolidando grupos de conteúdo idêntico
+    candidatos = [c for c in candidatos if c['completo'] is not None]
+    grupos = [GrupoDuplicados(grupo[0]['st'].st_size, grupo[0]['completo'], [c['caminho'] for c in grupo],
+                              [link for c in grupo for link in c['links']])
+              for grupo in _agrupa(candidatos, lambda c: (c['st'].st_size, c['completo']))]
+    grupos.sort(key=lambda g: g.tamanho * (len(g.arquivos) - 1), reverse=True)
+
+    return grupos, falhas
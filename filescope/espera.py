@@ -0,0 +1,407 @@
+"""
+---------------------------------------------------
+------------ TÓPICO: Espera por Arquivos ----------
+---------------------------------------------------
+Script python responsável por alocar funções de
+espera pela chegada de arquivos em diretórios. Em
+sistemas Linux, a espera é orientada a eventos do
+kernel (inotify), sem laços de polling; nos demais
+sistemas, ou quando o inotify não está disponível, a
+verificação é feita periodicamente.
+
+Um arquivo é considerado disponível quando existe,
+possui data de modificação igual ou superior a um
+mínimo (opcional) e permanece sem alterações de
+tamanho e data de modificação durante um período de
+estabilidade (evitando a leitura de arquivos ainda
+em escrita).
+
+Sumário
+---------------------------------------------------
+1. Configuração Inicial
+    1.1 Importando bibliotecas
+2. Monitoramento de Eventos
+    2.1 Interface inotify
+3. Espera por Arquivos
+    3.1 Espera síncrona
+    3.2 Espera assíncrona
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Importando bibliotecas
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+import weakref
+
+# asyncio importado apenas no primeiro uso das funções assíncronas
+from filescope.importacao import ImportacaoTardia
+asyncio = ImportacaoTardia('asyncio')
+
+
+"""
+---------------------------------------------------
+---------- 2. MONITORAMENTO DE EVENTOS ------------
+             2.1 Interface inotify
+---------------------------------------------------
+"""
+
+# Eventos monitorados em diretórios (criação, escrita, alteração de atributos e renomeação de arquivos)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+MASCARA_EVENTOS = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+# Cabeçalho de cada evento retornado pelo kernel (wd, mask, cookie, len)
+CABECALHO_EVENTO = struct.Struct('iIII')
+
+# Carregando funções inotify da libc (apenas Linux)
+_libc = None
+if sys.platform.startswith('linux'):
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        _libc.inotify_init1
+    except (OSError, AttributeError):
+        _libc = None
+INOTIFY_DISPONIVEL = _libc is not None
+
+
+class Inotify:
+    """
+    Classe responsável por encapsular uma instância inotify do kernel, permitindo o
+    monitoramento de eventos em múltiplos diretórios a partir de um único descritor
+
+    Aplicação
+    ---------
+    with Inotify() as inotify:
+        inotify.adiciona('/mnt/feeds')
+        select.select([inotify], [], [], 10)
+        eventos = inotify.le_eventos()
+    """
+
+    def __init__(self):
+        if not INOTIFY_DISPONIVEL:
+            raise OSError('inotify indisponível neste sistema')
+        self.fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            erro = ctypes.get_errno()
+            raise OSError(erro, os.strerror(erro))
+
+    def fileno(self):
+        return self.fd
+
+    def adiciona(self, diretorio):
+        """Inicia o monitoramento de um diretório, retornando o identificador do monitoramento (wd)"""
+        wd = _libc.inotify_add_watch(self.fd, os.fsencode(diretorio), MASCARA_EVENTOS)
+        if wd < 0:
+            erro = ctypes.get_errno()
+            raise OSError(erro, os.strerror(erro), diretorio)
+        return wd
+
+    def remove(self, wd):
+        """Encerra o monitoramento identificado por wd"""
+        _libc.inotify_rm_watch(self.fd, wd)
+
+    def le_eventos(self):
+        """Lê os eventos pendentes, retornando uma lista de tuplas (wd, mask, nome)"""
+        eventos = []
+        while True:
+            try:
+                dados = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return eventos
+            pos = 0
+            while pos < len(dados):
+                wd, mask, _, tamanho = CABECALHO_EVENTO.unpack_from(dados, pos)
+                pos += CABECALHO_EVENTO.size
+                nome = dados[pos:pos + tamanho].rstrip(b'\0')
+                pos += tamanho
+                eventos.append((wd, mask, os.fsdecode(nome)))
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+"""
+---------------------------------------------------
+------------ 3. ESPERA POR ARQUIVOS ---------------
+              3.1 Espera síncrona
+---------------------------------------------------
+"""
+
+# Estado de um arquivo (tamanho e data de modificação) ou None para arquivos ausentes
+def _estado(caminho):
+    try:
+        st = os.stat(caminho)
+        return st.st_size, st.st_mtime_ns
+    except OSError:
+        return None
+
+
+class _Verificacao:
+    """Acompanhamento do estado de um arquivo até a condição de disponibilidade ser atendida"""
+
+    def __init__(self, caminho, mtime_minimo_ns, estabilidade):
+        self.caminho = caminho
+        self.mtime_minimo_ns = mtime_minimo_ns
+        self.estabilidade = estabilidade
+        self.estado = None
+        self.desde = None
+
+    def verifica(self):
+        """
+        Atualiza o estado do arquivo, retornando True quando disponível ou o tempo máximo
+        (em segundos) até a próxima verificação necessária (None para aguardar eventos)
+        """
+        agora = time.monotonic()
+        estado = _estado(self.caminho)
+        if estado is None or (self.mtime_minimo_ns is not None and estado[1] < self.mtime_minimo_ns):
+            self.estado, self.desde = None, None
+            return None
+        if estado != self.estado:
+            # Período de estabilidade contado a partir da data de modificação (arquivos inalterados há mais
+            # tempo que a estabilidade são considerados disponíveis imediatamente)
+            idade = min(max(time.time() - estado[1] / 1e9, 0), self.estabilidade)
+            self.estado, self.desde = estado, agora - idade
+        restante = self.desde + self.estabilidade - agora
+        return True if restante <= 0 else restante
+
+
+def _minimo(*valores):
+    valores = [v for v in valores if v is not None]
+    return min(valores) if valores else None
+
+
+def aguarda_arquivo(caminho, timeout=None, estabilidade=2.0, mtime_minimo_ns=None, intervalo=1.0,
+                    intervalo_inotify=30.0):
+    """
+    Função responsável por bloquear a execução até que um arquivo esteja disponível ou até
+    que o timeout seja atingido. Com inotify disponível, o processo permanece suspenso até
+    a ocorrência de eventos no diretório do arquivo; uma verificação adicional é feita a
+    cada intervalo_inotify segundos, cobrindo sistemas de arquivos de rede, onde alterações
+    feitas por outras máquinas não geram eventos. Sem inotify, o arquivo é verificado a
+    cada intervalo segundos
+
+    Parâmetros
+    ----------
+    :param caminho: caminho completo do arquivo [type: string]
+    :param timeout: tempo máximo de espera em segundos [type: float, default=None (sem limite)]
+    :param estabilidade: tempo (em segundos) sem alterações de tamanho e data de modificação para
+            que o arquivo seja considerado completo, contado a partir da data de modificação do
+            arquivo [type: float, default=2.0]
+    :param mtime_minimo_ns: data de modificação mínima (epoch em nanosegundos) [type: int, default=None]
+    :param intervalo: intervalo de verificação sem inotify (em segundos) [type: float, default=1.0]
+    :param intervalo_inotify: intervalo de verificação com inotify (em segundos) [type: float, default=30.0]
+
+    Retorno
+    -------
+    :return flag: True quando o arquivo está disponível ou False ao atingir o timeout [type: bool]
+
+    Aplicação
+    ---------
+    if aguarda_arquivo('/mnt/feeds/arquivo.csv', timeout=3600):
+        doSomething()
+    """
+
+    limite = None if timeout is None else time.monotonic() + timeout
+    verificacao = _Verificacao(caminho, mtime_minimo_ns, estabilidade)
+
+    # Monitorando o diretório do arquivo (polling caso o diretório não exista ou o inotify esteja indisponível)
+    inotify = None
+    if INOTIFY_DISPONIVEL:
+        try:
+            inotify = Inotify()
+            inotify.adiciona(os.path.dirname(os.path.abspath(caminho)))
+        except OSError:
+            if inotify is not None:
+                inotify.close()
+            inotify = None
+
+    try:
+        while True:
+            espera = verificacao.verifica()
+            if espera is True:
+                return True
+            agora = time.monotonic()
+            if limite is not None and agora >= limite:
+                return False
+
+            espera = _minimo(espera, intervalo_inotify if inotify is not None else intervalo,
+                             None if limite is None else limite - agora)
+            if inotify is None:
+                time.sleep(espera)
+            elif select.select([inotify], [], [], espera)[0]:
+                inotify.le_eventos()
+    finally:
+        if inotify is not None:
+            inotify.close()
+
+
+"""
+---------------------------------------------------
+------------ 3. ESPERA POR ARQUIVOS ---------------
+             3.2 Espera assíncrona
+---------------------------------------------------
+"""
+
+class _MonitorAsync:
+    """
+    Instância inotify compartilhada entre as esperas de um mesmo event loop. Cada diretório
+    é monitorado uma única vez e os eventos são repassados a todas as esperas do diretório
+    """
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.inotify = Inotify()
+        self.diretorios = {}
+        self.esperas = {}
+        loop.add_reader(self.inotify.fd, self._despacha)
+
+    def registra(self, diretorio, evento):
+        if diretorio not in self.diretorios:
+            try:
+                wd = self.inotify.adiciona(diretorio)
+            except OSError:
+                self._encerra_se_ocioso()
+                raise
+            self.diretorios[diretorio] = wd
+            self.esperas.setdefault(wd, set())
+        self.esperas[self.diretorios[diretorio]].add(evento)
+
+    def remove(self, diretorio, evento):
+        wd = self.diretorios.get(diretorio)
+        if wd is None:
+            return
+        self.esperas[wd].discard(evento)
+        if not self.esperas[wd]:
+            del self.esperas[wd], self.diretorios[diretorio]
+            self.inotify.remove(wd)
+        self._encerra_se_ocioso()
+
+    def _encerra_se_ocioso(self):
+        # Encerrando a instância inotify ao final da última espera do event loop
+        if not self.diretorios and self.inotify.fd >= 0:
+            self.loop.remove_reader(self.inotify.fd)
+            self.inotify.close()
+            _monitores.pop(self.loop, None)
+
+    def _despacha(self):
+        for wd in {wd for wd, _, _ in self.inotify.le_eventos()}:
+            for evento in self.esperas.get(wd, ()):
+                evento.set()
+
+
+# Monitores inotify por event loop
+_monitores = weakref.WeakKeyDictionary()
+
+def _monitor_async(loop):
+    if not INOTIFY_DISPONIVEL:
+        return None
+    monitor = _monitores.get(loop)
+    if monitor is None:
+        try:
+            monitor = _monitores[loop] = _MonitorAsync(loop)
+        except (OSError, NotImplementedError):
+            return None
+    return monitor
+
+
+async def aguarda_arquivo_async(caminho, timeout=None, estabilidade=2.0, mtime_minimo_ns=None, intervalo=1.0,
+                                intervalo_inotify=30.0):
+    """
+    Versão assíncrona de aguarda_arquivo(), permitindo que um único processo aguarde
+    múltiplos arquivos em um mesmo event loop. As esperas de um event loop compartilham
+    uma única instância inotify, com cada diretório monitorado uma única vez
+
+    Parâmetros
+    ----------
+    Os mesmos parâmetros de aguarda_arquivo()
+
+    Retorno
+    -------
+    :return flag: True quando o arquivo está disponível ou False ao atingir o timeout [type: bool]
+
+    Aplicação
+    ---------
+    resultados = await asyncio.gather(*[aguarda_arquivo_async(c, timeout=3600) for c in caminhos])
+    """
+
+    loop = asyncio.get_running_loop()
+    limite = None if timeout is None else loop.time() + timeout
+    verificacao = _Verificacao(caminho, mtime_minimo_ns, estabilidade)
+    diretorio = os.path.dirname(os.path.abspath(caminho))
+
+    # Registrando espera no monitor do event loop (polling caso o diretório não exista ou o inotify esteja indisponível)
+    evento = asyncio.Event()
+    monitor = _monitor_async(loop)
+    if monitor is not None:
+        try:
+            monitor.registra(diretorio, evento)
+        except OSError:
+            monitor = None
+
+    try:
+        while True:
+            espera = verificacao.verifica()
+            if espera is True:
+                return True
+            agora = loop.time()
+            if limite is not None and agora >= limite:
+                return False
+
+            espera = _minimo(espera, intervalo_inotify if monitor is not None else intervalo,
+                             None if limite is None else limite - agora)
+            evento.clear()
+            try:
+                await asyncio.wait_for(evento.wait(), espera)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        if monitor is not None:
+            monitor.remove(diretorio, evento)
+
+
+def aguarda_arquivos(caminhos, timeout=None, **kwargs):
+    """
+    Função responsável por aguardar múltiplos arquivos simultaneamente, bloqueando a execução
+    até que todos estejam disponíveis ou até que o timeout seja atingido
+
+    Parâmetros
+    ----------
+    :param caminhos: caminhos completos dos arquivos [type: list]
+    :param timeout: tempo máximo de espera em segundos [type: float, default=None (sem limite)]
+    :param **kwargs: demais parâmetros de aguarda_arquivo()
+
+    Retorno
+    -------
+    :return disponibilidade: dicionário no formato {caminho: flag de disponibilidade} [type: dict]
+    """
+
+    async def aguarda_todos():
+        return await asyncio.gather(*[aguarda_arquivo_async(c, timeout=timeout, **kwargs) for c in caminhos])
+
+    return dict(zip(caminhos, asyncio.run(aguarda_todos())))
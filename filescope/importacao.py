@@ -0,0 +1,66 @@
+"""
+---------------------------------------------------
+----------- TÓPICO: Importação Tardia -------------
+---------------------------------------------------
+Script python responsável por alocar o mecanismo de
+importação tardia das bibliotecas de análise e
+visualização (numpy, pandas, matplotlib e seaborn).
+As bibliotecas são importadas apenas no primeiro
+acesso a um de seus atributos, de modo que rotinas
+que utilizam apenas as funções de validação e cópia
+de arquivos não pagam o custo de importação dessas
+bibliotecas.
+
+Sumário
+---------------------------------------------------
+1. Configuração Inicial
+    1.1 Importando bibliotecas
+2. Importação Tardia
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Importando bibliotecas
+import importlib
+
+
+"""
+---------------------------------------------------
+------------- 2. IMPORTAÇÃO TARDIA ----------------
+---------------------------------------------------
+"""
+
+class ImportacaoTardia:
+    """
+    Classe responsável por representar um módulo cuja importação é adiada até o primeiro
+    acesso a um de seus atributos
+
+    Parâmetros
+    ----------
+    :param nome: nome completo do módulo (ex: 'matplotlib.pyplot') [type: string]
+
+    Aplicação
+    ---------
+    pd = ImportacaoTardia('pandas')
+    df = pd.DataFrame()  # pandas importado neste momento
+    """
+
+    def __init__(self, nome):
+        self._nome = nome
+        self._modulo = None
+
+    def __getattr__(self, attr):
+        if self._modulo is None:
+            self._modulo = importlib.import_module(self._nome)
+        return getattr(self._modulo, attr)
+
+    def __repr__(self):
+        estado = 'importado' if self._modulo is not None else 'não importado'
+        return f'<ImportacaoTardia {self._nome} ({estado})>'
@@ -0,0 +1,374 @@
+"""
+---------------------------------------------------
+---------- TÓPICO: Índice de Varreduras -----------
+---------------------------------------------------
+Script python responsável por alocar um índice
+persistente (SQLite) com os metadados dos arquivos
+de diretórios já varridos. A partir do índice, novas
+varreduras de um mesmo diretório são incrementais:
+apenas diretórios com data de modificação diferente
+da registrada são listados novamente, enquanto os
+demais têm seus arquivos reaproveitados do índice.
+
+Observações
+---------------------------------------------------
+A data de modificação de um diretório é alterada
+quando arquivos são criados, removidos ou renomeados
+nele, mas não quando o conteúdo de um arquivo existente
+é reescrito no próprio local. Para detectar esse tipo
+de modificação, o argumento verifica_arquivos=True
+realiza uma chamada stat para os arquivos dos
+diretórios inalterados (sem listá-los novamente).
+Datas de último acesso de arquivos em diretórios
+inalterados permanecem as da última listagem.
+
+Sumário
+---------------------------------------------------
+1. Configuração Inicial
+    1.1 Importando bibliotecas
+    1.2 Estrutura do índice
+2. Varredura Incremental
+3. Leitura do Índice
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Importando bibliotecas
+import os
+import sqlite3
+import time
+
+# Filescope
+from filescope.scanner import lista_diretorio, espaco_alocado, ColunasVarredura
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+             1.2 Estrutura do índice
+---------------------------------------------------
+"""
+
+# Tipos de mudanças reportadas
+ADICIONADO = 'adicionado'
+MODIFICADO = 'modificado'
+REMOVIDO = 'removido'
+
+# Diretórios modificados há menos tempo que a margem são listados novamente na próxima varredura
+MARGEM_MTIME_NS = 2 * 10**9
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS diretorios (
+    raiz TEXT NOT NULL,
+    caminho TEXT NOT NULL,
+    pai TEXT,
+    mtime_ns INTEGER NOT NULL,
+    PRIMARY KEY (raiz, caminho)
+);
+CREATE TABLE IF NOT EXISTS arquivos (
+    raiz TEXT NOT NULL,
+    diretorio TEXT NOT NULL,
+    arquivo TEXT NOT NULL,
+    tamanho INTEGER NOT NULL,
+    ctime_ns INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    atime_ns INTEGER NOT NULL,
+    uid INTEGER NOT NULL,
+    gid INTEGER NOT NULL,
+    alocado INTEGER,
+    dev INTEGER,
+    ino INTEGER,
+    nlink INTEGER,
+    PRIMARY KEY (raiz, diretorio, arquivo)
+);
+CREATE TABLE IF NOT EXISTS mudancas (
+    raiz TEXT NOT NULL,
+    tipo TEXT NOT NULL,
+    diretorio TEXT NOT NULL,
+    arquivo TEXT NOT NULL,
+    dt_varredura_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_mudancas_raiz ON mudancas (raiz);
+"""
+
+# Colunas adicionadas à tabela de arquivos após a criação do índice (migradas na abertura)
+COLUNAS_ADICIONAIS = ['alocado', 'dev', 'ino', 'nlink']
+
+# Inserção de um arquivo no índice
+INSERE_ARQUIVO = ('INSERT OR REPLACE INTO arquivos (raiz, diretorio, arquivo, tamanho, ctime_ns, mtime_ns, atime_ns, '
+                  'uid, gid, alocado, dev, ino, nlink) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
+
+def _linha_arquivo(raiz, diretorio, nome, st):
+    return (raiz, diretorio, nome, st.st_size, st.st_ctime_ns, st.st_mtime_ns, st.st_atime_ns, st.st_uid, st.st_gid,
+            espaco_alocado(st), st.st_dev, st.st_ino, st.st_nlink)
+
+# Abrindo (e criando) índice
+def abre_indice(caminho_indice):
+    """
+    Função responsável por abrir uma conexão com o índice de varreduras, criando o
+    arquivo e as tabelas necessárias caso ainda não existam
+
+    Parâmetros
+    ----------
+    :param caminho_indice: caminho do arquivo SQLite do índice [type: string]
+
+    Retorno
+    -------
+    :return con: conexão com o índice [type: sqlite3.Connection]
+    """
+
+    diretorio_indice = os.path.dirname(os.path.abspath(caminho_indice))
+    if not os.path.isdir(diretorio_indice):
+        os.makedirs(diretorio_indice)
+
+    con = sqlite3.connect(caminho_indice)
+    con.execute('PRAGMA journal_mode=WAL')
+    con.execute('PRAGMA synchronous=NORMAL')
+    con.executescript(SCHEMA)
+
+    # Migrando índices criados por versões anteriores (arquivos registrados sem as novas colunas
+    # são atualizados na próxima listagem do respectivo diretório)
+    existentes = {linha[1] for linha in con.execute('PRAGMA table_info(arquivos)')}
+    for coluna in COLUNAS_ADICIONAIS:
+        if coluna not in existentes:
+            con.execute(f'ALTER TABLE arquivos ADD COLUMN {coluna} INTEGER')
+
+    return con
+
+
+"""
+---------------------------------------------------
+----------- 2. VARREDURA INCREMENTAL --------------
+---------------------------------------------------
+"""
+
+# Varredura incremental a partir do índice
+def varre_incremental(root, caminho_indice, onerror=None, verifica_arquivos=False):
+    """
+    Função responsável por atualizar o índice de um diretório raíz, listando novamente
+    apenas os diretórios cuja data de modificação difere da registrada no índice. Os
+    subdiretórios de diretórios inalterados são obtidos do próprio índice, com uma única
+    chamada stat por diretório para verificação da data de modificação
+
+    Parâmetros
+    ----------
+    :param root: caminho do diretório raíz [type: string]
+    :param caminho_indice: caminho do arquivo SQLite do índice [type: string]
+    :param onerror: função chamada com a exceção OSError em caso de falha [type: callable, default=None]
+    :param verifica_arquivos: flag para verificar (via stat) arquivos de diretórios inalterados [type: bool, default=False]
+
+    Retorno
+    -------
+    :return mudancas: lista de tuplas (tipo, diretorio, arquivo) com as mudanças detectadas [type: list]
+            *tipos: 'adicionado', 'modificado' ou 'removido'
+
+    Aplicação
+    ---------
+    mudancas = varre_incremental(root='/mnt/share', caminho_indice='/var/lib/filescope/share.db')
+    """
+
+    raiz = os.path.abspath(root)
+    inicio_ns = time.time_ns()
+    con = abre_indice(caminho_indice)
+    mudancas = []
+
+    try:
+        with con:
+            # Diretórios conhecidos e hierarquia registrada na última varredura
+            conhecidos = {}
+            filhos = {}
+            for caminho, pai, mtime_ns in con.execute('SELECT caminho, pai, mtime_ns FROM diretorios WHERE raiz = ?',
+                                                      (raiz,)):
+                conhecidos[caminho] = mtime_ns
+                filhos.setdefault(pai, []).append(caminho)
+
+            visitados = set()
+            pendentes = [(raiz, None)]
+            while pendentes:
+                diretorio, pai = pendentes.pop()
+                try:
+                    st_dir = os.stat(diretorio)
+
+                    # Diretório inalterado: subdiretórios e arquivos reaproveitados do índice
+                    if conhecidos.get(diretorio) == st_dir.st_mtime_ns:
+                        if verifica_arquivos:
+                            _verifica_arquivos(con, raiz, diretorio, mudancas, onerror)
+                        subdirs = sorted(filhos.get(diretorio, []))
+                    else:
+                        subdirs = _atualiza_diretorio(con, raiz, diretorio, mudancas, onerror)
+
+                        # Datas muito recentes não são confiáveis (granularidade do sistema de arquivos)
+                        mtime_ns = st_dir.st_mtime_ns if st_dir.st_mtime_ns < inicio_ns - MARGEM_MTIME_NS else 0
+                        con.execute('INSERT OR REPLACE INTO diretorios VALUES (?, ?, ?, ?)',
+                                    (raiz, diretorio, pai, mtime_ns))
+                except OSError as e:
+                    if onerror is not None:
+                        onerror(e)
+                    # Falhas transitórias (ex: EACCES, ESTALE em NFS) mantêm o diretório e seus
+                    # subdiretórios inalterados no índice; apenas diretórios inexistentes são removidos
+                    if not isinstance(e, FileNotFoundError):
+                        visitados.update(_subarvore(filhos, diretorio))
+                    continue
+                visitados.add(diretorio)
+                pendentes.extend((subdir, diretorio) for subdir in reversed(subdirs))
+
+            # Diretórios removidos desde a última varredura
+            for diretorio in set(conhecidos) - visitados:
+                arquivos = con.execute('SELECT arquivo FROM arquivos WHERE raiz = ? AND diretorio = ?',
+                                       (raiz, diretorio)).fetchall()
+                mudancas.extend((REMOVIDO, diretorio, arquivo) for arquivo, in arquivos)
+                con.execute('DELETE FROM arquivos WHERE raiz = ? AND diretorio = ?', (raiz, diretorio))
+                con.execute('DELETE FROM diretorios WHERE raiz = ? AND caminho = ?', (raiz, diretorio))
+
+            # Registrando conjunto de mudanças da varredura
+            con.execute('DELETE FROM mudancas WHERE raiz = ?', (raiz,))
+            con.executemany('INSERT INTO mudancas VALUES (?, ?, ?, ?, ?)',
+                            [(raiz, tipo, diretorio, arquivo, inicio_ns) for tipo, diretorio, arquivo in mudancas])
+    finally:
+        con.close()
+
+    return mudancas
+
+# Diretório e subdiretórios registrados no índice
+def _subarvore(filhos, diretorio):
+    subarvore, pendentes = [], [diretorio]
+    while pendentes:
+        atual = pendentes.pop()
+        subarvore.append(atual)
+        pendentes.extend(filhos.get(atual, []))
+    return subarvore
+
+# Listando novamente um diretório alterado
+def _atualiza_diretorio(con, raiz, diretorio, mudancas, onerror):
+    arquivos, subdirs, erros = lista_diretorio(diretorio)
+
+    # Falha na listagem do próprio diretório: registros mantidos e exceção repassada à varredura
+    for e in erros:
+        if getattr(e, 'filename', None) == diretorio:
+            raise e
+    for e in erros:
+        if onerror is not None:
+            onerror(e)
+
+    registrados = {arquivo: (tamanho, ctime_ns, mtime_ns) for arquivo, tamanho, ctime_ns, mtime_ns in con.execute(
+        'SELECT arquivo, tamanho, ctime_ns, mtime_ns FROM arquivos WHERE raiz = ? AND diretorio = ?', (raiz, diretorio))}
+
+    linhas = []
+    for nome, st in arquivos:
+        anterior = registrados.pop(nome, None)
+        if anterior is None:
+            mudancas.append((ADICIONADO, diretorio, nome))
+        elif anterior != (st.st_size, st.st_ctime_ns, st.st_mtime_ns):
+            mudancas.append((MODIFICADO, diretorio, nome))
+        linhas.append(_linha_arquivo(raiz, diretorio, nome, st))
+    con.executemany(INSERE_ARQUIVO, linhas)
+
+    # Arquivos registrados e não mais presentes no diretório
+    for nome in registrados:
+        mudancas.append((REMOVIDO, diretorio, nome))
+    con.executemany('DELETE FROM arquivos WHERE raiz = ? AND diretorio = ? AND arquivo = ?',
+                    [(raiz, diretorio, nome) for nome in registrados])
+
+    return subdirs
+
+# Verificando arquivos de um diretório inalterado
+def _verifica_arquivos(con, raiz, diretorio, mudancas, onerror):
+    registrados = con.execute('SELECT arquivo, tamanho, ctime_ns, mtime_ns FROM arquivos WHERE raiz = ? AND diretorio = ?',
+                              (raiz, diretorio)).fetchall()
+    linhas = []
+    for nome, tamanho, ctime_ns, mtime_ns in registrados:
+        try:
+            st = os.stat(os.path.join(diretorio, nome))
+        except OSError as e:
+            if onerror is not None:
+                onerror(e)
+            continue
+        if (tamanho, ctime_ns, mtime_ns) != (st.st_size, st.st_ctime_ns, st.st_mtime_ns):
+            mudancas.append((MODIFICADO, diretorio, nome))
+        linhas.append(_linha_arquivo(raiz, diretorio, nome, st))
+    con.executemany(INSERE_ARQUIVO, linhas)
+
+
+"""
+---------------------------------------------------
+------------- 3. LEITURA DO ÍNDICE ----------------
+---------------------------------------------------
+"""
+
+# Lendo arquivos registrados no índice
+def le_arquivos(root, caminho_indice):
+    """
+    Função responsável por percorrer os metadados de todos os arquivos de um diretório
+    raíz registrados no índice, sem carregá-los integralmente em memória
+
+    Parâmetros
+    ----------
+    :param root: caminho do diretório raíz [type: string]
+    :param caminho_indice: caminho do arquivo SQLite do índice [type: string]
+
+    Retorno
+    -------
+    :yields registro: tupla (diretorio, arquivo, tamanho, ctime_ns, mtime_ns, atime_ns, uid, gid, alocado, dev,
+            ino, nlink)
+    """
+
+    con = abre_indice(caminho_indice)
+    try:
+        cursor = con.execute('SELECT diretorio, arquivo, tamanho, ctime_ns, mtime_ns, atime_ns, uid, gid, alocado, '
+                             'dev, ino, nlink FROM arquivos WHERE raiz = ? ORDER BY diretorio', (os.path.abspath(root),))
+        for registro in cursor:
+            yield registro
+    finally:
+        con.close()
+
+# Carregando arquivos do índice em formato colunar
+def carrega_colunas(root, caminho_indice):
+    """
+    Função responsável por carregar os metadados de todos os arquivos de um diretório
+    raíz registrados no índice em formato colunar
+
+    Parâmetros
+    ----------
+    :param root: caminho do diretório raíz [type: string]
+    :param caminho_indice: caminho do arquivo SQLite do índice [type: string]
+
+    Retorno
+    -------
+    :return colunas: metadados em formato colunar [type: filescope.scanner.ColunasVarredura]
+    """
+
+    colunas = ColunasVarredura()
+    for registro in le_arquivos(root, caminho_indice):
+        colunas.adiciona_valores(*registro)
+
+    return colunas
+
+# Lendo mudanças da última varredura
+def le_mudancas(root, caminho_indice):
+    """
+    Função responsável por retornar o conjunto de mudanças detectado na última varredura
+    incremental de um diretório raíz
+
+    Parâmetros
+    ----------
+    :param root: caminho do diretório raíz [type: string]
+    :param caminho_indice: caminho do arquivo SQLite do índice [type: string]
+
+    Retorno
+    -------
+    :return mudancas: lista de tuplas (tipo, diretorio, arquivo, dt_varredura_ns) [type: list]
+    """
+
+    con = abre_indice(caminho_indice)
+    try:
+        return con.execute('SELECT tipo, diretorio, arquivo, dt_varredura_ns FROM mudancas WHERE raiz = ?',
+                           (os.path.abspath(root),)).fetchall()
+    finally:
+        con.close()
@@ -17,6 +17,9 @@ Sumário
     2.1 Validação na Origem
     2.2 Cópia de Arquivos
 3. Controle de Diretório
+    3.1 Visão analítica de diretório
+    3.2 Varredura de múltiplos diretórios
+    3.3 Report visual de diretórios
 ---------------------------------------------------
 """
 
@@ -36,17 +39,42 @@ import logging
 import os
 from os.path import isdir
 import shutil
-import pandas as pd
-from pandas import DataFrame
+import tempfile
+import glob
+import gzip
+import io
+import operator
+import uuid
+from itertools import chain
+from contextlib import contextmanager
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import time
-from datetime import datetime
-from pwd import getpwuid
-import matplotlib.pyplot as plt 
-from matplotlib.gridspec import GridSpec
-import seaborn as sns
 from warnings import filterwarnings
 filterwarnings('ignore')
 
+# Bibliotecas de análise e visualização (importadas no primeiro uso, ver filescope.importacao)
+from filescope.importacao import ImportacaoTardia
+np = ImportacaoTardia('numpy')
+pd = ImportacaoTardia('pandas')
+figure = ImportacaoTardia('matplotlib.figure')
+backend_agg = ImportacaoTardia('matplotlib.backends.backend_agg')
+sns = ImportacaoTardia('seaborn')
+
+# Bibliotecas de processamento em múltiplos processos (importadas no primeiro uso)
+multiprocessing = ImportacaoTardia('multiprocessing')
+futures_processos = ImportacaoTardia('concurrent.futures.process')
+
+# Filescope
+from filescope.scanner import varre_diretorio, lista_diretorio, ColunasVarredura, BACKENDS
+from filescope.owners import resolve_usuario, resolve_grupo
+from filescope.index import varre_incremental, le_arquivos, le_mudancas
+from filescope.rollup import RollupDiretorios
+from filescope.duplicados import encontra_duplicados, CacheHashes
+from filescope.copia import copia_lote, copia_verificada, ResultadoCopia, CopiaCancelada
+from filescope.espera import aguarda_arquivo, aguarda_arquivo_async
+
 
 """
 ---------------------------------------------------
@@ -103,20 +131,156 @@ def log_config(logger, level=logging.DEBUG,
     return logger
 
 
-# Configurando objeto de log
-logger = logging.getLogger(__file__)
-logger = log_config(logger)
+class LoggerTardio:
+    """
+    Logger do módulo configurado por log_config() apenas na primeira utilização, evitando a
+    configuração de handlers na importação do módulo. Caso a aplicação já tenha adicionado
+    handlers ao logger do módulo (logging.getLogger(nome)), a configuração padrão não é aplicada
+
+    Parâmetros
+    ----------
+    :param nome: nome do logger [type: string]
+    :param **opcoes: parâmetros de log_config()
+    """
+
+    def __init__(self, nome, **opcoes):
+        self._nome = nome
+        self._opcoes = opcoes
+        self._logger = None
+        self._trava = threading.Lock()
+
+    def _configura(self):
+        with self._trava:
+            if self._logger is None:
+                logger = logging.getLogger(self._nome)
+                if not logger.handlers:
+                    log_config(logger, **self._opcoes)
+                self._logger = logger
+        return self._logger
+
+    def __getattr__(self, atributo):
+        return getattr(self._logger or self._configura(), atributo)
+
+
+# Configurando objeto de log (handlers criados na primeira mensagem ou configuração)
+logger = LoggerTardio(__file__)
+
+
+# Formatos de saída suportados a partir da extensão do arquivo
+FORMATOS_SAIDA = {'.csv': 'csv', '.parquet': 'parquet', '.pq': 'parquet', '.feather': 'feather', '.arrow': 'feather'}
+
+# Argumentos de salvamento repassados para save_data() pelas funções de controle
+OPCOES_SAVE = ['formato', 'compressao', 'particao', 'append']
+
+# Compressão de arquivos csv a partir da extensão do arquivo
+COMPRESSOES_CSV = {'.gz': 'gzip', '.bz2': 'bz2', '.zip': 'zip', '.xz': 'xz', '.zst': 'zstd'}
+
+@contextmanager
+def escrita_atomica(output_file):
+    """
+    Gerenciador de contexto responsável por fornecer um caminho temporário no mesmo diretório
+    do arquivo destino. Ao final do bloco, o arquivo temporário substitui o destino através de
+    uma operação atômica (os.replace). Em caso de falha, o arquivo temporário é removido e o
+    destino permanece inalterado, evitando que processos posteriores leiam arquivos truncados
+
+    Parâmetros
+    ----------
+    :param output_file: caminho do arquivo destino [type: string]
+
+    Aplicação
+    ---------
+    with escrita_atomica('output/controle_diretorio.csv') as tmp_file:
+        df.to_csv(tmp_file, index=False)
+    """
+
+    diretorio, nome = os.path.split(output_file)
+    tmp_file = os.path.join(diretorio, f'.{nome}.{uuid.uuid4().hex}.tmp')
+    try:
+        yield tmp_file
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+def formato_arquivo(filename, formato=None):
+    """
+    Função responsável por definir o formato de um arquivo de report a partir do argumento
+    explícito ou da extensão do nome do arquivo (padrão: csv)
+
+    Parâmetros
+    ----------
+    :param filename: nome ou caminho do arquivo [type: string]
+    :param formato: formato explícito ('csv', 'parquet' ou 'feather') [type: string, default=None]
+
+    Retorno
+    -------
+    :return formato: formato do arquivo [type: string]
+    """
+
+    if formato is not None:
+        return formato
+    return FORMATOS_SAIDA.get(os.path.splitext(filename)[-1].lower(), 'csv')
+
+def colunas_particao(data, particao):
+    """
+    Função responsável por preparar as colunas de particionamento de um report. A partição
+    'dt_relatorio' é convertida para a data no formato AAAA-MM-DD (coluna dt_particao) e a
+    partição 'diretorio_raiz' corresponde ao diretório de primeiro nível abaixo do caminho
+    comum a todos os diretórios do report. Demais valores são utilizados como colunas
+    existentes do DataFrame
+
+    Parâmetros
+    ----------
+    :param data: report a ser particionado [type: pd.DataFrame]
+    :param particao: coluna ou lista de colunas de particionamento [type: string or list]
+
+    Retorno
+    -------
+    :return data: report com as colunas de partição adicionadas [type: pd.DataFrame]
+    :return cols: nomes das colunas de partição [type: list]
+    """
+
+    cols = []
+    data = data.copy(deep=False)
+    for col in [particao] if isinstance(particao, str) else list(particao):
+        if col == 'dt_relatorio':
+            data['dt_particao'] = data['dt_relatorio'].dt.strftime('%Y-%m-%d')
+            cols.append('dt_particao')
+        elif col == 'diretorio_raiz':
+            # Resolvendo o diretório de primeiro nível apenas para os diretórios distintos
+            diretorios = pd.Series(data['diretorio'].astype('category').cat.categories)
+            comum = os.path.commonpath(list(diretorios)) if len(diretorios) > 0 else ''
+            raizes = diretorios.map(lambda d: os.path.relpath(d, comum).split(os.sep)[0])
+            raizes = raizes.replace('.', os.path.basename(comum) or comum)
+            data['diretorio_raiz'] = data['diretorio'].map(dict(zip(diretorios, raizes))).astype(str)
+            cols.append('diretorio_raiz')
+        else:
+            cols.append(col)
 
+    return data, cols
 
-def save_data(data, output_path, filename):
+def save_data(data, output_path, filename, formato=None, compressao=None, particao=None, append=False):
     """
-    Método responsável por salvar objetos DataFrame em formato csv.
+    Método responsável por salvar objetos DataFrame em formato csv, parquet ou feather
+    (Arrow IPC). Os formatos colunares preservam os tipos das colunas (datas e categorias)
+    e permitem leitura rápida através da função le_report().
+
+    Reports parquet particionados ou gravados com append=True são salvos como um dataset
+    (diretório com um arquivo por gravação), permitindo acumular snapshots diários de um
+    mesmo diretório e consultá-los de forma conjunta.
 
     Parâmetros
     ----------
     :param data: arquivo/objeto a ser salvo [type: pd.DataFrame]
     :param output_path: referência de diretório destino [type: string]
     :param filename: referência do nome do arquivo a ser salvo [type: string]
+    :param formato: formato de saída ('csv', 'parquet' ou 'feather') [type: string, default=None (extensão)]
+    :param compressao: algoritmo de compressão (ex: 'snappy', 'zstd', 'lz4', 'gzip')
+            [type: string, default=None (padrão do formato)]
+    :param particao: coluna(s) de particionamento do dataset parquet ('dt_relatorio', 'diretorio_raiz'
+            ou colunas do report) [type: string or list, default=None]
+    :param append: flag para adicionar os dados a um arquivo/dataset existente [type: bool, default=False]
 
     Retorno
     -------
@@ -126,8 +290,21 @@ def save_data(data, output_path, filename):
     ---------
     df = file_generator_method()
     save_result(df, output_path=OUTPUT_PATH, filename='arquivo.csv')
+    save_data(df, output_path=OUTPUT_PATH, filename='snapshots.parquet', particao='dt_relatorio', append=True)
     """
 
+    # Validando formato de saída
+    formato = formato_arquivo(filename, formato)
+    if formato not in set(FORMATOS_SAIDA.values()):
+        logger.error(f'Formato {formato} inválido. Formatos suportados: {sorted(set(FORMATOS_SAIDA.values()))}')
+        return
+    if formato != 'parquet' and particao is not None:
+        logger.error(f'Particionamento disponível apenas para o formato parquet')
+        return
+    if formato == 'feather' and append:
+        logger.error(f'Formato feather não suporta append. Utilize o formato parquet')
+        return
+
     # Verificando se diretório existe
     if not os.path.isdir(output_path):
         logger.warning(f'Diretório {output_path} inexistente. Criando diretório no local especificado')
@@ -140,10 +317,157 @@ def save_data(data, output_path, filename):
     logger.debug(f'Salvando arquivo no diretório especificado')
     try:
         output_file = os.path.join(output_path, filename)
-        data.to_csv(output_file, index=False)
+        if formato == 'csv' and append:
+            header = not os.path.exists(output_file)
+            data.to_csv(output_file, index=False, mode='a', header=header, compression=compressao or 'infer')
+        elif formato == 'csv':
+            compressao = compressao or COMPRESSOES_CSV.get(os.path.splitext(filename)[-1].lower())
+            with escrita_atomica(output_file) as tmp_file:
+                data.to_csv(tmp_file, index=False, compression=compressao)
+        elif formato == 'feather':
+            with escrita_atomica(output_file) as tmp_file:
+                data.reset_index(drop=True).to_feather(tmp_file, compression=compressao)
+        elif particao is None and not append:
+            with escrita_atomica(output_file) as tmp_file:
+                data.to_parquet(tmp_file, index=False, compression=compressao or 'snappy')
+        else:
+            # Dataset parquet: cada gravação gera um novo arquivo (nome único) em cada partição
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            cols = []
+            if particao is not None:
+                data, cols = colunas_particao(data, particao)
+            if not append and os.path.exists(output_file):
+                shutil.rmtree(output_file) if os.path.isdir(output_file) else os.remove(output_file)
+            elif os.path.isfile(output_file):
+                logger.error(f'Arquivo {output_file} não é um dataset parquet. Append não realizado')
+                return
+            tabela = pa.Table.from_pandas(data, preserve_index=False)
+            pq.write_to_dataset(tabela, root_path=output_file, partition_cols=cols or None,
+                                compression=compressao or 'snappy')
+    except Exception as e:
+        logger.error(f'Erro ao salvar arquivo {filename}. Exception lançada: {e}')
+
+def save_lotes_csv(lotes, output_path, filename, compressao=None, chunksize=10000, tamanho_buffer=1024**2):
+    """
+    Método responsável por salvar em formato csv um report recebido em lotes (ex: iter_scan()),
+    escrevendo cada lote à medida que é recebido. Apenas um lote é mantido em memória e a
+    escrita de cada lote é feita em blocos de chunksize linhas através de um buffer de tamanho
+    fixo. O arquivo é escrito em um caminho temporário e renomeado para o destino apenas ao
+    final da escrita de todos os lotes, de modo que uma falha durante a varredura não deixa
+    um arquivo truncado no diretório destino.
+
+    Parâmetros
+    ----------
+    :param lotes: iterável de DataFrames com as mesmas colunas [type: iterable]
+    :param output_path: referência de diretório destino [type: string]
+    :param filename: referência do nome do arquivo a ser salvo [type: string]
+    :param compressao: compressão do arquivo ('gzip' ou 'zstd') [type: string, default=None (extensão)]
+    :param chunksize: quantidade de linhas formatadas por bloco de escrita [type: int, default=10000]
+    :param tamanho_buffer: tamanho do buffer de escrita em bytes [type: int, default=1MB]
+
+    Retorno
+    -------
+    Este método não retorna nenhum parâmetro além do arquivo devidamente salvo no diretório (caso nenhum
+    lote seja recebido, o arquivo não é salvo e um arquivo existente no destino é mantido)
+
+    Aplicação
+    ---------
+    lotes = score_em_lotes(iter_scan(root='/mnt/share'), spill_dir='/tmp')
+    save_lotes_csv(lotes, output_path=OUTPUT_PATH, filename='controle_diretorio.csv.gz')
+    """
+
+    # Validando compressão
+    compressao = compressao or COMPRESSOES_CSV.get(os.path.splitext(filename)[-1].lower())
+    if compressao not in (None, 'gzip', 'zstd'):
+        logger.error(f'Compressão {compressao} inválida. Compressões suportadas: gzip, zstd')
+        return
+    if compressao == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            logger.error(f'Compressão zstd exige a instalação do pacote zstandard')
+            return
+
+    # Verificando se diretório existe
+    if not os.path.isdir(output_path):
+        logger.warning(f'Diretório {output_path} inexistente. Criando diretório no local especificado')
+        try:
+            os.makedirs(output_path)
+        except Exception as e:
+            logger.error(f'Erro ao tentar criar o diretório {output_path}. Exception lançada: {e}')
+            return
+
+    logger.debug(f'Salvando lotes no diretório especificado')
+    qtd_linhas = 0
+    try:
+        # Sem lotes recebidos, um arquivo existente no destino é mantido (não é substituído por um arquivo vazio)
+        lotes = iter(lotes)
+        primeiro_lote = next(lotes, None)
+        if primeiro_lote is None:
+            logger.warning(f'Nenhum lote recebido. Arquivo {filename} não foi salvo')
+            return
+
+        with escrita_atomica(os.path.join(output_path, filename)) as tmp_file:
+            with open(tmp_file, 'wb', buffering=tamanho_buffer) as bruto:
+                if compressao == 'gzip':
+                    saida = gzip.GzipFile(fileobj=bruto, mode='wb')
+                elif compressao == 'zstd':
+                    saida = zstandard.ZstdCompressor().stream_writer(bruto, closefd=False)
+                else:
+                    saida = bruto
+                texto = io.TextIOWrapper(saida, encoding='utf-8', newline='')
+                for i, df_lote in enumerate(chain([primeiro_lote], lotes)):
+                    df_lote.to_csv(texto, index=False, header=(i == 0), chunksize=chunksize)
+                    qtd_linhas += len(df_lote)
+
+                # Finalizando compressão e garantindo persistência antes da renomeação
+                texto.flush()
+                texto.detach()
+                if saida is not bruto:
+                    saida.close()
+                bruto.flush()
+                os.fsync(bruto.fileno())
+        logger.info(f'Arquivo {filename} salvo com {qtd_linhas} linhas')
     except Exception as e:
         logger.error(f'Erro ao salvar arquivo {filename}. Exception lançada: {e}')
 
+def le_report(caminho, formato=None, colunas=None, filtros=None):
+    """
+    Função responsável por ler um report salvo através de save_data(), preservando os tipos
+    das colunas. Para arquivos parquet, apenas as colunas e partições solicitadas são lidas
+
+    Parâmetros
+    ----------
+    :param caminho: caminho do arquivo ou dataset [type: string]
+    :param formato: formato do arquivo ('csv', 'parquet' ou 'feather') [type: string, default=None (extensão)]
+    :param colunas: lista de colunas a serem lidas [type: list, default=None (todas)]
+    :param filtros: filtros de leitura de datasets parquet no formato [(coluna, operador, valor)]
+            [type: list, default=None]
+
+    Retorno
+    -------
+    :return df: report lido [type: pd.DataFrame]
+
+    Aplicação
+    ---------
+    df = le_report('output/snapshots.parquet', filtros=[('dt_particao', '>=', '2021-05-01')])
+    """
+
+    formato = formato_arquivo(caminho, formato)
+    try:
+        if formato == 'parquet':
+            return pd.read_parquet(caminho, columns=colunas, filters=filtros)
+        elif formato == 'feather':
+            return pd.read_feather(caminho, columns=colunas)
+        cols_data = ['dt_criacao', 'dt_ult_modif', 'dt_ult_acesso', 'dt_relatorio']
+        df = pd.read_csv(caminho, usecols=colunas)
+        for col in [col for col in cols_data if col in df.columns]:
+            df[col] = pd.to_datetime(df[col])
+        return df
+    except Exception as e:
+        logger.error(f'Erro ao ler o report {caminho}. Exception lançada: {e}')
+
 
 """
 ---------------------------------------------------
@@ -176,22 +500,108 @@ def valida_arquivo_origem(dir_origem, nome_arquivo):
         doNothing()
     """
     
-    # Validando presença do arquivo na origem
+    # Validando presença do arquivo na origem a partir de uma única chamada stat
     try:
-        arquivos_na_origem = os.listdir(path=dir_origem)
-        if nome_arquivo in arquivos_na_origem:
-            logger.info(f'Arquivo {nome_arquivo} presente na origem {dir_origem}')
-            return True
-        else:
-            logger.warning(f'Arquivo {nome_arquivo} não presente na origem {dir_origem}')
-            return False
+        os.lstat(os.path.join(dir_origem, nome_arquivo))
+        logger.info(f'Arquivo {nome_arquivo} presente na origem {dir_origem}')
+        return True
     except NotADirectoryError as e:
         logger.error(f'Parâmetro origem {dir_origem} não é um diretório de rede. Exception lançada: {e}')
         return False
     except FileNotFoundError as e:
-        logger.error(f'Arquivo {nome_arquivo} não encontrado na origem. Exception lançada: {e}')
+        # Diferenciando arquivo ausente de diretório origem inexistente
+        if os.path.isdir(dir_origem):
+            logger.warning(f'Arquivo {nome_arquivo} não presente na origem {dir_origem}')
+        else:
+            logger.error(f'Arquivo {nome_arquivo} não encontrado na origem. Exception lançada: {e}')
         return False
 
+# Cache de listagens de diretórios no formato {diretorio: (instante da listagem, mtime_ns, conjunto de nomes)}
+_cache_listagens = {}
+_lock_listagens = threading.Lock()
+
+def lista_nomes_cacheada(dir_origem, ttl=60):
+    """
+    Função responsável por retornar o conjunto de nomes de um diretório a partir de uma
+    listagem cacheada. O diretório é listado novamente apenas quando a listagem em cache é
+    mais antiga que o ttl ou quando a data de modificação do diretório é alterada (ex: criação
+    ou remoção de arquivos), verificada através de uma única chamada stat
+
+    Parâmetros
+    ----------
+    :param dir_origem: caminho do diretório [type: string]
+    :param ttl: tempo máximo (em segundos) de reaproveitamento da listagem [type: float, default=60]
+
+    Retorno
+    -------
+    :return nomes: conjunto de nomes presentes no diretório [type: frozenset]
+    """
+
+    chave = os.path.abspath(dir_origem)
+    mtime_ns = os.stat(chave).st_mtime_ns
+    agora = time.monotonic()
+    with _lock_listagens:
+        cache = _cache_listagens.get(chave)
+    if cache is not None and agora - cache[0] < ttl and cache[1] == mtime_ns:
+        return cache[2]
+
+    nomes = frozenset(os.listdir(chave))
+    with _lock_listagens:
+        _cache_listagens[chave] = (agora, mtime_ns, nomes)
+    return nomes
+
+def limpa_cache_listagens():
+    """
+    Função responsável por descartar as listagens de diretórios em cache
+    """
+
+    with _lock_listagens:
+        _cache_listagens.clear()
+
+def valida_arquivos_origem(dir_origem, nomes_arquivos, ttl=60):
+    """
+    Função responsável por validar a presença de múltiplos arquivos em um mesmo diretório
+    origem a partir de uma única listagem do diretório, convertida em conjunto. A listagem
+    é reaproveitada entre chamadas sucessivas (ex: monitoramento periódico de um diretório)
+    enquanto não expirar o ttl e o diretório não for modificado
+
+    Parâmetros
+    ----------
+    :param dir_origem: caminho do diretório origem alvo da validação [type: string]
+    :param nomes_arquivos: nomes dos arquivos (com extensão) a serem validados [type: list]
+    :param ttl: tempo máximo (em segundos) de reaproveitamento da listagem [type: float, default=60]
+
+    Retorno
+    -------
+    :return presenca: dicionário no formato {nome_arquivo: flag de presença} [type: dict]
+
+    Aplicação
+    ---------
+    # Verificando arquivos em diretório
+    presenca = valida_arquivos_origem(dir_origem='/mnt/feeds', nomes_arquivos=['a.txt', 'b.txt'])
+    if all(presenca.values()):
+        doSomething()
+    """
+
+    # Listando diretório origem (ou reaproveitando listagem em cache)
+    try:
+        nomes = lista_nomes_cacheada(dir_origem, ttl=ttl)
+    except NotADirectoryError as e:
+        logger.error(f'Parâmetro origem {dir_origem} não é um diretório de rede. Exception lançada: {e}')
+        return {nome: False for nome in nomes_arquivos}
+    except FileNotFoundError as e:
+        logger.error(f'Diretório origem {dir_origem} não encontrado. Exception lançada: {e}')
+        return {nome: False for nome in nomes_arquivos}
+
+    presenca = {nome: nome in nomes for nome in nomes_arquivos}
+    ausentes = [nome for nome, presente in presenca.items() if not presente]
+    if ausentes:
+        logger.warning(f'{len(ausentes)} de {len(presenca)} arquivos não presentes na origem {dir_origem}: {ausentes[:10]}')
+    else:
+        logger.info(f'Todos os {len(presenca)} arquivos presentes na origem {dir_origem}')
+
+    return presenca
+
 def valida_dt_mod_arquivo(dir_origem, nome_arquivo, janela, dt_valida):
     """
     Função responsável por validar a presença e a última data de execução
@@ -234,276 +644,1630 @@ def valida_dt_mod_arquivo(dir_origem, nome_arquivo, janela, dt_valida):
         logger.error(f'Falha no casting do argumento dt_valida ({dt_valida}) para inteiro. Insira um valor do tipo int para este parâmetro')
         return  
 
-    # Validando sinergia entre os argumentos janela e dt_valida
-    qtd_data = len(str(dt_valida))
-    if (janela == 'ano' and qtd_data != 4) or (janela == 'anomes' and qtd_data != 6) or (janela == 'anomesdia' == qtd_data != 8):
-        logger.error(f'Argumentos "janela" ({janela}) e "dt_valida" ({dt_valida}) não se conversam. Impossível aplicar validação.')
-        return
+    # Validando sinergia entre os argumentos janela e dt_valida
+    qtd_data = len(str(dt_valida))
+    if (janela == 'ano' and qtd_data != 4) or (janela == 'anomes' and qtd_data != 6) or (janela == 'anomesdia' == qtd_data != 8):
+        logger.error(f'Argumentos "janela" ({janela}) e "dt_valida" ({dt_valida}) não se conversam. Impossível aplicar validação.')
+        return
+
+    # Definindo mensagens
+    msg_ok = f'A última modificação do arquivo {nome_arquivo} é igual ou superior a do validador ({janela}: {dt_valida})'
+    msg_nok = f'A última modificação do arquivo {nome_arquivo} (placeholder) é inferior a do validador ({dt_valida})'
+
+    # Validando presença do arquivo na origem e coletando última data de modificação
+    try:
+        file_mod_date = os.path.getmtime(os.path.join(dir_origem, nome_arquivo))
+
+        # Janela selecionada: ano
+        if janela == 'ano':
+            ano_mod = int(time.strftime('%Y', time.localtime(file_mod_date)))
+            if dt_valida >= ano_mod:
+                logger.info(msg_ok)
+                return True
+            else:
+                logger.warning(msg_nok.replace('placeholder', str(ano_mod)))
+                return False
+
+        # Janela selecionada: anomes
+        elif janela == 'anomes':
+            anomes_mod = int(time.strftime('%Y%m', time.localtime(file_mod_date)))
+            if dt_valida >= anomes_mod:
+                logger.info(msg_ok)
+                return True
+            else:
+                logger.warning(msg_nok.replace('placeholder', str(anomes_mod)))
+                return False
+
+        # Janela selecionada: anomesdida
+        elif janela == 'anomesdia':
+            anomesdia_mod = int(time.strftime('%Y%m%d', time.localtime(file_mod_date)))
+            if dt_valida >= anomesdia_mod:
+                logger.info(msg_ok)
+                return True
+            else:
+                logger.warning(msg_nok.replace('placeholder', str(anomesdia_mod)))
+                return False     
+    except FileNotFoundError as e:
+        logger.error(f'Arquivo {nome_arquivo} não encontrado na origem. Exception lançada: {e}')
+        return False
+
+# Fatores de truncamento de datas no formato aaaammdd para cada janela de validação
+DIVISORES_JANELA = {'ano': 10000, 'anomes': 100, 'anomesdia': 1}
+
+def valida_argumentos_janela(janela, dt_valida):
+    """
+    Função responsável por validar os argumentos de janela de validação e o validador
+    correspondente, registrando as inconsistências encontradas
+
+    Parâmetros
+    ----------
+    :param janela: referência sobre janela de validação ('ano', 'anomes' ou 'anomesdia') [type: string]
+    :param dt_valida: valor relacionado a janela de validação [type: int]
+
+    Retorno
+    -------
+    :return dt_valida: validador convertido para inteiro ou None em caso de argumentos inválidos [type: int]
+    """
+
+    if janela not in DIVISORES_JANELA:
+        logger.error(f'Janela {janela} inválida. Deve estar entre "ano", "anomes" ou "anomesdia" para validação do arquivo.')
+        return
+    try:
+        dt_valida = int(dt_valida)
+    except Exception as e:
+        logger.error(f'Falha no casting do argumento dt_valida ({dt_valida}) para inteiro. Insira um valor do tipo int para este parâmetro')
+        return
+    if len(str(dt_valida)) != {'ano': 4, 'anomes': 6, 'anomesdia': 8}[janela]:
+        logger.error(f'Argumentos "janela" ({janela}) e "dt_valida" ({dt_valida}) não se conversam. Impossível aplicar validação.')
+        return
+
+    return dt_valida
+
+def inicio_janela_ns(dt_valida, tz=None):
+    """
+    Função responsável por retornar o instante de início (epoch em nanosegundos) do período
+    representado por um validador no formato aaaa, aaaamm ou aaaammdd
+
+    Parâmetros
+    ----------
+    :param dt_valida: validador da janela (ex: 2021, 202104 ou 20210401) [type: int]
+    :param tz: fuso horário de referência [type: string, default=None (fuso local)]
+
+    Retorno
+    -------
+    :return epoch_ns: início do período em nanosegundos [type: int]
+    """
+
+    texto = str(dt_valida)
+    ano, mes, dia = int(texto[:4]), int(texto[4:6] or 1), int(texto[6:8] or 1)
+    if tz is None:
+        return int(time.mktime((ano, mes, dia, 0, 0, 0, 0, 0, -1))) * 10**9
+    return pd.Timestamp(year=ano, month=mes, day=dia).tz_localize(tz).value
+
+def datas_para_inteiros(datas, janela='anomesdia'):
+    """
+    Função responsável por converter datas para inteiros no formato da janela de validação
+    (aaaa, aaaamm ou aaaammdd) através de aritmética inteira sobre as próprias datas, sem
+    formatação em texto
+
+    Parâmetros
+    ----------
+    :param datas: datas a serem convertidas [type: np.array[datetime64]]
+    :param janela: janela de validação ('ano', 'anomes' ou 'anomesdia') [type: string, default='anomesdia']
+
+    Retorno
+    -------
+    :return dt_inteiros: datas no formato da janela [type: np.array[int64]]
+    """
+
+    datas = np.asarray(datas, dtype='datetime64[ns]')
+    meses = datas.astype('datetime64[M]')
+    ano = meses.astype('int64') // 12 + 1970
+    mes = meses.astype('int64') % 12 + 1
+    dia = (datas.astype('datetime64[D]') - meses.astype('datetime64[D]')).astype('int64') + 1
+
+    return (ano * 10000 + mes * 100 + dia) // DIVISORES_JANELA[janela]
+
+def valida_dt_mod_arquivos(arquivos, janela='anomesdia', dt_valida=None, workers=8, tz=None):
+    """
+    Função responsável por validar a presença e a última data de modificação de múltiplos
+    arquivos em relação a uma mesma janela temporal. Os argumentos são validados uma única
+    vez, as chamadas stat são executadas em um pool de threads e as datas de modificação são
+    convertidas para o formato da janela de forma vetorizada, com aritmética inteira.
+
+    Um arquivo é considerado válido quando está presente e sua última modificação é igual
+    ou superior ao validador (ex: modificado no mês 202104 ou posterior para dt_valida=202104)
+
+    Parâmetros
+    ----------
+    :param arquivos: lista de caminhos completos ou padrão glob (ex: '/mnt/feeds/*.csv') [type: list or string]
+    :param janela: referência sobre janela de validação [type: string, default='anomesdia']
+            *opções: 'ano', 'anomes' ou 'anomesdia'
+    :param dt_valida: valor relacionado a janela de validação [type: int, default=None (data atual)]
+            *opções: números no formato 'yyyy', 'yyyyMM' ou 'yyyyMMdd' de acordo com a janela fornecida
+    :param workers: quantidade de threads para as chamadas stat [type: int, default=8]
+    :param tz: fuso horário de referência das datas [type: string, default=None (fuso local)]
+
+    Retorno
+    -------
+    :return df_validacao: tabela com as colunas arquivo, presente, dt_ult_modif, dt_mod (no formato
+            da janela) e valido [type: pd.DataFrame]
+
+    Aplicação
+    ---------
+    # Verificando atualização dos arquivos de um diretório
+    df_validacao = valida_dt_mod_arquivos('/mnt/feeds/*.csv', janela='anomes', dt_valida=202104)
+    if df_validacao['valido'].all():
+        doSomething()
+    """
+
+    # Validando janela e validador
+    if janela in DIVISORES_JANELA and dt_valida is None:
+        dt_valida = int(datas_para_inteiros(epoch_para_datetime([time.time_ns()], tz=tz), janela)[0])
+    dt_valida = valida_argumentos_janela(janela, dt_valida)
+    if dt_valida is None:
+        return
+
+    # Coletando datas de modificação em paralelo (-1 para arquivos ausentes)
+    arquivos = sorted(glob.glob(arquivos)) if isinstance(arquivos, str) else list(arquivos)
+
+    def mtime_ns(caminho):
+        try:
+            return os.stat(caminho).st_mtime_ns
+        except OSError:
+            return -1
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        mtimes = np.fromiter(pool.map(mtime_ns, arquivos), dtype='int64', count=len(arquivos))
+
+    # Convertendo datas e aplicando validação
+    presente = mtimes >= 0
+    dt_ult_modif = np.full(len(arquivos), np.datetime64('NaT'), dtype='datetime64[ns]')
+    dt_ult_modif[presente] = epoch_para_datetime(mtimes[presente], tz=tz)
+    dt_mod = np.zeros(len(arquivos), dtype='int64')
+    dt_mod[presente] = datas_para_inteiros(dt_ult_modif[presente], janela)
+    df_validacao = pd.DataFrame({
+        'arquivo': arquivos,
+        'presente': presente,
+        'dt_ult_modif': dt_ult_modif,
+        'dt_mod': pd.Series(dt_mod, dtype='Int64').where(presente),
+        'valido': presente & (dt_mod >= dt_valida)
+    })
+
+    qtd_validos = int(df_validacao['valido'].sum())
+    if qtd_validos == len(df_validacao):
+        logger.info(f'Todos os {qtd_validos} arquivos atualizados em relação ao validador ({janela}: {dt_valida})')
+    else:
+        logger.warning(f'{len(df_validacao) - qtd_validos} de {len(df_validacao)} arquivos ausentes ou com última '
+                       f'modificação inferior ao validador ({janela}: {dt_valida})')
+
+    return df_validacao
+
+def _argumentos_espera(dir_origem, nome_arquivo, janela, dt_valida, tz):
+    # Convertendo janela de validação em data de modificação mínima (False para argumentos inválidos)
+    caminho = os.path.join(dir_origem, nome_arquivo)
+    if janela is None:
+        return caminho, None
+    dt_valida = valida_argumentos_janela(janela, dt_valida)
+    if dt_valida is None:
+        return caminho, False
+    return caminho, inicio_janela_ns(dt_valida, tz=tz)
+
+def aguarda_arquivo_origem(dir_origem, nome_arquivo, timeout=None, estabilidade=2.0, janela=None, dt_valida=None,
+                           tz=None, intervalo=1.0):
+    """
+    Função responsável por aguardar a chegada de um arquivo em um diretório origem,
+    substituindo laços de espera em torno de valida_arquivo_origem() e valida_dt_mod_arquivo().
+    Em sistemas Linux, a espera é orientada a eventos (inotify), sem consumo de CPU e sem a
+    latência de um intervalo de polling; nos demais sistemas, o arquivo é verificado a cada
+    intervalo segundos. O arquivo é considerado disponível quando permanece sem alterações
+    durante o período de estabilidade e, opcionalmente, quando sua data de modificação
+    atinge a janela de validação
+
+    Parâmetros
+    ----------
+    :param dir_origem: caminho do diretório origem [type: string]
+    :param nome_arquivo: nome do arquivo (com extensão) aguardado [type: string]
+    :param timeout: tempo máximo de espera em segundos [type: float, default=None (sem limite)]
+    :param estabilidade: tempo (em segundos) sem alterações no arquivo para considerá-lo completo [type: float, default=2.0]
+    :param janela: referência sobre janela de validação [type: string, default=None (sem validação de data)]
+            *opções: 'ano', 'anomes' ou 'anomesdia'
+    :param dt_valida: valor relacionado a janela de validação (ex: 202104) [type: int, default=None]
+    :param tz: fuso horário de referência da janela [type: string, default=None (fuso local)]
+    :param intervalo: intervalo de verificação sem inotify (em segundos) [type: float, default=1.0]
+
+    Retorno
+    -------
+    :return flag: flag indicativo da disponibilidade do arquivo antes do timeout [type: bool]
+
+    Aplicação
+    ---------
+    # Aguardando arquivo do mês corrente por até uma hora
+    if aguarda_arquivo_origem('/mnt/feeds', 'arquivo.csv', timeout=3600, janela='anomes', dt_valida=202104):
+        doSomething()
+    """
+
+    caminho, mtime_minimo_ns = _argumentos_espera(dir_origem, nome_arquivo, janela, dt_valida, tz)
+    if mtime_minimo_ns is False:
+        return False
+
+    logger.debug(f'Aguardando arquivo {nome_arquivo} na origem {dir_origem}')
+    if aguarda_arquivo(caminho, timeout=timeout, estabilidade=estabilidade, mtime_minimo_ns=mtime_minimo_ns,
+                       intervalo=intervalo):
+        logger.info(f'Arquivo {nome_arquivo} disponível na origem {dir_origem}')
+        return True
+    logger.warning(f'Arquivo {nome_arquivo} não disponível na origem {dir_origem} após {timeout} segundos')
+    return False
+
+async def aguarda_arquivo_origem_async(dir_origem, nome_arquivo, timeout=None, estabilidade=2.0, janela=None,
+                                       dt_valida=None, tz=None, intervalo=1.0):
+    """
+    Versão assíncrona de aguarda_arquivo_origem(), permitindo aguardar múltiplos arquivos em
+    um mesmo event loop com uma única instância inotify
+
+    Parâmetros
+    ----------
+    Os mesmos parâmetros de aguarda_arquivo_origem()
+
+    Retorno
+    -------
+    :return flag: flag indicativo da disponibilidade do arquivo antes do timeout [type: bool]
+
+    Aplicação
+    ---------
+    nomes = ['a.csv', 'b.csv', 'c.csv']
+    flags = await asyncio.gather(*[aguarda_arquivo_origem_async('/mnt/feeds', nome, timeout=3600) for nome in nomes])
+    """
+
+    caminho, mtime_minimo_ns = _argumentos_espera(dir_origem, nome_arquivo, janela, dt_valida, tz)
+    if mtime_minimo_ns is False:
+        return False
+
+    logger.debug(f'Aguardando arquivo {nome_arquivo} na origem {dir_origem}')
+    if await aguarda_arquivo_async(caminho, timeout=timeout, estabilidade=estabilidade,
+                                   mtime_minimo_ns=mtime_minimo_ns, intervalo=intervalo):
+        logger.info(f'Arquivo {nome_arquivo} disponível na origem {dir_origem}')
+        return True
+    logger.warning(f'Arquivo {nome_arquivo} não disponível na origem {dir_origem} após {timeout} segundos')
+    return False
+
+"""
+---------------------------------------------------
+------- 2. VALIDAÇÃO E MANUSEIO DE ARQUIVOS -------
+               2.2 Cópia de Arquivos
+---------------------------------------------------
+"""
+
+def copia_arquivo(origem, destino, valida_presenca=False):
+    """
+    Função responsável por copiar um arquivo definido em uma origem para um destino
+
+    Parâmetros
+    ----------
+    :param origem: definição do arquivo origem (caminho + nome do arquivo) [type: string]
+    :param destino: definição do destino da cópia (caminho + nome do arquivo) [type: string]
+    :param valida_presenca: flag para validar existência do arquivo na origem [type: bool, default=False]
+
+    Retorno
+    -------
+    None
+
+    Aplicação
+    ---------
+    # Copiando arquivo
+    origem = '/home/user/folder/file.txt'
+    destino = '/home/user/new_folder/file.txt'
+    copia_arquivo(origem=origem, destino=destino)
+    """
+
+    # Extraindo informações de diretório e arquivo
+    src_split = os.path.split(origem)
+    src_path = src_split[0]
+    src_filename = src_split[-1]
+    dst_path = os.path.split(destino)[0]
+
+    # Validando presença do arquivo no diretório
+    if valida_presenca and not valida_arquivo_origem(dir_origem=src_path, nome_arquivo=src_filename):
+        logger.error(f'Arquivo {src_filename} inexistente na origem {src_path}')
+        return
+
+    # Verificando se diretório de saída existe
+    if not os.path.isdir(dst_path):
+        logger.warning(f'Diretório {dst_path} inexistente. Criando diretório no local especificado')
+        try:
+            os.makedirs(dst_path)
+        except Exception as e:
+            logger.error(f'Erro ao tentar criar o diretório {dst_path}. Exception lançada: {e}')
+            return
+
+    # Verificando se o arquivo está presente na origem
+    try:
+        shutil.copyfile(src=origem, dst=destino)
+        logger.info(f'Cópia realizada com sucesso. Origem: {origem} - Destino: {destino}')
+    except Exception as e:
+        # Erro ao copiar arquivo pro destino
+        logger.warning(f'Falha ao copiar arquivo. Exception lançada: {e}')
+
+def copia_arquivo_verificado(origem, destino, algoritmo='blake2b', retoma=True, verifica_hash=False,
+                             verifica_destino=False, progresso=None, dir_estado=None):
+    """
+    Função responsável pela cópia de arquivos grandes em blocos, com cálculo de checksum
+    durante a cópia e retomada de cópias interrompidas. A cópia é ignorada quando o destino
+    já corresponde à origem (mesmo tamanho e data de modificação), tornando execuções
+    repetidas de rotinas de sincronização praticamente instantâneas. Nenhum arquivo auxiliar
+    é mantido ao lado do destino após a cópia: os checksums são registrados apenas quando um
+    diretório de estado é informado
+
+    Parâmetros
+    ----------
+    :param origem: definição do arquivo origem (caminho + nome do arquivo) [type: string]
+    :param destino: definição do destino da cópia (caminho + nome do arquivo) [type: string]
+    :param algoritmo: algoritmo de checksum (ex: 'blake2b', 'sha256' ou 'xxh3_64' com o pacote xxhash)
+            [type: string, default='blake2b']
+    :param retoma: flag para retomar cópias interrompidas [type: bool, default=True]
+    :param verifica_hash: flag para comparar os checksums de origem e destino antes de ignorar uma cópia
+            [type: bool, default=False]
+    :param verifica_destino: flag para reler o destino após a cópia e comparar os checksums [type: bool, default=False]
+    :param progresso: função chamada a cada bloco no formato progresso(qtd_copiada, qtd_total) [type: callable, default=None]
+            *uma exceção CopiaCancelada lançada pela função interrompe a cópia e é repassada ao chamador
+    :param dir_estado: diretório de registro dos checksums, dispensando a releitura do destino com
+            verifica_hash=True [type: string, default=None]
+
+    Retorno
+    -------
+    :return resultado: resultado da cópia (origem, destino, sucesso, qtd_bytes, segundos, metodo, erro, checksum)
+            [type: ResultadoCopia]
+
+    Aplicação
+    ---------
+    # Copiando arquivo grande com acompanhamento do progresso
+    resultado = copia_arquivo_verificado(origem='/mnt/origem/base.parquet', destino='/mnt/destino/base.parquet',
+                                         progresso=lambda qtd, total: print(f'{100 * qtd / total:.1f}%'))
+    """
+
+    # Verificando se diretório de saída existe
+    dst_path = os.path.split(destino)[0]
+    if dst_path and not os.path.isdir(dst_path):
+        logger.warning(f'Diretório {dst_path} inexistente. Criando diretório no local especificado')
+        try:
+            os.makedirs(dst_path)
+        except Exception as e:
+            logger.error(f'Erro ao tentar criar o diretório {dst_path}. Exception lançada: {e}')
+            return ResultadoCopia(origem, destino, False, 0, 0.0, None, e)
+
+    try:
+        resultado = copia_verificada(origem, destino, algoritmo=algoritmo, retoma=retoma, verifica_hash=verifica_hash,
+                                     verifica_destino=verifica_destino, progresso=progresso, dir_estado=dir_estado)
+    except CopiaCancelada:
+        raise
+    except Exception as e:
+        logger.error(f'Falha ao copiar arquivo {origem}. Exception lançada: {e}')
+        return ResultadoCopia(origem, destino, False, 0, 0.0, None, e)
+
+    if resultado.metodo == 'ignorado':
+        logger.info(f'Destino {destino} já sincronizado com a origem. Cópia ignorada')
+    else:
+        logger.info(f'Cópia realizada com sucesso ({resultado.metodo}). Origem: {origem} - Destino: {destino} - '
+                    f'{algoritmo}: {resultado.checksum}')
+
+    return resultado
+
+def copia_arquivos(pares, workers=8, valida_presenca=False, verificada=False, dir_estado=None):
+    """
+    Função responsável por copiar múltiplos arquivos a partir de pares (origem, destino).
+    Os diretórios destino são criados uma única vez, as cópias são executadas em um pool
+    de threads e o conteúdo é copiado pelo kernel (os.copy_file_range/os.sendfile) sempre
+    que disponível. Com verificada=True, as cópias são feitas por copia_arquivo_verificado(),
+    ignorando arquivos já sincronizados em execuções anteriores
+
+    Parâmetros
+    ----------
+    :param pares: lista de tuplas (origem, destino) com caminhos completos [type: list]
+    :param workers: quantidade de threads de cópia [type: int, default=8]
+    :param valida_presenca: flag para validar existência do arquivo na origem [type: bool, default=False]
+    :param verificada: flag para cópia retomável com checksum [type: bool, default=False]
+    :param dir_estado: diretório de registro dos checksums das cópias verificadas [type: string, default=None]
+
+    Retorno
+    -------
+    :return resultados: resultado de cada cópia (origem, destino, sucesso, qtd_bytes, segundos, metodo, erro)
+            [type: list of ResultadoCopia]
+    :return estatisticas: quantidades, volume copiado e vazão do lote [type: dict]
+
+    Aplicação
+    ---------
+    # Copiando arquivos
+    pares = [(os.path.join(origem, f), os.path.join(destino, f)) for f in arquivos]
+    resultados, estatisticas = copia_arquivos(pares=pares, workers=16)
+    """
+
+    resultados, estatisticas = copia_lote(pares, workers=workers, valida_presenca=valida_presenca,
+                                          verificada=verificada, dir_estado=dir_estado)
+    for r in resultados:
+        if not r.sucesso:
+            logger.warning(f'Falha ao copiar arquivo {r.origem}. Exception lançada: {r.erro}')
+    logger.info(f'Cópia em lote finalizada: {estatisticas["qtd_sucesso"]} de {estatisticas["qtd_arquivos"]} arquivos '
+                f'({estatisticas["mb_por_segundo"]:.1f} MB/s)')
+
+    return resultados, estatisticas
+
+
+"""
+---------------------------------------------------
+------------ 3. CONTROLE DE DIRETÓRIOS ------------
+        3.1 Visão analítica de diretório
+---------------------------------------------------
+"""
+
+# Função para conversão vetorizada de timestamps
+def epoch_para_datetime(epochs_ns, tz=None):
+    """
+    Função responsável por converter timestamps epoch (em nanosegundos) para datas no
+    horário local de um fuso horário, de forma vetorizada e sem perda de precisão
+
+    Parâmetros
+    ----------
+    :param epochs_ns: timestamps epoch em nanosegundos (ex: st_mtime_ns) [type: list or np.array]
+    :param tz: fuso horário de referência das datas [type: string, default=None]
+            *None utiliza o fuso horário local da máquina; demais opções seguem o padrão IANA
+             (ex: 'UTC', 'America/Sao_Paulo')
+
+    Retorno
+    -------
+    :return datas: datas no horário local do fuso de referência (sem tz) [type: np.array[datetime64[ns]]]
+
+    Aplicação
+    ---------
+    dt_ult_modif = epoch_para_datetime([os.stat(caminho).st_mtime_ns], tz='UTC')
+    """
+
+    epochs_ns = np.asarray(epochs_ns, dtype='int64')
+    if tz is not None:
+        datas = pd.to_datetime(epochs_ns, unit='ns', utc=True).tz_convert(tz).tz_localize(None)
+        return np.asarray(datas, dtype='datetime64[ns]')
+
+    # Fuso local: offsets aplicados a partir das transições de fuso encontradas nos dias das datas
+    if len(epochs_ns) == 0:
+        return epochs_ns.view('datetime64[ns]')
+    epochs_s = epochs_ns // 10**9
+    transicoes, offsets = transicoes_fuso_local(epochs_s)
+    idx = np.searchsorted(transicoes, epochs_s, side='right') - 1
+
+    return (epochs_ns + offsets[idx] * 10**9).view('datetime64[ns]')
+
+# Quantidade máxima de dias entre a menor e a maior data para marcação dos dias presentes em um array booleano
+MAX_DIAS_INTERVALO = 10**7
+
+# Função para mapeamento das transições do fuso horário local
+def transicoes_fuso_local(epochs_s):
+    """
+    Função responsável por mapear os instantes (epoch, em segundos) em que o offset do
+    fuso horário local é alterado (ex: horário de verão) nos dias em que há registros.
+    O offset é consultado apenas no início e no fim de cada dia presente nos registros
+    e refinado em janelas de 15 minutos nos dias com alteração, de modo que datas
+    isoladas (ex: arquivos com data epoch 0) não ampliam a quantidade de consultas ao
+    intervalo completo entre a menor e a maior data
+
+    Parâmetros
+    ----------
+    :param epochs_s: instantes dos registros (epoch em segundos) [type: np.array]
+
+    Retorno
+    -------
+    :return transicoes: instantes de início de vigência de cada offset (válidos para os dias presentes
+        nos registros) [type: np.array]
+    :return offsets: offset (em segundos) vigente a partir de cada transição [type: np.array]
+    """
+
+    dias = np.asarray(epochs_s, dtype='int64') // 86400
+    if len(dias) == 0:
+        return np.empty(0, dtype='int64'), np.empty(0, dtype='int64')
+
+    # Dias presentes marcados sobre o intervalo de dias (sem ordenação dos registros), com np.unique()
+    # apenas para intervalos muito extensos
+    dia_min, dia_max = int(dias.min()), int(dias.max())
+    if dia_max - dia_min < MAX_DIAS_INTERVALO:
+        presentes = np.zeros(dia_max - dia_min + 1, dtype=bool)
+        presentes[dias - dia_min] = True
+        dias = (np.flatnonzero(presentes) + dia_min) * 86400
+    else:
+        dias = np.unique(dias) * 86400
+    offsets_limite = {int(instante): time.localtime(int(instante)).tm_gmtoff
+                      for instante in np.union1d(dias, dias + 86400)}
+
+    # Início de cada dia presente registrado apenas quando o offset difere do vigente (os instantes
+    # consultados pertencem sempre a dias presentes, onde o offset anterior permanece válido)
+    transicoes, offsets = [], []
+    for dia in dias.tolist():
+        if not offsets or offsets_limite[dia] != offsets[-1]:
+            transicoes.append(dia)
+            offsets.append(offsets_limite[dia])
+        if offsets_limite[dia + 86400] != offsets_limite[dia]:
+            for instante in range(dia + 900, dia + 86400, 900):
+                offset = time.localtime(instante).tm_gmtoff
+                if offset != offsets[-1]:
+                    transicoes.append(instante)
+                    offsets.append(offset)
+
+    return np.array(transicoes, dtype='int64'), np.array(offsets, dtype='int64')
+
+# Função para codificação de colunas categóricas
+def codifica_categorias(codigos, categorias):
+    """
+    Função responsável por construir uma coluna categórica a partir de códigos inteiros
+    e de suas categorias, reordenando as categorias alfabeticamente (garantindo que
+    ordenações pela coluna sigam a ordem dos valores) e unificando categorias repetidas
+
+    Parâmetros
+    ----------
+    :param codigos: código da categoria de cada linha [type: np.array]
+    :param categorias: valores associados a cada código [type: list]
+
+    Retorno
+    -------
+    :return coluna: coluna categórica [type: pd.Categorical]
+    """
+
+    valores, remapeamento = np.unique(np.asarray(categorias, dtype=object), return_inverse=True)
+    return pd.Categorical.from_codes(remapeamento.reshape(-1)[codigos], categories=valores)
+
+# Função para conversão dos metadados colunares no report de controle
+def colunas_para_dataframe(colunas, tz=None, grupo_owner=False, dt_relatorio=None, links_vistos=None):
+    """
+    Função responsável por converter os metadados coletados na varredura (em formato
+    colunar) nas colunas do report de controle de diretório. Os arrays numéricos são
+    lidos sem cópia e as colunas diretorio e usuario_owner são retornadas como
+    categóricas, armazenando cada valor distinto uma única vez
+
+    Além do tamanho lógico (tamanho_kb), o report contém o espaço físico ocupado
+    (tamanho_fisico_kb, a partir de st_blocks), no qual cada arquivo com múltiplos
+    hard links é contabilizado apenas na primeira ocorrência de seu (st_dev, st_ino)
+
+    Parâmetros
+    ----------
+    :param colunas: metadados coletados na varredura [type: filescope.scanner.ColunasVarredura]
+    :param tz: fuso horário das colunas de data [type: string, default=None (fuso local)]
+    :param grupo_owner: flag para inclusão da coluna grupo_owner [type: bool, default=False]
+    :param dt_relatorio: data de referência do report [type: np.datetime64, default=None (data atual)]
+    :param links_vistos: chaves (st_dev, st_ino) de hard links já contabilizados em lotes anteriores,
+            atualizado pela função [type: set, default=None]
+
+    Retorno
+    -------
+    :return df: report de controle sem o score filescope [type: pd.DataFrame]
+
+    Aplicação
+    ---------
+    colunas = coleta_colunas(varre_diretorio(root='/home/user/folder/'))
+    df = colunas_para_dataframe(colunas)
+    """
+
+    # Lendo arrays da varredura sem cópia
+    cod_diretorio = np.frombuffer(colunas.cod_diretorio, dtype='int64')
+    tamanhos = np.frombuffer(colunas.tamanhos, dtype='int64')
+    alocados = np.frombuffer(colunas.alocados, dtype='int64')
+    uids = np.frombuffer(colunas.uids, dtype='int64')
+
+    # Hard links: apenas a primeira ocorrência de cada (st_dev, st_ino) ocupa espaço físico
+    if colunas.links:
+        alocados = alocados.copy()
+        vistos = links_vistos if links_vistos is not None else set()
+        for posicao, chave in colunas.links.items():
+            if chave in vistos:
+                alocados[posicao] = 0
+            else:
+                vistos.add(chave)
+
+    # Resolvendo nomes de usuários (e grupos) apenas para os ids distintos encontrados
+    logger.debug('Resolvendo usuários owners dos arquivos')
+    uids_distintos, cod_uids = np.unique(uids, return_inverse=True)
+    data = {
+        'diretorio': codifica_categorias(cod_diretorio, colunas.diretorios),
+        'arquivo': np.array(colunas.arquivos, dtype=object),
+        'tamanho_kb': tamanhos / 1000,
+        'tamanho_fisico_kb': alocados / 1000,
+        'usuario_owner': codifica_categorias(cod_uids.reshape(-1), [resolve_usuario(int(u)) for u in uids_distintos])
+    }
+    if grupo_owner:
+        gids_distintos, cod_gids = np.unique(np.frombuffer(colunas.gids, dtype='int64'), return_inverse=True)
+        data['grupo_owner'] = codifica_categorias(cod_gids.reshape(-1), [resolve_grupo(int(g)) for g in gids_distintos])
+
+    # Construindo datas e indicadores de utilização de forma vetorizada
+    if dt_relatorio is None:
+        dt_relatorio = epoch_para_datetime([time.time_ns()], tz=tz)[0]
+    date_cols = [('dt_criacao', 'dias_desde_criacao', colunas.ctime_ns),
+                 ('dt_ult_modif', 'dias_desde_ult_modif', colunas.mtime_ns),
+                 ('dt_ult_acesso', 'dias_desde_ult_acesso', colunas.atime_ns)]
+    for dt_col, dias_col, epochs_ns in date_cols:
+        datas = epoch_para_datetime(np.frombuffer(epochs_ns, dtype='int64'), tz=tz)
+        data[dt_col] = datas
+        data[dias_col] = (dt_relatorio - datas) // np.timedelta64(1, 'D')
+    data['dt_relatorio'] = np.full(len(colunas), dt_relatorio)
+
+    return pd.DataFrame(data, copy=False)
+
+# Colunas utilizadas no cálculo do score filescope
+SCORE_COLS = ['tamanho_kb', 'dias_desde_criacao', 'dias_desde_ult_modif', 'dias_desde_ult_acesso']
+
+# Colunas de tamanho disponíveis para o score e as visões gráficas (lógico ou físico)
+COLUNAS_TAMANHO = ['tamanho_kb', 'tamanho_fisico_kb']
+
+# Validação da coluna de tamanho
+def valida_col_tamanho(col_tamanho):
+    if col_tamanho not in COLUNAS_TAMANHO:
+        logger.error(f'Coluna de tamanho {col_tamanho} inválida. Deve estar entre {COLUNAS_TAMANHO}.')
+        return False
+    return True
+
+# Fórmulas disponíveis para o score filescope
+FORMULAS_SCORE = ['produto', 'soma', 'geometrica']
+
+# Função para cálculo vetorizado do score filescope
+def calcula_score(colunas, pesos, formula='produto', log_tamanho=False, clip_quantis=None):
+    """
+    Função responsável por calcular o score filescope a partir das colunas numéricas do
+    report (na ordem de SCORE_COLS), aplicando normalização min-max em cada coluna e no
+    score resultante. O cálculo é feito coluna a coluna com numpy, reutilizando um único
+    array auxiliar e acumulando o score no próprio array de saída
+
+    Colunas sem variação (mínimo igual ao máximo) assumem o valor neutro da fórmula
+    (1 para produto/geometrica e 0 para soma) e um score sem variação resulta em 0 para
+    todos os arquivos, evitando divisões por zero
+
+    Parâmetros
+    ----------
+    :param colunas: colunas de SCORE_COLS (ex: tamanho_kb, dias_desde_criacao...) [type: list of np.array]
+    :param pesos: pesos de cada coluna, na ordem de SCORE_COLS [type: list]
+    :param formula: combinação das colunas normalizadas [type: string, default='produto']
+            *opções: 'produto' (fórmula original, onde os pesos se cancelam), 'soma' (média
+             ponderada) ou 'geometrica' (média geométrica ponderada)
+    :param log_tamanho: flag para aplicar log(1 + x) ao tamanho antes da normalização [type: bool, default=False]
+    :param clip_quantis: quantis inferior e superior para limitar outliers (ex: (0, .99)) [type: tuple, default=None]
+
+    Retorno
+    -------
+    :return score: score filescope de cada arquivo (de 0 a 100) [type: np.array]
+    """
+
+    n = len(colunas[0])
+    if n == 0:
+        return np.empty(0, dtype='float64')
+
+    neutro = 0.0 if formula == 'soma' else 1.0
+    score = np.full(n, neutro, dtype='float64')
+    aux = np.empty(n, dtype='float64')
+    soma_pesos = float(sum(pesos))
+    for i, (coluna, peso) in enumerate(zip(colunas, pesos)):
+        np.copyto(aux, coluna, casting='unsafe')
+
+        # Escala logarítmica do tamanho e limitação de outliers
+        if i == 0 and log_tamanho:
+            np.log1p(aux, out=aux)
+        if clip_quantis is not None:
+            limite_inf, limite_sup = np.quantile(aux, clip_quantis)
+            np.clip(aux, limite_inf, limite_sup, out=aux)
+
+        # Normalizando coluna (colunas sem variação assumem o valor neutro)
+        col_min = aux.min()
+        col_max = aux.max()
+        if col_max > col_min:
+            aux -= col_min
+            aux /= col_max - col_min
+        else:
+            aux.fill(neutro)
+
+        # Acumulando coluna no score
+        if formula == 'soma':
+            aux *= peso / soma_pesos
+            score += aux
+        elif formula == 'geometrica':
+            np.power(aux, peso / soma_pesos, out=aux)
+            score *= aux
+        else:
+            score *= aux
+
+    # Normalizando score
+    score_min = score.min()
+    score_max = score.max()
+    if score_max > score_min:
+        score -= score_min
+        score /= score_max - score_min
+        score *= 100
+    else:
+        score.fill(0.0)
+
+    return score
+
+# Função para cálculo do score filescope
+def calc_filescope_score(df, peso_tkb=2, peso_ddc=1, peso_dda=2, peso_ddm=1, formula='produto', log_tamanho=False,
+                         clip_quantis=None, col_tamanho='tamanho_kb'):
+    """
+    Função responsável por calcular o score filescope baseado em pesos e normalização
+    
+    Parâmetros
+    ----------
+    :param df: report gerado a partir de função controle_de_diretorio() [type: pd.DataFrame]
+    :param peso_tkb: peso do cálculo para o tamanho do arquivo [type: int, default=2]
+    :param peso_ddc: peso do cálculo para dias desde a criação [type: int, default=1]
+    :param peso_dda: peso do cálculo para dias do último acesso [type: int, default=2]
+    :param peso_ddm: peso do cálculo para dias da última modificação [type: int, default=1]
+    :param formula: combinação das colunas normalizadas (ver calcula_score()) [type: string, default='produto']
+    :param log_tamanho: flag para aplicar escala logarítmica ao tamanho [type: bool, default=False]
+    :param clip_quantis: quantis para limitar outliers antes da normalização [type: tuple, default=None]
+    :param col_tamanho: coluna de tamanho utilizada no score ('tamanho_kb' para o tamanho lógico ou
+            'tamanho_fisico_kb' para o espaço físico ocupado) [type: string, default='tamanho_kb']
+    
+    Retorno
+    -------
+    :return df: base de dados com score filescope calculado [type: pd.DataFrame]
+    """
+
+    # Validando fórmula do score
+    if formula not in FORMULAS_SCORE:
+        logger.error(f'Fórmula {formula} inválida. Deve estar entre {FORMULAS_SCORE} para cálculo do score.')
+        return df
+    if not valida_col_tamanho(col_tamanho):
+        return df
+
+    # Calculando score e atribuindo por posição (linhas alinhadas com a base)
+    colunas = [df[col_tamanho if col == 'tamanho_kb' else col].to_numpy() for col in SCORE_COLS]
+    df['filescope_score'] = calcula_score(colunas, pesos=[peso_tkb, peso_ddc, peso_ddm, peso_dda], formula=formula,
+                                          log_tamanho=log_tamanho, clip_quantis=clip_quantis)
+
+    return df
+
+# Função para cálculo do score filescope em lotes
+def score_em_lotes(lotes, peso_tkb=2, peso_ddc=1, peso_dda=2, peso_ddm=1, formula='produto', log_tamanho=False,
+                   clip_quantis=None, spill_dir=None, col_tamanho='tamanho_kb'):
+    """
+    Função responsável por calcular o score filescope sobre lotes de uma varredura (ex:
+    iter_scan()), sem a necessidade de concatenar a base completa. Em uma primeira passagem,
+    apenas as quatro colunas numéricas do score são acumuladas (32 bytes por arquivo); o
+    score é então calculado de forma vetorizada e, em uma segunda passagem, atribuído por
+    posição a cada lote. Os lotes são gravados temporariamente em disco (spill_dir) durante
+    a primeira passagem e relidos na segunda, mantendo em memória apenas um lote por vez;
+    com spill_dir=False, os lotes são mantidos em memória entre as passagens (indicado
+    apenas para lotes que já estão em memória, como uma lista de DataFrames)
+
+    Parâmetros
+    ----------
+    :param lotes: iterável de DataFrames com as colunas de SCORE_COLS [type: iterable]
+    :param peso_tkb: peso do cálculo para o tamanho do arquivo [type: int, default=2]
+    :param peso_ddc: peso do cálculo para dias desde a criação [type: int, default=1]
+    :param peso_dda: peso do cálculo para dias do último acesso [type: int, default=2]
+    :param peso_ddm: peso do cálculo para dias da última modificação [type: int, default=1]
+    :param formula: combinação das colunas normalizadas (ver calcula_score()) [type: string, default='produto']
+    :param log_tamanho: flag para aplicar escala logarítmica ao tamanho [type: bool, default=False]
+    :param clip_quantis: quantis para limitar outliers antes da normalização [type: tuple, default=None]
+    :param spill_dir: diretório para gravação temporária dos lotes ou False para mantê-los em memória
+            [type: string or bool, default=None (diretório temporário do sistema)]
+    :param col_tamanho: coluna de tamanho utilizada no score (ver calc_filescope_score()) [type: string, default='tamanho_kb']
+
+    Retorno
+    -------
+    :yields df_lote: lote com a coluna filescope_score calculada sobre a base completa [type: pd.DataFrame]
+
+    Aplicação
+    ---------
+    lotes = iter_scan(root='/mnt/share', batch_size=100000)
+    for df_lote in score_em_lotes(lotes):
+        df_lote.to_csv('controle.csv', mode='a', index=False)
+    """
+
+    # Validando fórmula do score
+    if formula not in FORMULAS_SCORE:
+        logger.error(f'Fórmula {formula} inválida. Deve estar entre {FORMULAS_SCORE} para cálculo do score.')
+        return
+    if not valida_col_tamanho(col_tamanho):
+        return
+
+    # Criando diretório de gravação temporária dos lotes
+    if spill_dir and not os.path.isdir(spill_dir):
+        logger.warning(f'Diretório {spill_dir} inexistente. Criando diretório no local especificado')
+        os.makedirs(spill_dir, exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix='filescope_', dir=spill_dir) if spill_dir is not False else None
+    try:
+        # Primeira passagem: acumulando colunas numéricas (e gravando lotes em disco)
+        valores = []
+        armazenados = []
+        for i, df_lote in enumerate(lotes):
+            valores.append([df_lote[col_tamanho if col == 'tamanho_kb' else col].to_numpy(dtype='float64')
+                            for col in SCORE_COLS])
+            if tmp is not None:
+                arquivo_lote = os.path.join(tmp, f'lote_{i}.pkl')
+                df_lote.to_pickle(arquivo_lote)
+                armazenados.append(arquivo_lote)
+            else:
+                armazenados.append(df_lote)
+            del df_lote
+
+        # Calculando score para a base completa
+        if len(valores) == 0:
+            return
+        colunas = [np.concatenate([lote[i] for lote in valores]) for i in range(len(SCORE_COLS))]
+        del valores
+        score = calcula_score(colunas, pesos=[peso_tkb, peso_ddc, peso_ddm, peso_dda], formula=formula,
+                              log_tamanho=log_tamanho, clip_quantis=clip_quantis)
+        del colunas
+
+        # Segunda passagem: atribuindo score por posição a cada lote
+        armazenados.reverse()
+        inicio = 0
+        while armazenados:
+            df_lote = armazenados.pop()
+            if tmp is not None:
+                arquivo_lote = df_lote
+                df_lote = pd.read_pickle(arquivo_lote)
+                os.remove(arquivo_lote)
+            fim = inicio + len(df_lote)
+            if 'filescope_score' in df_lote.columns:
+                df_lote = df_lote.drop('filescope_score', axis=1)
+            df_lote['filescope_score'] = score[inicio:fim]
+            inicio = fim
+            yield df_lote
+    finally:
+        if tmp is not None:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+# Função para validação dos argumentos de varredura
+def valida_backend(backend, workers):
+    """
+    Função responsável por validar a combinação entre backend de varredura e quantidade de threads
+
+    Parâmetros
+    ----------
+    :param backend: motor de varredura do diretório [type: string]
+    :param workers: quantidade de threads da varredura [type: int]
+
+    Retorno
+    -------
+    :return flag: flag indicativo da validade dos argumentos [type: bool]
+    """
+
+    if backend not in BACKENDS:
+        logger.error(f'Backend {backend} inválido. Deve estar entre {BACKENDS} para varredura do diretório.')
+        return False
+    if workers > 1 and backend != 'scandir':
+        logger.error(f'Varredura paralela (workers={workers}) disponível apenas para o backend scandir.')
+        return False
+
+    return True
+
+# Função para registro de falhas pontuais na leitura de arquivos e diretórios
+def log_falha_varredura(e):
+    logger.warning(f'Falha ao coletar metadados durante a varredura. Exception lançada: {e}')
+
+# Varredura de diretório em lotes
+def iter_scan(root, batch_size=100000, backend='scandir', workers=1, grupo_owner=False, tz=None, indice=None,
+              verifica_arquivos=False, dt_relatorio=None, rollup=None):
+    """
+    Função responsável por varrer um diretório retornando os arquivos encontrados em lotes
+    à medida que a varredura avança. Cada lote é um DataFrame com as colunas do report de
+    controle de diretório (exceto o score filescope, que depende da base completa), o que
+    permite gravar, filtrar ou agregar os resultados com consumo de memória constante
+
+    Parâmetros
+    ----------
+    :param root: caminho do diretório a ser analisado [type: string]
+    :param batch_size: quantidade máxima de arquivos por lote [type: int, default=100000]
+            *None retorna um único lote com todos os arquivos
+    :param backend: motor de varredura do diretório [type: string, default='scandir']
+    :param workers: quantidade de threads para varredura paralela dos subdiretórios [type: int, default=1]
+    :param grupo_owner: flag para inclusão da coluna grupo_owner [type: bool, default=False]
+    :param tz: fuso horário das colunas de data [type: string, default=None (fuso local)]
+    :param indice: caminho do índice SQLite para varredura incremental [type: string, default=None]
+    :param verifica_arquivos: flag para verificar via stat os arquivos de diretórios inalterados
+            na varredura incremental [type: bool, default=False]
+    :param dt_relatorio: data de referência do report [type: np.datetime64, default=None (data atual)]
+    :param rollup: consolidação por diretórios alimentada com cada lote gerado [type: RollupDiretorios, default=None]
+
+    Retorno
+    -------
+    :yields df_lote: lote de arquivos do report de controle [type: pd.DataFrame]
+            *ao menos um lote (eventualmente vazio) é retornado para diretórios válidos
+
+    Aplicação
+    ---------
+    for df_lote in iter_scan(root='/home/user/folder/', batch_size=50000):
+        df_lote.query('tamanho_kb > 1e6').to_csv('grandes.csv', mode='a', header=False, index=False)
+    """
+
+    # Validando backend de varredura
+    if not valida_backend(backend, workers):
+        return
+
+    # Varredura incremental: atualizando índice e percorrendo arquivos registrados
+    if indice is not None:
+        if workers > 1:
+            logger.warning(f'A varredura incremental é realizada de forma serial. Argumento workers={workers} ignorado.')
+        logger.debug(f'Atualizando índice {indice} a partir dos diretórios modificados')
+        mudancas = varre_incremental(root, indice, onerror=log_falha_varredura, verifica_arquivos=verifica_arquivos)
+        qtd_tipo = {tipo: sum(1 for m in mudancas if m[0] == tipo) for tipo in ['adicionado', 'modificado', 'removido']}
+        logger.info(f'Varredura incremental concluída. Arquivos adicionados: {qtd_tipo["adicionado"]}, '
+                    f'modificados: {qtd_tipo["modificado"]}, removidos: {qtd_tipo["removido"]}')
+        registros = le_arquivos(root, indice)
+        metodo = 'adiciona_valores'
+
+    # Iterando sobre todos os arquivos do diretório e subdiretórios (uma chamada stat por arquivo)
+    else:
+        logger.debug('Iterando sobre os arquivos do diretório root')
+        registros = varre_diretorio(root, backend=backend, onerror=log_falha_varredura, workers=workers)
+        metodo = 'adiciona'
+
+    # Acumulando registros em colunas e convertendo cada lote completo
+    if dt_relatorio is None:
+        dt_relatorio = epoch_para_datetime([time.time_ns()], tz=tz)[0]
+    colunas = ColunasVarredura()
+    adiciona = getattr(colunas, metodo)
+    qtd_lotes = 0
+    links_vistos = set()
+    for registro in registros:
+        adiciona(*registro)
+        if batch_size is not None and len(colunas) >= batch_size:
+            df_lote = colunas_para_dataframe(colunas, tz=tz, grupo_owner=grupo_owner, dt_relatorio=dt_relatorio,
+                                             links_vistos=links_vistos)
+            if rollup is not None:
+                rollup.adiciona_lote(df_lote)
+            yield df_lote
+            qtd_lotes += 1
+            colunas = ColunasVarredura()
+            adiciona = getattr(colunas, metodo)
+
+    if len(colunas) > 0 or qtd_lotes == 0:
+        df_lote = colunas_para_dataframe(colunas, tz=tz, grupo_owner=grupo_owner, dt_relatorio=dt_relatorio,
+                                         links_vistos=links_vistos)
+        if rollup is not None:
+            rollup.adiciona_lote(df_lote)
+        yield df_lote
+
+# Concatenando lotes da varredura
+def concatena_lotes(lotes):
+    """
+    Função responsável por concatenar lotes retornados por iter_scan() em uma única base,
+    preservando as colunas categóricas (cujas categorias variam entre lotes)
+
+    Parâmetros
+    ----------
+    :param lotes: lista de lotes da varredura [type: list]
+
+    Retorno
+    -------
+    :return df: base concatenada [type: pd.DataFrame]
+    """
+
+    if len(lotes) == 1:
+        return lotes[0]
+
+    df = pd.concat(lotes, ignore_index=True)
+    for col in lotes[0].select_dtypes(include='category').columns:
+        df[col] = pd.api.types.union_categoricals([lote[col] for lote in lotes], sort_categories=True)
+
+    return df
+
+# Seleção parcial das k primeiras linhas segundo uma coluna
+def top_k(fonte, k, col='filescope_score', ascending=False):
+    """
+    Função responsável por selecionar as k linhas de maior (ou menor, com ascending=True)
+    valor de uma coluna sem ordenar a base completa. Para DataFrames, a seleção é feita com
+    nlargest/nsmallest (seleção parcial); para iteráveis de lotes (ex: iter_scan() ou
+    score_em_lotes()), apenas as k melhores linhas vistas até o momento são mantidas e
+    combinadas com a seleção parcial de cada novo lote, de modo que a memória utilizada
+    é limitada a um lote mais k linhas
+
+    Parâmetros
+    ----------
+    :param fonte: base de dados ou iterável de lotes [type: pd.DataFrame or iterable]
+    :param k: quantidade de linhas selecionadas [type: int]
+    :param col: coluna de seleção [type: string, default='filescope_score']
+    :param ascending: flag para seleção dos menores valores [type: bool, default=False]
+
+    Retorno
+    -------
+    :return df_top: k linhas selecionadas, ordenadas pela coluna de seleção [type: pd.DataFrame]
+
+    Aplicação
+    ---------
+    df_top = top_k(df_root, k=20, col='tamanho_kb')
+    df_top = top_k(iter_scan('/mnt/share'), k=100, col='dias_desde_ult_acesso')
+    """
+
+    # Validando quantidade de linhas (inteiros do numpy, ex: calculados a partir de um DataFrame, são aceitos)
+    try:
+        k = operator.index(k)
+    except TypeError:
+        pass
+    if not isinstance(k, int) or k < 1:
+        logger.error(f'Quantidade de linhas k={k} inválida. Deve ser um inteiro positivo.')
+        return None
+
+    def seleciona(df):
+        if col not in df.columns:
+            raise KeyError(col)
+        # Colunas não numéricas (ex: texto) não suportam seleção parcial e são ordenadas
+        if not (pd.api.types.is_numeric_dtype(df[col]) or pd.api.types.is_datetime64_any_dtype(df[col])):
+            return df.sort_values(by=col, ascending=ascending, kind='mergesort').head(k)
+        return df.nsmallest(k, col) if ascending else df.nlargest(k, col)
+
+    try:
+        if isinstance(fonte, pd.DataFrame):
+            return seleciona(fonte)
+
+        # Iterável de lotes: combinando seleção corrente com a seleção parcial de cada lote
+        melhores = None
+        for df_lote in fonte:
+            candidatos = seleciona(df_lote)
+            if melhores is not None:
+                candidatos = seleciona(concatena_lotes([melhores, candidatos]))
+            melhores = candidatos
+        return melhores
+    except KeyError:
+        logger.error(f'Coluna {col} inexistente na base para seleção das {k} primeiras linhas')
+        return None
+
+# Colunas do report de controle de diretório, na ordem de apresentação
+def colunas_report(grupo_owner=False):
+    """
+    Retorna a lista de colunas do report de controle de diretório na ordem de apresentação
+
+    Parâmetros
+    ----------
+    :param grupo_owner: flag para inclusão da coluna grupo_owner [type: bool, default=False]
+
+    Retorno
+    -------
+    :return order_cols: colunas do report [type: list]
+    """
+
+    order_cols = ['diretorio', 'arquivo', 'tamanho_kb', 'tamanho_fisico_kb', 'usuario_owner', 'dt_criacao',
+                  'dias_desde_criacao', 'dt_ult_modif', 'dias_desde_ult_modif', 'dt_ult_acesso', 'dias_desde_ult_acesso', 'filescope_score',
+                  'dt_relatorio']
+    if grupo_owner:
+        order_cols.insert(order_cols.index('usuario_owner') + 1, 'grupo_owner')
+    return order_cols
+
+# Gerando report de controle de diretório   
+def monta_report(lotes, sort_col='filescope_score', ascending=False, grupo_owner=False, top_n=None,
+                 col_tamanho='tamanho_kb'):
+    """
+    Função responsável por consolidar os lotes de uma varredura no report de controle de
+    diretório, calculando o score filescope e ordenando colunas e linhas
+
+    Parâmetros
+    ----------
+    :param lotes: lotes retornados por iter_scan() [type: list]
+    :param sort_col: coluna de ordenação do report [type: string, default=filescope_score]
+    :param ascending: flag para ordenação ascendente [type: bool, flag=False]
+    :param grupo_owner: flag para inclusão da coluna grupo_owner no report [type: bool, default=False]
+    :param top_n: quantidade de linhas mantidas no report, selecionadas via top_k() [type: int, default=None (todas)]
+    :param col_tamanho: coluna de tamanho do score (ver calc_filescope_score()) [type: string, default='tamanho_kb']
+
+    Retorno
+    -------
+    :return root_manager: report de controle de diretório [type: pd.DataFrame]
+    """
+
+    # Preenchendo DataFrame a partir dos lotes da varredura
+    logger.debug('Preenchendo variáveis de controle')
+    root_manager = concatena_lotes(lotes)
+
+    # Enriquecendo base com score filescope
+    root_manager = calc_filescope_score(df=root_manager, col_tamanho=col_tamanho)
+
+    # Ordenando colunas e linhas (seleção parcial quando apenas as top_n linhas são necessárias)
+    root_manager = root_manager.loc[:, colunas_report(grupo_owner)]
+    if top_n is not None:
+        return top_k(root_manager, top_n, col=sort_col, ascending=ascending)
+
+    return root_manager.sort_values(by=sort_col, ascending=ascending)
+
+def salva_report(root_manager, root, indice=None, df_rollup=None, **kwargs):
+    """
+    Função responsável por salvar o report de controle de diretório (e as mudanças da
+    varredura incremental, quando houver índice) a partir dos argumentos de salvamento
+    recebidos por controle_de_diretorio()
+
+    Parâmetros
+    ----------
+    :param root_manager: report de controle de diretório [type: pd.DataFrame]
+    :param root: caminho do diretório analisado [type: string]
+    :param indice: caminho do índice SQLite da varredura incremental [type: string, default=None]
+    :param df_rollup: report consolidado por diretórios (ver rollup_de_diretorio()) [type: pd.DataFrame, default=None]
+    :param **kwargs: output_path, output_filename e demais opções de save_data()
+    """
+
+    output_path = kwargs['output_path'] if 'output_path' in kwargs else os.path.join(os.getcwd(), 'output')
+    output_filename = kwargs['output_filename'] if 'output_filename' in kwargs else 'controle_diretorio.csv'
+    opcoes_save = {opcao: kwargs[opcao] for opcao in OPCOES_SAVE if opcao in kwargs}
+    save_data(root_manager, output_path=output_path, filename=output_filename, **opcoes_save)
+    if indice is not None:
+        save_data(mudancas_de_diretorio(root, indice), output_path=output_path, filename='mudancas_diretorio.csv')
+    if df_rollup is not None:
+        save_data(df_rollup, output_path=output_path, filename='rollup_diretorios.csv')
+
+def controle_de_diretorio(root, sort_col='filescope_score', ascending=False, backend='scandir', workers=1,
+                          grupo_owner=False, tz=None, indice=None, verifica_arquivos=False, batch_size=None,
+                          top_n=None, rollup=False, profundidade=None, col_tamanho='tamanho_kb', **kwargs):
+    """
+    Função responsável por retornar parâmetros de controle de um determinado diretório:
+        - Caminho raíz;
+        - Nome do arquivo;
+        - Data e hora de criação;
+        - Data e hora de modificação;
+        - Data e hora do último acesso
+
+    Parâmetros
+    ----------
+    :param root: caminho do diretório a ser analisado [type: string]
+    :param output_file: caminho do output em .csv do arquivo gerado [type: string, default: controle_root.csv]
+    :param sort_col: coluna de ordenação do report [type: string, default=filescope_score]
+    :param ascending: flag para ordenação ascendente [type: bool, flag=False]
+    :param backend: motor de varredura do diretório [type: string, default='scandir']
+            *opções: 'scandir' (uma única chamada stat por arquivo) ou 'walk' (os.walk + os.stat)
+    :param workers: quantidade de threads para varredura paralela dos subdiretórios [type: int, default=1]
+            *valores maiores que 1 exigem o backend 'scandir' e são indicados para diretórios de rede
+    :param grupo_owner: flag para inclusão da coluna grupo_owner no report [type: bool, default=False]
+    :param tz: fuso horário das colunas de data (ex: 'UTC') [type: string, default=None (fuso local)]
+    :param indice: caminho do índice SQLite para varredura incremental [type: string, default=None]
+            *quando informado, apenas diretórios com data de modificação alterada desde a última
+             varredura são listados novamente e as mudanças detectadas são registradas no índice
+             (ver mudancas_de_diretorio())
+    :param verifica_arquivos: flag para verificar via stat os arquivos de diretórios inalterados
+            na varredura incremental [type: bool, default=False]
+    :param batch_size: quantidade de arquivos por lote da varredura (ver iter_scan()) [type: int, default=None]
+    :param top_n: quantidade de arquivos mantidos no report, selecionados por sort_col sem ordenação
+            completa da base [type: int, default=None (todos)]
+            *para consultas sem a base completa em memória, ver top_k_diretorio()
+    :param rollup: flag para consolidação por diretórios durante a varredura (ver rollup_de_diretorio()).
+            Quando verdadeiro, o report consolidado é retornado junto ao report de arquivos e salvo
+            como rollup_diretorios.csv [type: bool, default=False]
+    :param profundidade: profundidade máxima dos diretórios do report consolidado [type: int, default=None]
+    :param col_tamanho: coluna de tamanho utilizada no score: 'tamanho_kb' (tamanho lógico) ou
+            'tamanho_fisico_kb' (espaço alocado em disco, com hard links contabilizados uma única
+            vez) [type: string, default='tamanho_kb']
+
+    Retorno
+    -------
+    :returns root_manager: arquivo salvo na rede com informações do diretório [type: pd.DataFrame]
+    :returns df_rollup: report consolidado por diretórios, apenas com rollup=True [type: pd.DataFrame]
+
+    Aplicação
+    ---------
+    root = '/home/user/folder/'
+    controle_root = controle_de_diretorio(root=root)
+    """
+
+    # Validando backend de varredura
+    if not valida_backend(backend, workers) or not valida_col_tamanho(col_tamanho):
+        return
+
+    # Consumindo varredura em lotes (e consolidando diretórios à medida que os lotes são gerados)
+    rollup_dirs = RollupDiretorios(root) if rollup else None
+    lotes = list(iter_scan(root, batch_size=batch_size, backend=backend, workers=workers, grupo_owner=grupo_owner,
+                           tz=tz, indice=indice, verifica_arquivos=verifica_arquivos, rollup=rollup_dirs))
+    root_manager = monta_report(lotes, sort_col=sort_col, ascending=ascending, grupo_owner=grupo_owner, top_n=top_n,
+                                col_tamanho=col_tamanho)
+    del lotes
+    df_rollup = rollup_dirs.para_dataframe(profundidade=profundidade) if rollup else None
+
+    # Validando salvamento dos resultados
+    if 'save' in kwargs and bool(kwargs['save']):
+        salva_report(root_manager, root, indice=indice, df_rollup=df_rollup, **kwargs)
+
+    """# Salvando arquivo gerado
+    if 'save' in kwargs and bool(kwargs['save']):
+        logger.debug('Salvando arquivo de controle gerado')
+        output_filepath=os.path.join(os.getcwd(), 'controle_root.csv')
+        try:
+            output_dir = os.path.split(output_filepath)[0]
+            if not isdir(output_dir):
+                os.makedirs(output_dir)
+            root_manager.to_csv(output_filepath, index=False)
+            logger.info(f'Arquivo de controle para o diretório {root} salvo com sucesso')
+        except Exception as e:
+            logger.error(f'Erro ao salvar arquivo de controle. Exception lançada: {e}')"""
+
+    if rollup:
+        return root_manager, df_rollup
+    return root_manager
+
+# Consulta das k primeiras linhas do report diretamente sobre a varredura
+def top_k_diretorio(root, k=100, col='filescope_score', ascending=False, batch_size=100000, spill_dir=None,
+                    backend='scandir', workers=1, grupo_owner=False, tz=None, indice=None, verifica_arquivos=False,
+                    col_tamanho='tamanho_kb'):
+    """
+    Função responsável por retornar as k primeiras linhas do report de controle de um diretório
+    segundo uma coluna (ex: os 100 arquivos de maior score filescope), consumindo a varredura em
+    lotes sem manter ou ordenar a base completa em memória (ver top_k()). Como o score filescope
+    é normalizado sobre a base completa, a seleção por filescope_score utiliza score_em_lotes(),
+    que grava os lotes temporariamente em spill_dir e mantém em memória apenas as colunas
+    numéricas do score. Na seleção por outras colunas, o score não é calculado (NaN)
+
+    Parâmetros
+    ----------
+    :param root: caminho do diretório a ser analisado [type: string]
+    :param k: quantidade de linhas selecionadas [type: int, default=100]
+    :param col: coluna de seleção [type: string, default='filescope_score']
+    :param ascending: flag para seleção dos menores valores [type: bool, default=False]
+    :param batch_size: quantidade máxima de arquivos por lote da varredura [type: int, default=100000]
+    :param spill_dir: diretório de gravação temporária dos lotes para o cálculo do score
+            [type: string, default=None (diretório temporário do sistema)]
+    :param backend, workers, grupo_owner, tz, indice, verifica_arquivos, col_tamanho: ver controle_de_diretorio()
+
+    Retorno
+    -------
+    :return df_top: k linhas do report de controle, ordenadas pela coluna de seleção [type: pd.DataFrame]
+
+    Aplicação
+    ---------
+    df_top = top_k_diretorio(root='/mnt/share', k=100)
+    """
+
+    # Validando backend de varredura
+    if not valida_backend(backend, workers) or not valida_col_tamanho(col_tamanho):
+        return
+
+    lotes = iter_scan(root, batch_size=batch_size, backend=backend, workers=workers, grupo_owner=grupo_owner, tz=tz,
+                      indice=indice, verifica_arquivos=verifica_arquivos)
+    if col == 'filescope_score':
+        lotes = score_em_lotes(lotes, spill_dir=spill_dir, col_tamanho=col_tamanho)
+    else:
+        # Score calculado apenas sobre as k linhas selecionadas não seria comparável ao report completo
+        lotes = (df_lote.assign(filescope_score=np.nan) for df_lote in lotes)
+
+    df_top = top_k(lotes, k, col=col, ascending=ascending)
+    if df_top is None:
+        return None
+
+    return df_top.loc[:, colunas_report(grupo_owner)].reset_index(drop=True)
+
+# Report consolidado por diretórios
+def rollup_de_diretorio(root, profundidade=None, por_usuario=False, batch_size=100000, backend='scandir', workers=1,
+                        tz=None, indice=None, verifica_arquivos=False, **kwargs):
+    """
+    Função responsável por gerar um report consolidado por diretório (no estilo do utilitário
+    du), contendo para cada diretório e considerando todos os seus subdiretórios: quantidade de
+    arquivos, espaço ocupado, máximo e média de dias desde o último acesso e usuário owner com
+    maior espaço ocupado. Os lotes da varredura são agregados à medida que são gerados e
+    descartados em seguida, sem manter o report de arquivos em memória
+
+    Parâmetros
+    ----------
+    :param root: caminho do diretório a ser analisado [type: string]
+    :param profundidade: profundidade máxima dos diretórios retornados (0 retorna apenas o diretório
+            raíz) [type: int, default=None (todos)]
+    :param por_usuario: flag para retornar o espaço de cada usuário owner por diretório [type: bool, default=False]
+    :param batch_size: quantidade máxima de arquivos por lote da varredura [type: int, default=100000]
+    :param backend, workers, tz, indice, verifica_arquivos: ver controle_de_diretorio()
+    :param **kwargs: save, output_path, output_filename e demais opções de save_data()
+
+    Retorno
+    -------
+    :return df_rollup: report consolidado por diretório (ou por diretório e usuário) [type: pd.DataFrame]
+
+    Aplicação
+    ---------
+    df_rollup = rollup_de_diretorio(root='/mnt/share', profundidade=2)
+    """
+
+    # Validando backend de varredura
+    if not valida_backend(backend, workers):
+        return
+
+    rollup = RollupDiretorios(root)
+    for _ in iter_scan(root, batch_size=batch_size, backend=backend, workers=workers, tz=tz, indice=indice,
+                       verifica_arquivos=verifica_arquivos, rollup=rollup):
+        pass
+    df_rollup = rollup.por_usuario(profundidade) if por_usuario else rollup.para_dataframe(profundidade)
+
+    # Validando salvamento dos resultados
+    if 'save' in kwargs and bool(kwargs['save']):
+        output_path = kwargs['output_path'] if 'output_path' in kwargs else os.path.join(os.getcwd(), 'output')
+        output_filename = kwargs['output_filename'] if 'output_filename' in kwargs else 'rollup_diretorios.csv'
+        opcoes_save = {opcao: kwargs[opcao] for opcao in OPCOES_SAVE if opcao in kwargs}
+        save_data(df_rollup, output_path=output_path, filename=output_filename, **opcoes_save)
+
+    return df_rollup
+
+# Detecção de arquivos duplicados a partir do report de controle
+def duplicados_de_diretorio(root_manager, algoritmo='blake2b', workers=8, cache=None, usa_mmap=True,
+                            tamanho_minimo_kb=0, **kwargs):
+    """
+    Função responsável por encontrar arquivos com conteúdo idêntico a partir do report gerado
+    por controle_de_diretorio(). Apenas arquivos com tamanho repetido no report são avaliados
+    e, entre eles, somente os que possuem o primeiro e o último bloco idênticos são lidos por
+    completo (ver filescope.duplicados.encontra_duplicados()). Hard links de um mesmo arquivo
+    não ocupam espaço adicional e não são contabilizados como cópias
+
+    Parâmetros
+    ----------
+    :param root_manager: report gerado por controle_de_diretorio() [type: pd.DataFrame]
+    :param algoritmo: algoritmo de checksum (ex: 'blake2b', 'sha256', 'xxh3_64') [type: string, default='blake2b']
+    :param workers: quantidade de threads de leitura dos arquivos [type: int, default=8]
+    :param cache: caminho do cache SQLite de checksums, indexado por (st_dev, st_ino, tamanho, mtime),
+            ou um objeto CacheHashes [type: string or CacheHashes, default=None (sem cache)]
+    :param usa_mmap: flag para leitura dos arquivos via mmap no checksum completo [type: bool, default=True]
+    :param tamanho_minimo_kb: tamanho mínimo dos arquivos avaliados (em kb) [type: float, default=0]
+    :param **kwargs: save, output_path, output_filename e demais opções de save_data()
+
+    Retorno
+    -------
+    :return df_duplicados: um registro por arquivo duplicado com as colunas grupo, checksum, diretorio,
+            arquivo, tamanho_kb, hard_link, qtd_copias e kb_recuperaveis (espaço liberado mantendo uma
+            única cópia do grupo), ordenado pelo espaço recuperável [type: pd.DataFrame]
 
-    # Definindo mensagens
-    msg_ok = f'A última modificação do arquivo {nome_arquivo} é igual ou superior a do validador ({janela}: {dt_valida})'
-    msg_nok = f'A última modificação do arquivo {nome_arquivo} (placeholder) é inferior a do validador ({dt_valida})'
+    Aplicação
+    ---------
+    df_root = controle_de_diretorio(root='/mnt/share')
+    df_dup = duplicados_de_diretorio(df_root, cache='/var/cache/filescope/hashes.db')
+    """
 
-    # Validando presença do arquivo na origem e coletando última data de modificação
+    # Etapa 1: candidatos com tamanho repetido no report (arquivos vazios são ignorados)
+    tamanhos = root_manager['tamanho_kb']
+    df = root_manager.loc[(tamanhos > max(tamanho_minimo_kb, 0)) & tamanhos.duplicated(keep=False),
+                          ['diretorio', 'arquivo']]
+    caminhos = [os.path.join(diretorio, arquivo) for diretorio, arquivo in zip(df['diretorio'].astype(str),
+                                                                               df['arquivo'])]
+    logger.debug(f'{len(caminhos)} de {len(root_manager)} arquivos com tamanho repetido')
+
+    # Etapas 2 e 3: checksums parcial e completo
+    cache_hashes = CacheHashes(cache, algoritmo=algoritmo) if isinstance(cache, str) else cache
     try:
-        file_mod_date = os.path.getmtime(os.path.join(dir_origem, nome_arquivo))
+        grupos, falhas = encontra_duplicados(caminhos, algoritmo=algoritmo, workers=workers, cache=cache_hashes,
+                                             usa_mmap=usa_mmap)
+    except Exception as e:
+        logger.error(f'Erro ao buscar arquivos duplicados. Exception lançada: {e}')
+        return None
+    finally:
+        if isinstance(cache, str):
+            cache_hashes.close()
+    for caminho, e in falhas.items():
+        logger.warning(f'Arquivo {caminho} ignorado na busca de duplicados. Exception lançada: {e}')
+
+    # Consolidando grupos em um registro por arquivo
+    linhas = []
+    for i, grupo in enumerate(grupos):
+        qtd_copias = len(grupo.arquivos)
+        kb_recuperaveis = grupo.tamanho * (qtd_copias - 1) / 1000
+        for caminho, hard_link in [(c, False) for c in grupo.arquivos] + [(c, True) for c in grupo.hard_links]:
+            diretorio, arquivo = os.path.split(caminho)
+            linhas.append((i, grupo.checksum, diretorio, arquivo, grupo.tamanho / 1000, hard_link, qtd_copias,
+                           kb_recuperaveis))
+    df_duplicados = pd.DataFrame(linhas, columns=['grupo', 'checksum', 'diretorio', 'arquivo', 'tamanho_kb',
+                                                  'hard_link', 'qtd_copias', 'kb_recuperaveis'])
+    logger.info(f'{len(grupos)} grupos de arquivos duplicados encontrados. Espaço recuperável: '
+                f'{convert_kb_into_str(sum(g.tamanho * (len(g.arquivos) - 1) for g in grupos) / 1000)}')
 
-        # Janela selecionada: ano
-        if janela == 'ano':
-            ano_mod = int(time.strftime('%Y', time.localtime(file_mod_date)))
-            if dt_valida >= ano_mod:
-                logger.info(msg_ok)
-                return True
-            else:
-                logger.warning(msg_nok.replace('placeholder', str(ano_mod)))
-                return False
+    # Validando salvamento dos resultados
+    if 'save' in kwargs and bool(kwargs['save']):
+        output_path = kwargs['output_path'] if 'output_path' in kwargs else os.path.join(os.getcwd(), 'output')
+        output_filename = kwargs['output_filename'] if 'output_filename' in kwargs else 'duplicados.csv'
+        opcoes_save = {opcao: kwargs[opcao] for opcao in OPCOES_SAVE if opcao in kwargs}
+        save_data(df_duplicados, output_path=output_path, filename=output_filename, **opcoes_save)
 
-        # Janela selecionada: anomes
-        elif janela == 'anomes':
-            anomes_mod = int(time.strftime('%Y%m', time.localtime(file_mod_date)))
-            if dt_valida >= anomes_mod:
-                logger.info(msg_ok)
-                return True
-            else:
-                logger.warning(msg_nok.replace('placeholder', str(anomes_mod)))
-                return False
+    return df_duplicados
 
-        # Janela selecionada: anomesdida
-        elif janela == 'anomesdia':
-            anomesdia_mod = int(time.strftime('%Y%m%d', time.localtime(file_mod_date)))
-            if dt_valida >= anomesdia_mod:
-                logger.info(msg_ok)
-                return True
-            else:
-                logger.warning(msg_nok.replace('placeholder', str(anomesdia_mod)))
-                return False     
-    except FileNotFoundError as e:
-        logger.error(f'Arquivo {nome_arquivo} não encontrado na origem. Exception lançada: {e}')
-        return False
+# Marcando arquivos duplicados no report de controle
+def marca_duplicados(root_manager, df_duplicados):
+    """
+    Função responsável por adicionar ao report de controle a coluna qtd_copias (quantidade de
+    arquivos com o mesmo conteúdo, 1 para arquivos sem duplicados), permitindo priorizar ou
+    ponderar arquivos duplicados nas análises e no score
 
+    Parâmetros
+    ----------
+    :param root_manager: report gerado por controle_de_diretorio() [type: pd.DataFrame]
+    :param df_duplicados: resultado de duplicados_de_diretorio() [type: pd.DataFrame]
 
-"""
----------------------------------------------------
-------- 2. VALIDAÇÃO E MANUSEIO DE ARQUIVOS -------
-               2.2 Cópia de Arquivos
----------------------------------------------------
-"""
+    Retorno
+    -------
+    :return root_manager: report com a coluna qtd_copias [type: pd.DataFrame]
+    """
 
-def copia_arquivo(origem, destino, valida_presenca=False):
+    # Caminhos normalizados dos dois lados (o diretório retornado por os.path.split() pode diferir do report)
+    copias = {(os.path.normpath(diretorio), arquivo): qtd for diretorio, arquivo, qtd in
+              zip(df_duplicados['diretorio'].astype(str), df_duplicados['arquivo'], df_duplicados['qtd_copias'])}
+    chaves = zip(root_manager['diretorio'].astype(str).map(os.path.normpath), root_manager['arquivo'])
+    root_manager['qtd_copias'] = np.fromiter((copias.get(chave, 1) for chave in chaves), dtype='int64',
+                                             count=len(root_manager))
+    return root_manager
+
+# Conjunto de mudanças da última varredura incremental
+def mudancas_de_diretorio(root, indice):
     """
-    Função responsável por copiar um arquivo definido em uma origem para um destino
+    Função responsável por retornar os arquivos adicionados, modificados e removidos
+    detectados na última varredura incremental de um diretório
 
     Parâmetros
     ----------
-    :param origem: definição do arquivo origem (caminho + nome do arquivo) [type: string]
-    :param destino: definição do destino da cópia (caminho + nome do arquivo) [type: string]
-    :param valida_presenca: flag para validar existência do arquivo na origem [type: bool, default=False]
+    :param root: caminho do diretório analisado [type: string]
+    :param indice: caminho do índice SQLite utilizado na varredura [type: string]
 
     Retorno
     -------
-    None
+    :return df_mudancas: base com as colunas tipo, diretorio, arquivo e dt_varredura [type: pd.DataFrame]
 
     Aplicação
     ---------
-    # Copiando arquivo
-    origem = '/home/user/folder/file.txt'
-    destino = '/home/user/new_folder/file.txt'
-    copia_arquivo(origem=origem, destino=destino)
+    df_root = controle_de_diretorio(root='/mnt/share', indice='/var/lib/filescope/share.db')
+    df_mudancas = mudancas_de_diretorio(root='/mnt/share', indice='/var/lib/filescope/share.db')
     """
 
-    # Extraindo informações de diretório e arquivo
-    src_split = os.path.split(origem)
-    src_path = src_split[0]
-    src_filename = src_split[-1]
-    dst_path = os.path.split(destino)[0]
-
-    # Validando presença do arquivo no diretório
-    if valida_presenca and not valida_arquivo_origem(dir_origem=src_path, nome_arquivo=src_filename):
-        logger.error(f'Arquivo {src_filename} inexistente na origem {src_path}')
-        return
-
-    # Verificando se diretório de saída existe
-    if not os.path.isdir(dst_path):
-        logger.warning(f'Diretório {dst_path} inexistente. Criando diretório no local especificado')
-        try:
-            os.makedirs(dst_path)
-        except Exception as e:
-            logger.error(f'Erro ao tentar criar o diretório {dst_path}. Exception lançada: {e}')
-            return
+    df_mudancas = pd.DataFrame(le_mudancas(root, indice), columns=['tipo', 'diretorio', 'arquivo', 'dt_varredura'])
+    df_mudancas['dt_varredura'] = epoch_para_datetime(df_mudancas['dt_varredura'].values)
 
-    # Verificando se o arquivo está presente na origem
-    try:
-        shutil.copyfile(src=origem, dst=destino)
-        logger.info(f'Cópia realizada com sucesso. Origem: {origem} - Destino: {destino}')
-    except Exception as e:
-        # Erro ao copiar arquivo pro destino
-        logger.warning(f'Falha ao copiar arquivo. Exception lançada: {e}')
+    return df_mudancas
 
 
 """
 ---------------------------------------------------
 ------------ 3. CONTROLE DE DIRETÓRIOS ------------
-        3.1 Visão analítica de diretório
+      3.2 Varredura de múltiplos diretórios
 ---------------------------------------------------
 """
 
-# Função para cálculo do score filescope
-def calc_filescope_score(df, peso_tkb=2, peso_ddc=1, peso_dda=2, peso_ddm=1):
+# Varredura de uma tarefa (diretório ou fatia de diretório) em processo dedicado
+def varre_tarefa(id_tarefa, alvo, recursivo, fila, batch_size, dt_relatorio, opcoes):
     """
-    Função responsável por calcular o score filescope baseado em pesos e normalização
-    
+    Função executada em processos do pool de varredura de múltiplos diretórios. Os lotes
+    encontrados são enviados ao processo principal através de uma fila à medida que a
+    varredura avança, seguidos de uma mensagem de término (ou de erro)
+
     Parâmetros
     ----------
-    :param df: report gerado a partir de função controle_de_diretorio() [type: pd.DataFrame]
-    :param peso_tkb: peso do cálculo para o tamanho do arquivo [type: int, default=2]
-    :param peso_ddc: peso do cálculo para dias desde a criação [type: int, default=1]
-    :param peso_dda: peso do cálculo para dias do último acesso [type: int, default=2]
-    :param peso_ddm: peso do cálculo para dias da última modificação [type: int, default=1]
-    
-    Retorno
-    -------
-    :return df: base de dados com score filescope calculado [type: pd.DataFrame]
+    :param id_tarefa: identificador da tarefa [type: int]
+    :param alvo: diretório a ser varrido [type: string]
+    :param recursivo: flag para varredura de subdiretórios (False lista apenas o próprio alvo) [type: bool]
+    :param fila: fila compartilhada com o processo principal [type: multiprocessing.Queue]
+    :param batch_size: quantidade máxima de arquivos por lote [type: int]
+    :param dt_relatorio: data de referência do report [type: np.datetime64]
+    :param opcoes: argumentos repassados para iter_scan() [type: dict]
     """
-    
-    # Dropando coluna de score caso existente
-    if 'filescope_score' in df.columns:
-        df.drop('filescope_score', axis=1, inplace=True)
-    
-    # Normalizando colunas numéricas
-    num_cols = ['tamanho_kb', 'dias_desde_criacao', 'dias_desde_ult_modif', 'dias_desde_ult_acesso']
-    key_cols = ['diretorio', 'arquivo']
-    df_score = df.loc[:, key_cols + num_cols]
-    for col in num_cols:
-        col_max = df_score[col].max()
-        col_min = df_score[col].min()
-        df_score[col] = (df_score[col] - col_min) / (col_max - col_min)
-
-    # Calculando score filescope a partir de pesos pré definidos
-    tkb = peso_tkb * df_score['tamanho_kb']
-    ddc = peso_ddc * df_score['dias_desde_criacao'] 
-    dda = peso_dda * df_score['dias_desde_ult_acesso']
-    ddm = peso_ddm * df_score['dias_desde_ult_modif']
-    pesos = peso_tkb * peso_ddc * peso_dda * peso_ddm
-
-    df_score['filescope_score'] = (tkb * ddc * dda * ddm) / pesos
 
-    # Normalizando score
-    score_max = df_score['filescope_score'].max()
-    score_min = df_score['filescope_score'].min()
-    df_score['filescope_score'] = 100 * (df_score['filescope_score'] - score_min) / (score_max - score_min)
-    df_score = df_score.loc[:, key_cols + ['filescope_score']]
+    try:
+        if not os.path.isdir(alvo):
+            raise NotADirectoryError(f'Diretório {alvo} inexistente ou inacessível')
 
-    # Juntando bases
-    return df.merge(df_score, how='left', on=key_cols)
+        if recursivo:
+            for df_lote in iter_scan(alvo, batch_size=batch_size, dt_relatorio=dt_relatorio, **opcoes):
+                fila.put(('lote', id_tarefa, df_lote))
+        else:
+            colunas = ColunasVarredura()
+            arquivos, _, erros = lista_diretorio(alvo)
+            for e in erros:
+                log_falha_varredura(e)
+            for nome, st in arquivos:
+                colunas.adiciona(alvo, nome, st)
+            df_lote = colunas_para_dataframe(colunas, tz=opcoes.get('tz'), grupo_owner=opcoes.get('grupo_owner', False),
+                                             dt_relatorio=dt_relatorio)
+            fila.put(('lote', id_tarefa, df_lote))
+        fila.put(('fim', id_tarefa, None))
+    except Exception as e:
+        fila.put(('erro', id_tarefa, f'{type(e).__name__}: {e}'))
 
-# Gerando report de controle de diretório   
-def controle_de_diretorio(root, sort_col='filescope_score', ascending=False, **kwargs):
+# Gerando report de controle para múltiplos diretórios
+def controle_multiplos_diretorios(roots, processos=None, fatiar=False, sort_col='filescope_score', ascending=False,
+                                  batch_size=100000, backend='scandir', workers=1, grupo_owner=False, tz=None,
+                                  top_n=None, col_tamanho='tamanho_kb', **kwargs):
     """
-    Função responsável por retornar parâmetros de controle de um determinado diretório:
-        - Caminho raíz;
-        - Nome do arquivo;
-        - Data e hora de criação;
-        - Data e hora de modificação;
-        - Data e hora do último acesso
+    Função responsável por gerar um report de controle único para uma lista de diretórios
+    raíz (ex: pontos de montagem), varrendo cada diretório em um processo dedicado de um
+    pool. Os lotes de cada processo são recebidos à medida que a varredura avança e o score
+    filescope é normalizado globalmente, considerando os arquivos de todos os diretórios.
+
+    Falhas na varredura de um diretório são registradas e retornadas separadamente, sem
+    interromper os demais. Arquivos de um diretório com falha não são incluídos no report.
 
     Parâmetros
     ----------
-    :param root: caminho do diretório a ser analisado [type: string]
-    :param output_file: caminho do output em .csv do arquivo gerado [type: string, default: controle_root.csv]
+    :param roots: lista de diretórios a serem analisados [type: list]
+    :param processos: quantidade de processos do pool [type: int, default=None (quantidade de CPUs)]
+    :param fatiar: flag para dividir cada diretório em uma tarefa por subdiretório de primeiro nível,
+            distribuindo diretórios grandes entre múltiplos processos [type: bool, default=False]
     :param sort_col: coluna de ordenação do report [type: string, default=filescope_score]
     :param ascending: flag para ordenação ascendente [type: bool, flag=False]
+    :param batch_size: quantidade máxima de arquivos por lote enviado pelos processos [type: int, default=100000]
+    :param backend: motor de varredura do diretório [type: string, default='scandir']
+    :param workers: quantidade de threads de varredura em cada processo [type: int, default=1]
+    :param grupo_owner: flag para inclusão da coluna grupo_owner no report [type: bool, default=False]
+    :param tz: fuso horário das colunas de data [type: string, default=None (fuso local)]
+    :param top_n: quantidade de arquivos mantidos no report, selecionados via top_k() [type: int, default=None (todos)]
+    :param col_tamanho: coluna de tamanho utilizada no score (ver controle_de_diretorio()). Hard links são
+            contabilizados uma única vez em cada tarefa de varredura [type: string, default='tamanho_kb']
 
     Retorno
     -------
-    :returns root_manager: arquivo salvo na rede com informações do diretório [type: pd.DataFrame]
+    :return root_manager: report de controle com a coluna adicional root [type: pd.DataFrame]
+    :return falhas: dicionário no formato {root: mensagem de erro} [type: dict]
 
     Aplicação
     ---------
-    root = '/home/user/folder/'
-    controle_root = controle_de_diretorio(root=root)
+    roots = ['/mnt/share1', '/mnt/share2', '/mnt/share3']
+    df_roots, falhas = controle_multiplos_diretorios(roots=roots, processos=3)
     """
 
-    # Criando DataFrame e listas para armazenar informações
-    root_manager = DataFrame()
-    all_files = []
-    all_sizes = []
-    all_cdt = []
-    all_mdt = []
-    all_adt = []
-    all_owners = []
-
-    # Iterando sobre todos os arquivos do diretório e subdiretórios
-    logger.debug('Iterando sobre os arquivos do diretório root')
-    for path, _, files in os.walk(root):
-        for name in files:
-            # Caminho completo do arquivo
-            caminho = os.path.join(path, name)
-
-            # Retornando variáveis
-            all_files.append(caminho)
-            all_sizes.append(os.path.getsize(caminho))
-            all_cdt.append(os.path.getctime(caminho))
-            all_mdt.append(os.path.getmtime(caminho))
-            all_adt.append(os.path.getatime(caminho))
-            all_owners.append(getpwuid(os.stat(caminho).st_uid).pw_name)
-
-    # Preenchendo DataFrame
-    logger.debug('Preenchendo variáveis de controle')
-    root_manager['diretorio'] = [os.path.split(f)[0] for f in all_files]
-    root_manager['arquivo'] = [os.path.split(f)[-1] for f in all_files]
-    root_manager['tamanho_kb'] = [size / 1000 for size in all_sizes]
-    root_manager['usuario_owner'] = all_owners
-    root_manager['dt_criacao'] = [time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(cdt)) for cdt in all_cdt] 
-    root_manager['dt_ult_modif'] = [time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mdt)) for mdt in all_mdt]
-    root_manager['dt_ult_acesso'] = [time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(adt)) for adt in all_adt]
-    root_manager['dt_relatorio'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
-    # Construindo indicadores adicionais de utilização
-    date_cols = [col for col in root_manager.columns if 'dt_' in col]
-    for col in date_cols:
-        root_manager[col] = pd.to_datetime(root_manager[col])
-
-    # Idade do arquivo, dias sem modificação e dias desde último acesso
-    root_manager['dias_desde_criacao'] = (root_manager['dt_relatorio'] - root_manager['dt_criacao']).dt.days
-    root_manager['dias_desde_ult_modif'] = (root_manager['dt_relatorio'] - root_manager['dt_ult_modif']).dt.days
-    root_manager['dias_desde_ult_acesso'] = (root_manager['dt_relatorio'] - root_manager['dt_ult_acesso']).dt.days
-    
-    # Enriquecendo base com score filescope
-    root_manager = calc_filescope_score(df=root_manager)
+    # Validando backend de varredura
+    if not valida_backend(backend, workers) or not valida_col_tamanho(col_tamanho):
+        return None, {}
+
+    opcoes = {'backend': backend, 'workers': workers, 'grupo_owner': grupo_owner, 'tz': tz}
+    dt_relatorio = epoch_para_datetime([time.time_ns()], tz=tz)[0]
+    falhas = {}
+
+    # Definindo tarefas: um diretório raíz por tarefa ou uma tarefa por subdiretório de primeiro nível
+    tarefas = []
+    for root in roots:
+        if not fatiar:
+            tarefas.append((root, root, True))
+            continue
+        _, subdirs, erros = lista_diretorio(root)
+        if erros:
+            falhas[root] = f'{type(erros[0]).__name__}: {erros[0]}'
+            logger.error(f'Falha ao listar o diretório {root}. Exception lançada: {erros[0]}')
+            continue
+        tarefas.append((root, root, False))
+        tarefas.extend((root, subdir, True) for subdir in subdirs)
+
+    # Disparando tarefas no pool de processos e consumindo lotes à medida que chegam
+    logger.debug(f'Varrendo {len(roots)} diretórios em {len(tarefas)} tarefas')
+    lotes = {root: [] for root in roots}
+    with multiprocessing.Manager() as gerenciador, futures_processos.ProcessPoolExecutor(max_workers=processos) as pool:
+        fila = gerenciador.Queue()
+        futures = {pool.submit(varre_tarefa, i, alvo, recursivo, fila, batch_size, dt_relatorio, opcoes): i
+                   for i, (_, alvo, recursivo) in enumerate(tarefas)}
+        pendentes = set(futures.values())
+        while pendentes:
+            try:
+                tipo, id_tarefa, conteudo = fila.get(timeout=1)
+            except queue.Empty:
+                # Verificando processos encerrados de forma inesperada
+                for future, id_tarefa in futures.items():
+                    if id_tarefa in pendentes and future.done() and future.exception() is not None:
+                        pendentes.discard(id_tarefa)
+                        root = tarefas[id_tarefa][0]
+                        falhas.setdefault(root, f'{type(future.exception()).__name__}: {future.exception()}')
+                continue
+
+            root, alvo, _ = tarefas[id_tarefa]
+            if tipo == 'lote':
+                conteudo.insert(0, 'root', pd.Categorical([root] * len(conteudo)))
+                lotes[root].append(conteudo)
+            else:
+                pendentes.discard(id_tarefa)
+                if tipo == 'erro':
+                    logger.error(f'Falha na varredura do diretório {alvo}. Exception lançada: {conteudo}')
+                    falhas.setdefault(root, conteudo)
+
+    # Descartando diretórios com falha e calculando score global
+    for root in falhas:
+        lotes.pop(root, None)
+    todos_lotes = [df_lote for root in lotes for df_lote in lotes[root]]
+    if not todos_lotes:
+        logger.warning('Nenhum diretório varrido com sucesso')
+        return None, falhas
+    root_manager = concatena_lotes(list(score_em_lotes(todos_lotes, spill_dir=False, col_tamanho=col_tamanho)))
+    del todos_lotes, lotes
 
     # Ordenando colunas e linhas
-    order_cols = ['diretorio', 'arquivo', 'tamanho_kb', 'usuario_owner', 'dt_criacao', 'dias_desde_criacao', 
-                  'dt_ult_modif', 'dias_desde_ult_modif', 'dt_ult_acesso', 'dias_desde_ult_acesso', 'filescope_score',
-                  'dt_relatorio']
-    root_manager = root_manager.loc[:, order_cols]
-    root_manager = root_manager.sort_values(by=sort_col, ascending=ascending)
+    root_manager = root_manager.loc[:, ['root'] + colunas_report(grupo_owner)]
+    if top_n is not None:
+        root_manager = top_k(root_manager, top_n, col=sort_col, ascending=ascending)
+    else:
+        root_manager = root_manager.sort_values(by=sort_col, ascending=ascending)
+    logger.info(f'Report gerado para {len(roots) - len(falhas)} de {len(roots)} diretórios')
 
     # Validando salvamento dos resultados
     if 'save' in kwargs and bool(kwargs['save']):
         output_path = kwargs['output_path'] if 'output_path' in kwargs else os.path.join(os.getcwd(), 'output')
-        output_filename = kwargs['output_filename'] if 'output_filename' in kwargs else 'controle_diretorio.csv'
-        save_data(root_manager, output_path=output_path, filename=output_filename)
-
-    """# Salvando arquivo gerado
-    if 'save' in kwargs and bool(kwargs['save']):
-        logger.debug('Salvando arquivo de controle gerado')
-        output_filepath=os.path.join(os.getcwd(), 'controle_root.csv')
-        try:
-            output_dir = os.path.split(output_filepath)[0]
-            if not isdir(output_dir):
-                os.makedirs(output_dir)
-            root_manager.to_csv(output_filepath, index=False)
-            logger.info(f'Arquivo de controle para o diretório {root} salvo com sucesso')
-        except Exception as e:
-            logger.error(f'Erro ao salvar arquivo de controle. Exception lançada: {e}')"""
-
-    return root_manager
+        output_filename = kwargs['output_filename'] if 'output_filename' in kwargs else 'controle_diretorios.csv'
+        opcoes_save = {opcao: kwargs[opcao] for opcao in OPCOES_SAVE if opcao in kwargs}
+        save_data(root_manager, output_path=output_path, filename=output_filename, **opcoes_save)
 
+    return root_manager, falhas
 
 """
 ---------------------------------------------------
 ------------ 3. CONTROLE DE DIRETÓRIOS ------------
-         3.2 Report visual de diretórios
+         3.3 Report visual de diretórios
 ---------------------------------------------------
 """
 
@@ -523,7 +2287,8 @@ def format_spines(ax, right_border=False):
 
     Aplicação
     ---------
-    fig, ax = plt.subplots()
+    fig = cria_figura()
+    ax = fig.add_subplot()
     format_spines(ax=ax, right_border=False)
     """
 
@@ -564,33 +2329,85 @@ def convert_kb_into_str(size):
     
     return size
 
-# Função responsável por salvar imagens em formato png
-def save_fig(fig, output_path, img_name, tight_layout=True, dpi=300):
+# Função responsável por criar figuras fora do gerenciador global do pyplot
+def cria_figura(figsize=(17, 6), constrained_layout=True):
+    """
+    Cria uma figura do matplotlib associada a um canvas Agg (renderização sem interface
+    gráfica). A figura não é registrada no gerenciador global do pyplot e, portanto, é
+    liberada assim que deixa de ser referenciada, sem a necessidade de plt.close()
+
+    Parâmetros
+    ----------
+    :param figsize: dimensões da figura [type: tuple, default=(17, 6)]
+    :param constrained_layout: flag para ajuste automático do layout [type: bool, default=True]
+
+    Retorno
+    -------
+    :return fig: figura criada [type: matplotlib.figure.Figure]
+    """
+
+    fig = figure.Figure(figsize=figsize, constrained_layout=constrained_layout)
+    backend_agg.FigureCanvasAgg(fig)
+    return fig
+
+# Função para validação do formato de imagem
+def valida_formato_imagem(formato):
+    """
+    Valida o formato de imagem a ser salvo (png, jpg, svg, pdf, entre outros suportados pelo backend Agg)
+
+    Parâmetros
+    ----------
+    :param formato: formato da imagem, com ou sem ponto [type: string]
+
+    Retorno
+    -------
+    :return formato: formato normalizado ou None caso seja inválido [type: string]
+    """
+
+    formato = str(formato).lower().lstrip('.')
+    formatos = backend_agg.FigureCanvasAgg.get_supported_filetypes()
+    if formato not in formatos:
+        logger.error(f'Formato de imagem {formato} inválido. Formatos suportados: {sorted(formatos)}')
+        return None
+    return formato
+
+# Função responsável por salvar imagens
+def save_fig(fig, output_path, img_name, tight_layout=True, dpi=300, formato=None):
     """
     Método responsável por salvar imagens geradas pelo matplotlib/seaborn
 
     Parâmetros
     ----------
-    :param fig: figura criada pelo matplotlib para a plotagem gráfica [type: plt.figure]
-    :param output_file: caminho final a ser salvo (+ nome do arquivo em formato png) [type: string]
+    :param fig: figura criada pelo matplotlib para a plotagem gráfica [type: matplotlib.figure.Figure]
+    :param output_path: diretório a ser utilizado para salvamento da imagem [type: string]
+    :param img_name: nome do arquivo da imagem (com extensão) [type: string]
     :param tight_layout: flag que define o acerto da imagem [type: bool, default=True]
     :param dpi: resolução da imagem a ser salva [type: int, default=300]
+    :param formato: formato da imagem (png, jpg, svg, pdf...); quando informado, substitui a
+        extensão de img_name [type: string, default=None]
 
     Retorno
     -------
-    Este método não retorna nenhum parâmetro além do salvamento da imagem em diretório especificado
+    :return output_file: caminho da imagem salva ou None em caso de falha [type: string]
 
     Aplicação
     ---------
-    fig, ax = plt.subplots()
-    save_fig(fig, output_file='imagem.png')
+    fig = cria_figura()
+    save_fig(fig, output_path='output/imgs', img_name='imagem.png', dpi=150)
     """
 
-    # Verificando se diretório existe
+    # Validando formato da imagem
+    if formato is not None:
+        formato = valida_formato_imagem(formato)
+        if formato is None:
+            return None
+        img_name = os.path.splitext(img_name)[0] + '.' + formato
+
+    # Verificando se diretório existe (outros processos de renderização podem criá-lo simultaneamente)
     if not os.path.isdir(output_path):
         logger.warning(f'Diretório {output_path} inexistente. Criando diretório no local especificado')
         try:
-            os.makedirs(output_path)
+            os.makedirs(output_path, exist_ok=True)
         except Exception as e:
             logger.error(f'Erro ao tentar criar o diretório {output_path}. Exception lançada: {e}')
     
@@ -601,11 +2418,126 @@ def save_fig(fig, output_path, img_name, tight_layout=True, dpi=300):
     logger.debug('Salvando imagem no diretório especificado')
     try:
         output_file = os.path.join(output_path, img_name)
-        fig.savefig(output_file, dpi=300)
+        fig.savefig(output_file, dpi=dpi, format=formato)
         logger.info(f'Imagem salva com sucesso em {output_file}')
+        return output_file
     except Exception as e:
         logger.error(f'Erro ao salvar imagem. Exception lançada: {e}')
 
+# Função responsável por salvar e liberar as figuras das visões gerais
+def finaliza_visao(fig, img_name, **kwargs):
+    """
+    Salva a figura de uma visão geral (caso kwargs['save'] seja verdadeiro) e libera os
+    eixos e artistas da figura após o salvamento
+
+    Parâmetros
+    ----------
+    :param fig: figura da visão geral [type: matplotlib.figure.Figure]
+    :param img_name: nome padrão do arquivo da imagem [type: string]
+    :param **kwargs: save, output_path, output_filename, dpi e formato
+
+    Retorno
+    -------
+    :return saida: caminho da imagem salva (save=True) ou a própria figura (save=False) [type: string or Figure]
+    """
+
+    if not ('save' in kwargs and bool(kwargs['save'])):
+        return fig
+
+    output_path = kwargs['output_path'] if 'output_path' in kwargs else os.path.join(os.getcwd(), 'output/imgs')
+    output_filename = kwargs['output_filename'] if 'output_filename' in kwargs else img_name
+    output_file = save_fig(fig, output_path=output_path, img_name=output_filename, tight_layout=False,
+                           dpi=kwargs.get('dpi', 300), formato=kwargs.get('formato'))
+    fig.clear()
+    return output_file
+
+# Quantidade de linhas a partir da qual as visões gerais utilizam dados agregados ou amostrados
+MAX_PONTOS_PLOT = 50000
+
+# Quantidade máxima de arquivos marcados no rug da distribuição de tamanhos
+MAX_PONTOS_RUG = 2000
+
+# Agregação de tamanhos em histograma de escala logarítmica
+def histograma_log(valores, n_bins=200):
+    """
+    Agrega valores não negativos em um histograma com bins em escala logarítmica, retornando
+    os centros (média geométrica das bordas) e as contagens dos bins não vazios. Os valores
+    nulos (zero) formam um bin próprio. Utilizado para estimar a densidade de milhões de
+    valores a partir de uma quantidade fixa de pontos ponderados
+
+    Parâmetros
+    ----------
+    :param valores: valores a serem agregados [type: array-like]
+    :param n_bins: quantidade de bins logarítmicos [type: int, default=200]
+
+    Retorno
+    -------
+    :return centros: centros dos bins não vazios [type: np.array]
+    :return contagens: quantidade de valores em cada bin [type: np.array]
+    """
+
+    valores = np.asarray(valores, dtype='float64')
+    valores = valores[np.isfinite(valores) & (valores >= 0)]
+    positivos = valores[valores > 0]
+    qtd_zeros = len(valores) - len(positivos)
+
+    if len(positivos) > 0 and positivos.min() < positivos.max():
+        bordas = np.geomspace(positivos.min(), positivos.max(), n_bins + 1)
+        contagens, _ = np.histogram(positivos, bins=bordas)
+        centros = np.sqrt(bordas[:-1] * bordas[1:])
+    else:
+        contagens = np.array([len(positivos)])
+        centros = np.array([positivos[0] if len(positivos) > 0 else 0.0])
+
+    centros, contagens = np.append([0.0], centros), np.append([qtd_zeros], contagens)
+    nao_vazios = contagens > 0
+    return centros[nao_vazios], contagens[nao_vazios]
+
+# Amostragem estratificada preservando outliers
+def amostra_estratificada(df, col_estrato, n, cols_outliers=None, top_n=100, semente=42):
+    """
+    Seleciona uma amostra de aproximadamente n linhas, proporcional ao tamanho de cada estrato
+    (com ao menos uma linha por estrato) e que sempre contém as top_n linhas de maior valor
+    em cada uma das colunas de outliers. A seleção utiliza apenas operações vetorizadas
+
+    Parâmetros
+    ----------
+    :param df: base de dados a ser amostrada [type: pd.DataFrame]
+    :param col_estrato: coluna que define os estratos (ex: usuario_owner) [type: string]
+    :param n: tamanho aproximado da amostra [type: int]
+    :param cols_outliers: colunas cujos maiores valores são sempre mantidos [type: list, default=None]
+    :param top_n: quantidade de outliers mantidos por coluna [type: int, default=100]
+    :param semente: semente do gerador aleatório [type: int, default=42]
+
+    Retorno
+    -------
+    :return amostra: linhas selecionadas, na ordem original [type: pd.DataFrame]
+    """
+
+    if len(df) <= n:
+        return df
+
+    # Mantendo os maiores valores de cada coluna de outliers (seleção parcial)
+    manter = np.zeros(len(df), dtype=bool)
+    for col in cols_outliers or []:
+        valores = df[col].to_numpy(dtype='float64', na_value=-np.inf)
+        k = min(top_n, len(valores))
+        manter[np.argpartition(valores, len(valores) - k)[len(valores) - k:]] = True
+
+    # Cotas proporcionais por estrato (estrato nulo tratado como estrato próprio)
+    fracao = max(n - manter.sum(), 0) / len(df)
+    codigos = pd.factorize(df[col_estrato])[0] + 1
+    tamanhos = np.bincount(codigos)
+    cotas = np.maximum(1, np.round(tamanhos * fracao)).astype('int64')
+
+    # Ordenação aleatória dentro de cada estrato e seleção das primeiras linhas até a cota
+    ordem = np.lexsort((np.random.default_rng(semente).random(len(df)), codigos))
+    inicio_estrato = np.cumsum(tamanhos) - tamanhos
+    posicao = np.arange(len(df)) - inicio_estrato[codigos[ordem]]
+    manter[ordem[posicao < cotas[codigos[ordem]]]] = True
+
+    return df.iloc[np.flatnonzero(manter)]
+
 # Função auxiliar de plotagem gráfica
 def plot_file_param(df, col, ax, top_n=20, palette='Blues_r'):
     """
@@ -620,10 +2552,12 @@ def plot_file_param(df, col, ax, top_n=20, palette='Blues_r'):
     :param palette: paleta de cores da plotagem [type: string, default='viridis']
     """
     
-    # Ordenando e plotando visão arquivo        
-    df = df.sort_values(by=col, ascending=False)
+    # Selecionando (seleção parcial) e plotando visão arquivo; com top_n <= 0, todos os arquivos são
+    # plotados em ordem decrescente (comportamento original de sort_values + iloc[:top_n] com top_n > 0)
     if top_n > 0:
-        df = df.iloc[:top_n, :]
+        df = top_k(df, top_n, col=col)
+    else:
+        df = df.sort_values(by=col, ascending=False)
     sns.barplot(y='arquivo', x=col, data=df, ax=ax, palette=palette)
   
 # Visão geral do diretório
@@ -634,24 +2568,27 @@ def visao_geral_dir(df, **kwargs):
     Parâmetros
     ----------
     :param df: base de dados com o report gerado [type: pd.DataFrame]
-    :param kwrgs
+    :param kwrgs: save, output_path, output_filename, dpi, formato, max_pontos (quantidade de
+        linhas a partir da qual a visão utiliza dados agregados, default=MAX_PONTOS_PLOT) e
+        col_tamanho (coluna de tamanho lógico ou físico, default='tamanho_kb')
     
     Retorno
     -------
-    Essa função não retorna nenhum parâmetro além da plotagem gráfica
+    :return saida: caminho da imagem salva (save=True) ou a figura gerada (save=False) [type: string or Figure]
     """
     
     # Definição de eixos usando GridSpec
-    fig = plt.figure(constrained_layout=True, figsize=(17, 6))
-    gs = GridSpec(1, 3, figure=fig)
+    fig = cria_figura(figsize=(17, 6))
+    gs = fig.add_gridspec(1, 3)
 
     # Definindo eixos
     ax1 = fig.add_subplot(gs[0, 0])
     ax2 = fig.add_subplot(gs[0, 1:])
 
     # Realizando cálculos dos parâmetros
-    sum_space = convert_kb_into_str(df['tamanho_kb'].sum())
-    avg_space = convert_kb_into_str(df['tamanho_kb'].mean())
+    col_tamanho = kwargs.get('col_tamanho', 'tamanho_kb')
+    sum_space = convert_kb_into_str(df[col_tamanho].sum())
+    avg_space = convert_kb_into_str(df[col_tamanho].mean())
     qtd_files = len(df)
 
     # Definindo parâmetros de texto
@@ -674,21 +2611,27 @@ def visao_geral_dir(df, **kwargs):
     ax1.axis('off')
 
     # Plotando gráfico de barras por usuário
-    sns.distplot(df['tamanho_kb'], ax=ax2, color='navy', hist=False, rug=True, kde_kws={'shade': True})
+    max_pontos = kwargs.get('max_pontos', MAX_PONTOS_PLOT)
+    if len(df) <= max_pontos:
+        sns.kdeplot(x=df[col_tamanho], ax=ax2, color='navy', fill=True)
+    else:
+        # Bases grandes: densidade estimada sobre o histograma logarítmico
+        centros, contagens = histograma_log(df[col_tamanho])
+        sns.kdeplot(x=centros, weights=contagens, ax=ax2, color='navy', fill=True)
+
+    # Rug de uma amostra dos arquivos
+    tamanhos = df[col_tamanho]
+    if len(tamanhos) > MAX_PONTOS_RUG:
+        tamanhos = tamanhos.sample(n=MAX_PONTOS_RUG, random_state=42)
+    sns.rugplot(x=tamanhos, ax=ax2, color='navy')
     ax2.axvline(color='white', linestyle='--')
     ax2.set_title(f'Distribuição de Densidade do Tamanho dos Arquivos no Diretório', size=14)
     ax2.set_ylabel('Densidade')
     ax2.set_xlabel('Tamanho dos Arquivos')
     format_spines(ax2)
 
-    # Finalizando plotagem
-    plt.tight_layout()
-    
-    # Salvando figura
-    if 'save' in kwargs and bool(kwargs['save']):
-        output_path = kwargs['output_path'] if 'output_path' in kwargs else os.path.join(os.getcwd(), 'output/imgs')
-        output_filename = kwargs['output_filename'] if 'output_filename' in kwargs else 'visao_geral_diretorio.png'
-        save_fig(fig, output_path=output_path, img_name=output_filename)    
+    # Salvando figura e liberando recursos da renderização
+    return finaliza_visao(fig, img_name='visao_geral_diretorio.png', **kwargs)
 
 # Visão geral do usuário
 def visao_geral_usuario(df, **kwargs):
@@ -698,23 +2641,26 @@ def visao_geral_usuario(df, **kwargs):
     Parâmetros
     ----------
     :param df: base de dados com o report gerado [type: pd.DataFrame]
-    :param kwrgs
+    :param kwrgs: save, output_path, output_filename, dpi, formato, max_pontos (quantidade de
+        linhas a partir da qual a visão utiliza dados agregados, default=MAX_PONTOS_PLOT) e
+        col_tamanho (coluna de tamanho lógico ou físico, default='tamanho_kb')
     
     Retorno
     -------
-    Essa função não retorna nenhum parâmetro além da plotagem gráfica
+    :return saida: caminho da imagem salva (save=True) ou a figura gerada (save=False) [type: string or Figure]
     """
     
     # Definição de eixos usando GridSpec
-    fig = plt.figure(constrained_layout=True, figsize=(17, 6))
-    gs = GridSpec(1, 3, figure=fig)
+    fig = cria_figura(figsize=(17, 6))
+    gs = fig.add_gridspec(1, 3)
 
     # Definindo eixos
     ax1 = fig.add_subplot(gs[0, 0])
     ax2 = fig.add_subplot(gs[0, 1:])
 
     # Agregando dados por usuário
-    user_group = df.groupby(by='usuario_owner', as_index=False).agg({'tamanho_kb': 'sum',
+    col_tamanho = kwargs.get('col_tamanho', 'tamanho_kb')
+    user_group = df.groupby(by='usuario_owner', as_index=False).agg({col_tamanho: 'sum',
                                                                      'arquivo': 'count',
                                                                      'dias_desde_criacao': 'mean',                        
                                                                      'dias_desde_ult_acesso': 'mean'})
@@ -740,20 +2686,21 @@ def visao_geral_usuario(df, **kwargs):
     ax1.set_title(f'Espaço Total Alocado por Usuário', size=14)
     ax1.set_ylim(0, user_group['sum_tamanho_kb'].max() + user_group['sum_tamanho_kb'].max() * .10)
 
-    # Relação entre bases (tamanho versus dias desde último acesso)
-    sns.scatterplot(x='tamanho_kb', y='dias_desde_ult_acesso', hue='usuario_owner', data=df, 
-                    ax=ax2, size='tamanho_kb', palette='magma', sizes=(40, 400), alpha=.5)
+    # Relação entre bases (tamanho versus dias desde último acesso), amostrada em bases grandes
+    max_pontos = kwargs.get('max_pontos', MAX_PONTOS_PLOT)
+    df_dispersao = amostra_estratificada(df, col_estrato='usuario_owner', n=max_pontos,
+                                         cols_outliers=[col_tamanho, 'dias_desde_ult_acesso'])
+    sns.scatterplot(x=col_tamanho, y='dias_desde_ult_acesso', hue='usuario_owner', data=df_dispersao, 
+                    ax=ax2, size=col_tamanho, palette='magma', sizes=(40, 400), alpha=.5)
     format_spines(ax2)
     ax2.set_xlabel('Espaço Total Alocado')
     ax2.set_ylabel('Dias Desde Último Acesso')
-    ax2.set_title('Dispersão entre Tamanho das Bases e Dias sem Acesso', size=14)
-    plt.tight_layout()
-    
-    # Salvando figura
-    if 'save' in kwargs and bool(kwargs['save']):
-        output_path = kwargs['output_path'] if 'output_path' in kwargs else os.path.join(os.getcwd(), 'output/imgs')
-        output_filename = kwargs['output_filename'] if 'output_filename' in kwargs else 'visao_geral_usuarios.png'
-        save_fig(fig, output_path=output_path, img_name=output_filename)  
+    titulo = 'Dispersão entre Tamanho das Bases e Dias sem Acesso'
+    if len(df_dispersao) < len(df):
+        titulo += f'\n(amostra de {len(df_dispersao)} de {len(df)} arquivos)'
+    ax2.set_title(titulo, size=14)
+    # Salvando figura e liberando recursos da renderização
+    return finaliza_visao(fig, img_name='visao_geral_usuarios.png', **kwargs)
   
 # Visão geral de arquivos
 def visao_geral_arquivos(df, figsize=(17, 17), top_n=20, palette='Blues_r',
@@ -768,11 +2715,16 @@ def visao_geral_arquivos(df, figsize=(17, 17), top_n=20, palette='Blues_r',
     :param palette: paleta de cores da plotagem [type: string, default='viridis']
     :param plot_cols: lista contendo três colunas alvo de análise [type: list]
         *default=['tamanho_kb', 'dias_desde_ult_acesso', 'filescope_score']
+        *com kwargs['col_tamanho'], a coluna tamanho_kb é substituída pela coluna informada
+
+    Retorno
+    -------
+    :return saida: caminho da imagem salva (save=True) ou a figura gerada (save=False) [type: string or Figure]
     """
     
     # Definição de eixos usando GridSpec
-    fig = plt.figure(constrained_layout=True, figsize=figsize)
-    gs = GridSpec(3, 1, figure=fig)
+    fig = cria_figura(figsize=figsize)
+    gs = fig.add_gridspec(3, 1)
 
     # Definindo eixos
     ax1 = fig.add_subplot(gs[0])
@@ -780,6 +2732,8 @@ def visao_geral_arquivos(df, figsize=(17, 17), top_n=20, palette='Blues_r',
     ax3 = fig.add_subplot(gs[2])
     
     # Relizando plotagens
+    col_tamanho = kwargs.get('col_tamanho', 'tamanho_kb')
+    plot_cols = [col_tamanho if col == 'tamanho_kb' else col for col in plot_cols]
     for col, ax in zip(plot_cols, [ax1, ax2, ax3]):
         plot_file_param(df=df, col=col, ax=ax, top_n=top_n, palette=palette)
         format_spines(ax)
@@ -790,7 +2744,7 @@ def visao_geral_arquivos(df, figsize=(17, 17), top_n=20, palette='Blues_r',
             x = p.get_bbox().get_points()[1, 0]
             y = p.get_bbox().get_points()[:, 1]
             try:
-                if col == 'tamanho_kb':
+                if col in COLUNAS_TAMANHO:
                     ax.annotate(f'{convert_kb_into_str(x)}', (x, y.mean()), va='center', size=10)
                 else:
                     ax.annotate(f'{int(x)}', (x, y.mean()), va='center', size=10)
@@ -809,19 +2763,45 @@ def visao_geral_arquivos(df, figsize=(17, 17), top_n=20, palette='Blues_r',
     ax3.set_title(f'Top {top_n} com Maior Score filescope', size=14)
     ax3.set_xlabel('Score filescope (de 0 a 100)')
     
-    plt.tight_layout()
-    
-    # Salvando figura
-    if 'save' in kwargs and bool(kwargs['save']):
-        output_path = kwargs['output_path'] if 'output_path' in kwargs else os.path.join(os.getcwd(), 'output/imgs')
-        output_filename = kwargs['output_filename'] if 'output_filename' in kwargs else 'visao_geral_arquivos.png'
-        save_fig(fig, output_path=output_path, img_name=output_filename)  
+    # Salvando figura e liberando recursos da renderização
+    return finaliza_visao(fig, img_name='visao_geral_arquivos.png', **kwargs)
+
+# Visões do report visual: flag de generate_visual_report(), função de plotagem e colunas utilizadas
+VISOES_REPORT = {
+    'viz_dir': (visao_geral_dir, COLUNAS_TAMANHO),
+    'viz_user': (visao_geral_usuario, ['usuario_owner', 'arquivo', 'dias_desde_criacao', 'dias_desde_ult_acesso']
+                 + COLUNAS_TAMANHO),
+    'viz_file': (visao_geral_arquivos, ['arquivo', 'dias_desde_ult_acesso', 'filescope_score'] + COLUNAS_TAMANHO),
+}
+
+# Função executada pelos processos de renderização
+def renderiza_visao(visao, df, opcoes):
+    """
+    Renderiza uma das visões do report visual (utilizada nos processos de renderização)
+
+    Parâmetros
+    ----------
+    :param visao: chave da visão em VISOES_REPORT [type: string]
+    :param df: base de dados com as colunas utilizadas pela visão [type: pd.DataFrame]
+    :param opcoes: parâmetros repassados à função de plotagem (save, output_path, dpi, formato) [type: dict]
+
+    Retorno
+    -------
+    :return saida: retorno da função de plotagem da visão [type: string or Figure]
+    """
+
+    func, _ = VISOES_REPORT[visao]
+    return func(df=df, **opcoes)
 
 # Função geral para geração de report visual
 def generate_visual_report(df, viz_dir=True, viz_user=True, viz_file=True, save=True,
-                           output_path=os.path.join(os.getcwd(), 'output/imgs')):
+                           output_path=os.path.join(os.getcwd(), 'output/imgs'), dpi=300, formato='png',
+                           processos=None, max_pontos=MAX_PONTOS_PLOT, col_tamanho='tamanho_kb'):
     """
-    Função responsável por gerenciar as plotagens gráficas no report visual
+    Função responsável por gerenciar as plotagens gráficas no report visual. As figuras são
+    renderizadas pelo backend Agg, sem o estado global do pyplot, e as visões salvas em disco
+    são geradas em paralelo em processos independentes, cada um recebendo apenas as colunas
+    utilizadas pela sua visão
 
     Parâmetros
     ----------
@@ -831,13 +2811,55 @@ def generate_visual_report(df, viz_dir=True, viz_user=True, viz_file=True, save=
     :param viz_file: flag para plotagem de visao geral dos arquivos [type: bool, default=True]
     :param save: flag booleano para indicar o salvamento dos arquivos em disco [type: bool, default=True]
     :param output_path: diretório para salvamento dos arquivos [type: string, default=cwd() + 'output/imgs']  
+    :param dpi: resolução das imagens salvas [type: int, default=300]
+    :param formato: formato das imagens salvas (png, jpg, svg, pdf...) [type: string, default='png']
+    :param processos: quantidade de processos de renderização. Com processos=1 ou save=False as visões
+        são renderizadas no processo atual [type: int, default=None (uma por visão, limitado a os.cpu_count())]
+    :param max_pontos: quantidade de linhas a partir da qual as visões de diretório e de usuários utilizam
+        densidade sobre histograma logarítmico e dispersão amostrada [type: int, default=MAX_PONTOS_PLOT]
+    :param col_tamanho: coluna de tamanho das visões: 'tamanho_kb' (tamanho lógico) ou 'tamanho_fisico_kb'
+        (espaço alocado em disco, com hard links contabilizados uma única vez) [type: string, default='tamanho_kb']
+
+    Retorno
+    -------
+    :return imagens: dicionário {flag da visão: caminho da imagem salva} ou, com save=False,
+        {flag da visão: figura gerada} [type: dict]
+
+    Aplicação
+    ---------
+    imagens = generate_visual_report(df=df_root, output_path='output/imgs', dpi=150, formato='svg')
     """
 
-    # Gerando plotagens
-    if viz_dir:
-        visao_geral_dir(df=df, save=save, output_path=output_path)
-    if viz_user:
-        visao_geral_usuario(df=df, save=save, output_path=output_path)
-    if viz_file:
-        visao_geral_arquivos(df=df, save=save, output_path=output_path) 
+    # Validando formato das imagens e coluna de tamanho
+    if save and valida_formato_imagem(formato) is None:
+        return
+    if col_tamanho not in df.columns:
+        logger.error(f'Coluna de tamanho {col_tamanho} inexistente na base. Colunas possíveis: {COLUNAS_TAMANHO}')
+        return
+
+    visoes = [visao for visao, flag in zip(VISOES_REPORT, (viz_dir, viz_user, viz_file)) if flag]
+    opcoes = {'save': save, 'output_path': output_path, 'dpi': dpi, 'formato': formato, 'max_pontos': max_pontos,
+              'col_tamanho': col_tamanho}
+    if processos is None:
+        processos = min(len(visoes), os.cpu_count() or 1)
+
+    # Renderizando no processo atual (figuras retornadas ao chamador ou apenas uma visão/processo)
+    if not save or processos <= 1 or len(visoes) <= 1:
+        return {visao: renderiza_visao(visao, df, opcoes) for visao in visoes}
+
+    # Renderizando visões em paralelo
+    imagens = {}
+    logger.debug(f'Renderizando {len(visoes)} visões em {processos} processos')
+    with futures_processos.ProcessPoolExecutor(max_workers=processos) as pool:
+        futures = {}
+        for visao in visoes:
+            colunas = [col for col in VISOES_REPORT[visao][1] if col in df.columns]
+            futures[visao] = pool.submit(renderiza_visao, visao, df[colunas], opcoes)
+        for visao, future in futures.items():
+            try:
+                imagens[visao] = future.result()
+            except Exception as e:
+                logger.error(f'Erro ao renderizar a visão {visao}. Exception lançada: {e}')
+                imagens[visao] = None
 
+    return imagens
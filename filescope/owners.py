@@ -0,0 +1,163 @@
+"""
+---------------------------------------------------
+------------ TÓPICO: Usuários e Grupos ------------
+---------------------------------------------------
+Script python responsável por alocar funções de
+resolução de identificadores numéricos de usuários
+(uid) e grupos (gid) para seus respectivos nomes. As
+consultas são cacheadas, evitando acessos repetidos
+à base de usuários do sistema (passwd, LDAP, SSSD)
+para arquivos de um mesmo owner.
+
+Sumário
+---------------------------------------------------
+1. Configuração Inicial
+    1.1 Importando bibliotecas
+2. Resolução de Owners
+    2.1 Consultas individuais cacheadas
+    2.2 Resolução em lote
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Importando bibliotecas
+from functools import lru_cache
+
+# Módulos disponíveis apenas em sistemas Unix
+try:
+    from pwd import getpwuid
+except ImportError:
+    getpwuid = None
+try:
+    from grp import getgrgid
+except ImportError:
+    getgrgid = None
+
+
+"""
+---------------------------------------------------
+------------ 2. RESOLUÇÃO DE OWNERS ---------------
+       2.1 Consultas individuais cacheadas
+---------------------------------------------------
+"""
+
+# Nome de usuário a partir do uid
+@lru_cache(maxsize=None)
+def resolve_usuario(uid):
+    """
+    Função responsável por retornar o nome do usuário vinculado a um uid. Caso o uid
+    não possua entrada na base de usuários do sistema (ex: usuário removido), o próprio
+    uid é retornado em formato string
+
+    Parâmetros
+    ----------
+    :param uid: identificador numérico do usuário [type: int]
+
+    Retorno
+    -------
+    :return nome: nome do usuário ou uid em formato string [type: string]
+
+    Aplicação
+    ---------
+    owner = resolve_usuario(os.stat('/home/user/file.txt').st_uid)
+    """
+
+    if getpwuid is None:
+        return str(uid)
+    try:
+        return getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+# Nome do grupo a partir do gid
+@lru_cache(maxsize=None)
+def resolve_grupo(gid):
+    """
+    Função responsável por retornar o nome do grupo vinculado a um gid. Caso o gid
+    não possua entrada na base de grupos do sistema, o próprio gid é retornado em
+    formato string
+
+    Parâmetros
+    ----------
+    :param gid: identificador numérico do grupo [type: int]
+
+    Retorno
+    -------
+    :return nome: nome do grupo ou gid em formato string [type: string]
+
+    Aplicação
+    ---------
+    grupo = resolve_grupo(os.stat('/home/user/file.txt').st_gid)
+    """
+
+    if getgrgid is None:
+        return str(gid)
+    try:
+        return getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
+# Limpando caches de resolução
+def limpa_cache_owners():
+    """
+    Função responsável por descartar os nomes de usuários e grupos em cache, útil em
+    processos de longa duração onde a base de usuários pode ser alterada
+    """
+
+    resolve_usuario.cache_clear()
+    resolve_grupo.cache_clear()
+
+
+"""
+---------------------------------------------------
+------------ 2. RESOLUÇÃO DE OWNERS ---------------
+             2.2 Resolução em lote
+---------------------------------------------------
+"""
+
+# Resolução de múltiplos uids
+def resolve_usuarios(uids):
+    """
+    Função responsável por resolver os nomes de usuários de uma coleção de uids,
+    consultando a base de usuários apenas uma vez para cada uid distinto. Indicada
+    para resolução tardia, após a varredura completa de um diretório
+
+    Parâmetros
+    ----------
+    :param uids: coleção de uids (com repetições) [type: iterable]
+
+    Retorno
+    -------
+    :return nomes: dicionário no formato {uid: nome_usuario} [type: dict]
+
+    Aplicação
+    ---------
+    nomes = resolve_usuarios(all_uids)
+    owners = [nomes[uid] for uid in all_uids]
+    """
+
+    return {uid: resolve_usuario(uid) for uid in set(uids)}
+
+# Resolução de múltiplos gids
+def resolve_grupos(gids):
+    """
+    Função responsável por resolver os nomes de grupos de uma coleção de gids,
+    consultando a base de grupos apenas uma vez para cada gid distinto
+
+    Parâmetros
+    ----------
+    :param gids: coleção de gids (com repetições) [type: iterable]
+
+    Retorno
+    -------
+    :return nomes: dicionário no formato {gid: nome_grupo} [type: dict]
+    """
+
+    return {gid: resolve_grupo(gid) for gid in set(gids)}
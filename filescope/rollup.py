@@ -0,0 +1,229 @@
+"""
+---------------------------------------------------
+------- TÓPICO: Consolidação por Diretórios -------
+---------------------------------------------------
+Script python responsável por alocar a consolidação
+hierárquica (no estilo do utilitário du) dos arquivos
+encontrados na varredura de um diretório. Cada lote
+da varredura é agregado por diretório no momento em
+que é gerado, utilizando os códigos das colunas
+categóricas (sem agrupamentos sobre os caminhos em
+texto), e os totais de cada diretório são somados a
+todos os seus diretórios ancestrais ao final da
+varredura, em uma única passagem pelos diretórios.
+
+Sumário
+---------------------------------------------------
+1. Configuração Inicial
+    1.1 Importando bibliotecas
+2. Consolidação por Diretórios
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Importando bibliotecas
+import os
+
+# Bibliotecas de análise (importadas no primeiro uso, ver filescope.importacao)
+from filescope.importacao import ImportacaoTardia
+np = ImportacaoTardia('numpy')
+pd = ImportacaoTardia('pandas')
+
+
+"""
+---------------------------------------------------
+-------- 2. CONSOLIDAÇÃO POR DIRETÓRIOS -----------
+---------------------------------------------------
+"""
+
+# Posições dos acumuladores de cada diretório
+QTD, TAMANHO, MAX_DIAS, SOMA_DIAS, USUARIOS = range(5)
+
+
+class RollupDiretorios:
+    """
+    Classe responsável por acumular, durante a varredura, os totais de cada diretório
+    (quantidade de arquivos, espaço ocupado, dias desde o último acesso e espaço por
+    usuário owner) e por consolidá-los em todos os diretórios ancestrais até o diretório
+    raíz. Os caminhos são normalizados com os.path.abspath()
+
+    Parâmetros
+    ----------
+    :param root: diretório raíz da varredura [type: string]
+
+    Aplicação
+    ---------
+    rollup = RollupDiretorios(root='/mnt/share')
+    for df_lote in iter_scan(root='/mnt/share', rollup=rollup):
+        pass
+    df_rollup = rollup.para_dataframe(profundidade=2)
+    """
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self.proprios = {}
+        self._consolidado = None
+
+    def adiciona_lote(self, df_lote):
+        """
+        Agrega um lote da varredura (colunas diretorio, tamanho_kb, usuario_owner e
+        dias_desde_ult_acesso) por diretório, a partir dos códigos das colunas categóricas
+
+        Parâmetros
+        ----------
+        :param df_lote: lote retornado por iter_scan() [type: pd.DataFrame]
+        """
+
+        if len(df_lote) == 0:
+            return
+        self._consolidado = None
+
+        diretorios = df_lote['diretorio'].astype('category')
+        usuarios = df_lote['usuario_owner'].astype('category')
+        cod_dir = diretorios.cat.codes.to_numpy().astype('int64')
+        cod_usr = usuarios.cat.codes.to_numpy().astype('int64') + 1
+        tamanhos = df_lote['tamanho_kb'].to_numpy(dtype='float64')
+        dias = df_lote['dias_desde_ult_acesso'].to_numpy(dtype='float64')
+        n_dirs = len(diretorios.cat.categories)
+
+        # Agregações vetorizadas por código de diretório
+        qtd = np.bincount(cod_dir, minlength=n_dirs)
+        soma_tamanho = np.bincount(cod_dir, weights=tamanhos, minlength=n_dirs)
+        soma_dias = np.bincount(cod_dir, weights=dias, minlength=n_dirs)
+        max_dias = np.full(n_dirs, -np.inf)
+        np.maximum.at(max_dias, cod_dir, dias)
+
+        # Espaço e quantidade por combinação (diretório, usuário); usuário nulo com código 0
+        n_usr = len(usuarios.cat.categories) + 1
+        combinacao = cod_dir * n_usr + cod_usr
+        qtd_usr = np.bincount(combinacao, minlength=n_dirs * n_usr).reshape(n_dirs, n_usr)
+        tamanho_usr = np.bincount(combinacao, weights=tamanhos, minlength=n_dirs * n_usr).reshape(n_dirs, n_usr)
+        nomes_usr = [None] + list(usuarios.cat.categories)
+
+        for i in np.flatnonzero(qtd):
+            diretorio = os.path.abspath(diretorios.cat.categories[i])
+            acumulado = self.proprios.get(diretorio)
+            if acumulado is None:
+                acumulado = self.proprios[diretorio] = [0, 0.0, -np.inf, 0.0, {}]
+            acumulado[QTD] += int(qtd[i])
+            acumulado[TAMANHO] += float(soma_tamanho[i])
+            acumulado[MAX_DIAS] = max(acumulado[MAX_DIAS], float(max_dias[i]))
+            acumulado[SOMA_DIAS] += float(soma_dias[i])
+            for j in np.flatnonzero(qtd_usr[i]):
+                usuario = acumulado[USUARIOS].setdefault(nomes_usr[j], [0, 0.0])
+                usuario[0] += int(qtd_usr[i, j])
+                usuario[1] += float(tamanho_usr[i, j])
+
+    def consolida(self):
+        """
+        Soma os totais de cada diretório a todos os seus ancestrais até o diretório raíz,
+        processando os diretórios do nível mais profundo para o mais raso
+
+        Retorno
+        -------
+        :return consolidado: dicionário {diretorio: (profundidade, acumuladores)} [type: dict]
+        """
+
+        if self._consolidado is not None:
+            return self._consolidado
+
+        # Copiando acumuladores próprios e agrupando diretórios por profundidade relativa à raíz
+        consolidado, niveis = {}, {}
+        for diretorio, acumulado in self.proprios.items():
+            profundidade = self.profundidade(diretorio)
+            if profundidade is None:
+                continue
+            usuarios = {usuario: list(valores) for usuario, valores in acumulado[USUARIOS].items()}
+            consolidado[diretorio] = [profundidade, acumulado[:USUARIOS] + [usuarios]]
+            niveis.setdefault(profundidade, []).append(diretorio)
+        if self.root not in consolidado:
+            consolidado[self.root] = [0, [0, 0.0, -np.inf, 0.0, {}]]
+
+        # Propagando totais para o diretório pai (diretórios intermediários sem arquivos são criados)
+        for profundidade in range(max(niveis, default=0), 0, -1):
+            for diretorio in niveis.get(profundidade, []):
+                pai = os.path.dirname(diretorio)
+                if pai not in consolidado:
+                    consolidado[pai] = [profundidade - 1, [0, 0.0, -np.inf, 0.0, {}]]
+                    niveis.setdefault(profundidade - 1, []).append(pai)
+                filho, acumulado = consolidado[diretorio][1], consolidado[pai][1]
+                acumulado[QTD] += filho[QTD]
+                acumulado[TAMANHO] += filho[TAMANHO]
+                acumulado[MAX_DIAS] = max(acumulado[MAX_DIAS], filho[MAX_DIAS])
+                acumulado[SOMA_DIAS] += filho[SOMA_DIAS]
+                for usuario, (qtd, tamanho) in filho[USUARIOS].items():
+                    valores = acumulado[USUARIOS].setdefault(usuario, [0, 0.0])
+                    valores[0] += qtd
+                    valores[1] += tamanho
+
+        self._consolidado = consolidado
+        return consolidado
+
+    def profundidade(self, diretorio):
+        """Retorna a profundidade de um diretório em relação à raíz (None para diretórios fora da raíz)"""
+        if diretorio == self.root:
+            return 0
+        relativo = os.path.relpath(diretorio, self.root)
+        if relativo == os.pardir or relativo.startswith(os.pardir + os.sep):
+            return None
+        return relativo.count(os.sep) + 1
+
+    def para_dataframe(self, profundidade=None):
+        """
+        Gera o report consolidado por diretório
+
+        Parâmetros
+        ----------
+        :param profundidade: profundidade máxima dos diretórios retornados [type: int, default=None (todos)]
+
+        Retorno
+        -------
+        :return df_rollup: report com as colunas diretorio, profundidade, qtd_arquivos, tamanho_kb,
+            max_dias_desde_ult_acesso, media_dias_desde_ult_acesso, usuario_principal e
+            pct_tamanho_usuario_principal, ordenado pelo tamanho [type: pd.DataFrame]
+        """
+
+        linhas = []
+        for diretorio, (prof, acumulado) in self.consolida().items():
+            if profundidade is not None and prof > profundidade:
+                continue
+            qtd = acumulado[QTD]
+            usuario_principal, (_, tamanho_principal) = max(acumulado[USUARIOS].items(), key=lambda u: u[1][1],
+                                                            default=(None, (0, 0.0)))
+            linhas.append((diretorio, prof, qtd, acumulado[TAMANHO], acumulado[MAX_DIAS] if qtd else np.nan,
+                           acumulado[SOMA_DIAS] / qtd if qtd else np.nan, usuario_principal,
+                           100 * tamanho_principal / acumulado[TAMANHO] if acumulado[TAMANHO] else np.nan))
+
+        colunas = ['diretorio', 'profundidade', 'qtd_arquivos', 'tamanho_kb', 'max_dias_desde_ult_acesso',
+                   'media_dias_desde_ult_acesso', 'usuario_principal', 'pct_tamanho_usuario_principal']
+        df_rollup = pd.DataFrame(linhas, columns=colunas)
+        return df_rollup.sort_values(by=['tamanho_kb', 'diretorio'], ascending=[False, True]).reset_index(drop=True)
+
+    def por_usuario(self, profundidade=None):
+        """
+        Gera o report consolidado por diretório e usuário owner
+
+        Parâmetros
+        ----------
+        :param profundidade: profundidade máxima dos diretórios retornados [type: int, default=None (todos)]
+
+        Retorno
+        -------
+        :return df_usuarios: report com as colunas diretorio, profundidade, usuario_owner, qtd_arquivos
+            e tamanho_kb [type: pd.DataFrame]
+        """
+
+        linhas = [(diretorio, prof, usuario, qtd, tamanho)
+                  for diretorio, (prof, acumulado) in self.consolida().items()
+                  if profundidade is None or prof <= profundidade
+                  for usuario, (qtd, tamanho) in acumulado[USUARIOS].items()]
+        df_usuarios = pd.DataFrame(linhas, columns=['diretorio', 'profundidade', 'usuario_owner', 'qtd_arquivos',
+                                                    'tamanho_kb'])
+        return df_usuarios.sort_values(by=['diretorio', 'tamanho_kb'], ascending=[True, False]).reset_index(drop=True)
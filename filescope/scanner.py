@@ -0,0 +1,443 @@
+"""
+---------------------------------------------------
+------------ TÓPICO: Varredura de Diretórios ------
+---------------------------------------------------
+Script python responsável por alocar o motor de
+varredura de diretórios utilizado na construção do
+report de controle de diretório. A coleta de metadados
+é feita a partir de uma única chamada stat por arquivo,
+reaproveitando os objetos DirEntry retornados pela
+função os.scandir().
+
+Sumário
+---------------------------------------------------
+1. Configuração Inicial
+    1.1 Importando bibliotecas
+2. Varredura de Diretórios
+    2.1 Backends de varredura
+    2.2 Varredura paralela
+3. Armazenamento Colunar
+---------------------------------------------------
+"""
+
+
+"""
+---------------------------------------------------
+------------ 1. CONFIGURAÇÃO INICIAL --------------
+           1.1 Importando bibliotecas
+---------------------------------------------------
+"""
+
+# Importando bibliotecas
+import os
+import queue
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+
+"""
+---------------------------------------------------
+------------ 2. VARREDURA DE DIRETÓRIOS -----------
+            2.1 Backends de varredura
+---------------------------------------------------
+"""
+
+# Backends disponíveis para varredura
+BACKENDS = ['scandir', 'walk']
+
+# Listagem de um único diretório
+def lista_diretorio(diretorio):
+    """
+    Função responsável por listar um único diretório (sem recursão) a partir de
+    os.scandir(), separando arquivos e subdiretórios. O tipo de cada entrada é
+    obtido sem chamadas adicionais ao sistema (sempre que o sistema de arquivos
+    informa o tipo na listagem) e os metadados de cada arquivo são coletados a
+    partir de uma única chamada stat, cacheada no próprio objeto DirEntry
+
+    Parâmetros
+    ----------
+    :param diretorio: caminho do diretório a ser listado [type: string]
+
+    Retorno
+    -------
+    :return arquivos: lista de tuplas (nome, stat) dos arquivos do diretório [type: list]
+    :return subdirs: caminhos dos subdiretórios a serem percorridos [type: list]
+    :return erros: exceções OSError capturadas durante a listagem [type: list]
+    """
+
+    arquivos, subdirs, erros = [], [], []
+    try:
+        scandir_it = os.scandir(diretorio)
+    except OSError as e:
+        erros.append(e)
+        return arquivos, subdirs, erros
+
+    with scandir_it:
+        for entry in scandir_it:
+            # Diretórios: links simbólicos não são seguidos (os.walk com followlinks=False)
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                try:
+                    is_symlink = entry.is_symlink()
+                except OSError:
+                    is_symlink = False
+                if not is_symlink:
+                    subdirs.append(entry.path)
+                continue
+
+            # Arquivos: única chamada stat reaproveitada para todos os metadados
+            try:
+                arquivos.append((entry.name, entry.stat()))
+            except OSError as e:
+                erros.append(e)
+
+    return arquivos, subdirs, erros
+
+# Varredura baseada em os.scandir()
+def varre_scandir(root, onerror=None):
+    """
+    Função responsável por percorrer todos os arquivos de um diretório e de seus
+    subdiretórios utilizando os.scandir(), com uma única chamada stat por arquivo
+
+    Parâmetros
+    ----------
+    :param root: caminho do diretório a ser percorrido [type: string]
+    :param onerror: função chamada com a exceção OSError em caso de falha [type: callable, default=None]
+
+    Retorno
+    -------
+    :yields (diretorio, arquivo, stat): tupla com o diretório, o nome e o resultado stat do arquivo
+
+    Aplicação
+    ---------
+    for diretorio, arquivo, st in varre_scandir(root='/home/user/folder/'):
+        print(diretorio, arquivo, st.st_size)
+    """
+
+    # Pilha de diretórios pendentes (mesma ordem de visita do os.walk)
+    pendentes = [root]
+    while pendentes:
+        diretorio = pendentes.pop()
+        arquivos, subdirs, erros = lista_diretorio(diretorio)
+        for e in erros:
+            if onerror is not None:
+                onerror(e)
+        for nome, st in arquivos:
+            yield diretorio, nome, st
+
+        # Empilhando subdiretórios em ordem reversa para manter a ordem de visita
+        pendentes.extend(reversed(subdirs))
+
+# Varredura baseada em os.walk()
+def varre_walk(root, onerror=None):
+    """
+    Função responsável por percorrer todos os arquivos de um diretório e de seus
+    subdiretórios utilizando os.walk() e uma chamada os.stat() por arquivo
+
+    Parâmetros
+    ----------
+    :param root: caminho do diretório a ser percorrido [type: string]
+    :param onerror: função chamada com a exceção OSError em caso de falha [type: callable, default=None]
+
+    Retorno
+    -------
+    :yields (diretorio, arquivo, stat): tupla com o diretório, o nome e o resultado stat do arquivo
+    """
+
+    for path, _, files in os.walk(root, onerror=onerror):
+        for name in files:
+            try:
+                st = os.stat(os.path.join(path, name))
+            except OSError as e:
+                if onerror is not None:
+                    onerror(e)
+                continue
+            yield path, name, st
+
+# Função de entrada para escolha do backend
+def varre_diretorio(root, backend='scandir', onerror=None, workers=1):
+    """
+    Função responsável por direcionar a varredura de um diretório ao backend escolhido
+
+    Parâmetros
+    ----------
+    :param root: caminho do diretório a ser percorrido [type: string]
+    :param backend: backend de varredura [type: string, default='scandir']
+            *opções: 'scandir' ou 'walk'
+    :param onerror: função chamada com a exceção OSError em caso de falha [type: callable, default=None]
+    :param workers: quantidade de threads utilizadas na varredura [type: int, default=1]
+            *valores maiores que 1 exigem o backend 'scandir'
+
+    Retorno
+    -------
+    :yields (diretorio, arquivo, stat): tupla com o diretório, o nome e o resultado stat do arquivo
+
+    Aplicação
+    ---------
+    for diretorio, arquivo, st in varre_diretorio(root='/home/user/folder/', backend='scandir'):
+        print(diretorio, arquivo, st.st_mtime)
+    """
+
+    if workers > 1:
+        if backend != 'scandir':
+            raise ValueError(f'Varredura paralela (workers={workers}) disponível apenas para o backend scandir')
+        return varre_paralelo(root, workers=workers, onerror=onerror)
+
+    if backend == 'scandir':
+        return varre_scandir(root, onerror=onerror)
+    elif backend == 'walk':
+        return varre_walk(root, onerror=onerror)
+    else:
+        raise ValueError(f'Backend {backend} inválido. Deve estar entre {BACKENDS}')
+
+
+"""
+---------------------------------------------------
+------------ 2. VARREDURA DE DIRETÓRIOS -----------
+             2.2 Varredura paralela
+---------------------------------------------------
+"""
+
+# Varredura paralela com pool de threads
+def varre_paralelo(root, workers=8, onerror=None, max_pendentes=None):
+    """
+    Função responsável por percorrer um diretório utilizando um pool de threads que
+    consome subdiretórios de uma fila compartilhada. Em sistemas de arquivos de rede,
+    a varredura é limitada pela latência das chamadas ao sistema (que liberam o GIL),
+    permitindo que múltiplas listagens sejam realizadas simultaneamente.
+
+    A fila de trabalho é priorizada pela posição de cada diretório na ordem de visita
+    da varredura serial, de modo que as threads sempre avançam sobre os diretórios
+    mais próximos do próximo resultado a ser entregue. Os resultados são entregues
+    exatamente na mesma ordem da varredura serial e a quantidade de diretórios em
+    processamento ou aguardando consumo é limitada (max_pendentes), pausando as
+    threads sempre que o consumo for mais lento que a varredura.
+
+    Parâmetros
+    ----------
+    :param root: caminho do diretório a ser percorrido [type: string]
+    :param workers: quantidade de threads do pool [type: int, default=8]
+    :param onerror: função chamada com a exceção OSError em caso de falha [type: callable, default=None]
+    :param max_pendentes: quantidade máxima de diretórios listados (ou em listagem) ainda não
+        entregues [type: int, default=workers*4]
+
+    Retorno
+    -------
+    :yields (diretorio, arquivo, stat): tupla com o diretório, o nome e o resultado stat do arquivo
+
+    Aplicação
+    ---------
+    for diretorio, arquivo, st in varre_paralelo(root='/mnt/nfs/share/', workers=32):
+        print(diretorio, arquivo, st.st_size)
+    """
+
+    workers = max(int(workers), 1)
+    max_pendentes = max(int(max_pendentes or workers * 4), 1)
+
+    # Fila de trabalho priorizada pela ordem de visita e limite de diretórios em trânsito (fila de
+    # resultados + buffer de reordenação): uma permissão é obtida antes de retirar um diretório da
+    # fila de trabalho e liberada apenas após a entrega de seus arquivos. Como a fila entrega sempre
+    # o diretório de menor posição, toda permissão liberada é utilizada pelo próximo diretório a ser
+    # entregue (ou por um anterior a ele), de modo que a varredura não fica bloqueada
+    trabalho = queue.PriorityQueue()
+    resultados = queue.Queue()
+    permissoes = threading.Semaphore(max_pendentes)
+    parar = threading.Event()
+    trabalho.put(((), root))
+
+    def worker():
+        while not parar.is_set():
+            # Aguardando permissão sem bloquear o encerramento
+            if not permissoes.acquire(timeout=.1):
+                continue
+            chave, diretorio = trabalho.get()
+            if diretorio is None:
+                return
+            try:
+                arquivos, subdirs, erros = lista_diretorio(diretorio)
+                filhos = [chave + (i,) for i in range(len(subdirs))]
+                for filho, subdir in zip(filhos, subdirs):
+                    trabalho.put((filho, subdir))
+                resultado = (chave, diretorio, arquivos, filhos, erros, None)
+            except BaseException as e:
+                resultado = (chave, diretorio, [], [], [], e)
+            resultados.put(resultado)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for _ in range(workers):
+            pool.submit(worker)
+
+        try:
+            # Entregando resultados na ordem de visita da varredura serial
+            buffer = {}
+            pendentes = [()]
+            while pendentes:
+                chave = pendentes.pop()
+                while chave not in buffer:
+                    resultado = resultados.get()
+                    buffer[resultado[0]] = resultado
+                _, diretorio, arquivos, filhos, erros, falha = buffer.pop(chave)
+                if falha is not None:
+                    raise falha
+                for e in erros:
+                    if onerror is not None:
+                        onerror(e)
+                for nome, st in arquivos:
+                    yield diretorio, nome, st
+                permissoes.release()
+                pendentes.extend(reversed(filhos))
+        finally:
+            # Encerrando threads (inclusive em caso de interrupção do consumidor)
+            parar.set()
+            for i in range(workers):
+                trabalho.put(((float('inf'), i), None))
+
+
+"""
+---------------------------------------------------
+----------- 3. ARMAZENAMENTO COLUNAR --------------
+---------------------------------------------------
+"""
+
+# Espaço alocado em disco de um arquivo
+def espaco_alocado(st):
+    """
+    Retorna o espaço efetivamente alocado em disco por um arquivo (st_blocks em unidades de
+    512 bytes), menor que o tamanho lógico em arquivos esparsos ou comprimidos pelo sistema
+    de arquivos. Em sistemas sem st_blocks (ex: Windows), retorna o tamanho lógico
+
+    Parâmetros
+    ----------
+    :param st: resultado stat do arquivo [type: os.stat_result]
+
+    Retorno
+    -------
+    :return alocado: espaço alocado em bytes [type: int]
+    """
+
+    blocos = getattr(st, 'st_blocks', None)
+    return st.st_size if blocos is None else blocos * 512
+
+
+class ColunasVarredura:
+    """
+    Classe responsável por armazenar os metadados coletados na varredura de um
+    diretório em formato colunar e compacto. Valores numéricos são armazenados em
+    arrays tipados (8 bytes por valor, sem objetos Python individuais) e os
+    diretórios são codificados em dicionário, ou seja, cada diretório é armazenado
+    uma única vez e os arquivos guardam apenas o código do respectivo diretório.
+
+    Os arrays expõem o protocolo de buffer e podem ser lidos pelo numpy sem cópia
+    (np.frombuffer), permitindo a construção do report final sem listas
+    intermediárias.
+
+    Atributos
+    ---------
+    :attr diretorios: diretórios distintos encontrados (categorias) [type: list]
+    :attr cod_diretorio: código do diretório de cada arquivo [type: array('q')]
+    :attr arquivos: nomes dos arquivos [type: list]
+    :attr tamanhos: tamanho em bytes (st_size) [type: array('q')]
+    :attr alocados: espaço alocado em disco em bytes (st_blocks * 512) [type: array('q')]
+    :attr ctime_ns, mtime_ns, atime_ns: timestamps em nanosegundos [type: array('q')]
+    :attr uids, gids: identificadores de usuário e grupo owners [type: array('q')]
+    :attr links: chave (st_dev, st_ino) dos arquivos com mais de um hard link, por posição [type: dict]
+
+    Aplicação
+    ---------
+    colunas = ColunasVarredura()
+    for diretorio, arquivo, st in varre_diretorio(root='/home/user/folder/'):
+        colunas.adiciona(diretorio, arquivo, st)
+    """
+
+    def __init__(self):
+        self.diretorios = []
+        self.cod_diretorio = array('q')
+        self.arquivos = []
+        self.tamanhos = array('q')
+        self.alocados = array('q')
+        self.ctime_ns = array('q')
+        self.mtime_ns = array('q')
+        self.atime_ns = array('q')
+        self.uids = array('q')
+        self.gids = array('q')
+        self.links = {}
+        self._codigos = {}
+        self._ultimo_dir = None
+        self._ultimo_cod = -1
+
+    def __len__(self):
+        return len(self.arquivos)
+
+    def adiciona(self, diretorio, arquivo, st):
+        """
+        Adiciona os metadados de um arquivo às colunas a partir de seu resultado stat
+
+        Parâmetros
+        ----------
+        :param diretorio: diretório do arquivo [type: string]
+        :param arquivo: nome do arquivo [type: string]
+        :param st: resultado stat do arquivo [type: os.stat_result]
+        """
+
+        self.adiciona_valores(diretorio, arquivo, st.st_size, st.st_ctime_ns, st.st_mtime_ns, st.st_atime_ns,
+                              st.st_uid, st.st_gid, espaco_alocado(st), st.st_dev, st.st_ino, st.st_nlink)
+
+    def adiciona_valores(self, diretorio, arquivo, tamanho, ctime_ns, mtime_ns, atime_ns, uid, gid, alocado=None,
+                         dev=None, ino=None, nlink=None):
+        """
+        Adiciona os metadados de um arquivo às colunas a partir de valores individuais
+        (ex: registros lidos do índice de varreduras). Sem o espaço alocado, é considerado
+        o tamanho do arquivo e, sem a quantidade de hard links, o arquivo é considerado único
+        """
+
+        # Codificando diretório (arquivos de um mesmo diretório chegam em sequência)
+        if diretorio != self._ultimo_dir:
+            cod = self._codigos.get(diretorio)
+            if cod is None:
+                cod = len(self.diretorios)
+                self._codigos[diretorio] = cod
+                self.diretorios.append(diretorio)
+            self._ultimo_dir = diretorio
+            self._ultimo_cod = cod
+
+        self.cod_diretorio.append(self._ultimo_cod)
+        self.arquivos.append(arquivo)
+        self.tamanhos.append(tamanho)
+        self.alocados.append(tamanho if alocado is None else alocado)
+        if nlink is not None and nlink > 1:
+            self.links[len(self.arquivos) - 1] = (dev, ino)
+        self.ctime_ns.append(ctime_ns)
+        self.mtime_ns.append(mtime_ns)
+        self.atime_ns.append(atime_ns)
+        self.uids.append(uid)
+        self.gids.append(gid)
+
+# Coletando varredura em formato colunar
+def coleta_colunas(registros):
+    """
+    Função responsável por consumir um iterador de registros (diretorio, arquivo, stat)
+    e armazená-los em formato colunar
+
+    Parâmetros
+    ----------
+    :param registros: iterador retornado por varre_diretorio() [type: iterable]
+
+    Retorno
+    -------
+    :return colunas: metadados em formato colunar [type: ColunasVarredura]
+
+    Aplicação
+    ---------
+    colunas = coleta_colunas(varre_diretorio(root='/home/user/folder/', workers=8))
+    """
+
+    colunas = ColunasVarredura()
+    adiciona = colunas.adiciona
+    for diretorio, arquivo, st in registros:
+        adiciona(diretorio, arquivo, st)
+
+    return colunas
@@ -46,6 +46,11 @@ setup(
         'matplotlib==3.2.1',
         'seaborn==0.11.1',
     ],
+    extras_require={
+        'parquet': ['pyarrow'],
+        'zstd': ['zstandard'],
+        'xxhash': ['xxhash'],
+    },
     license='MIT',
     description='Gerenciamento de arquivos em diretórios locais a partir de funcionalidades encapsuladas',
     long_description=__long_description__,
@@ -0,0 +1,131 @@
+"""
+---------------------------------------------------
+--------- Testes - Funções assíncronas ------------
+---------------------------------------------------
+Testes das funções do módulo filescope.assincrono
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_assincrono.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import asyncio
+import os
+
+# Bibliotecas de teste
+import pytest
+
+# Filescope
+from filescope.assincrono import ExecutorFilescope, valida_arquivo_origem_async, copia_arquivo_async, \
+    controle_de_diretorio_async, CopiaCancelada
+from filescope.manager import copia_arquivo_verificado, controle_de_diretorio
+
+
+def test_executor_padrao_em_event_loops_sucessivos(tmp_path):
+    (tmp_path / 'arquivo.txt').write_text('conteudo')
+
+    async def main():
+        return await asyncio.gather(*[valida_arquivo_origem_async(str(tmp_path), 'arquivo.txt')
+                                      for _ in range(100)])
+
+    # O executor compartilhado sobrevive ao primeiro event loop
+    assert all(asyncio.run(main()))
+    assert all(asyncio.run(main()))
+
+
+def test_controle_de_diretorio_async_igual_sincrono_com_progresso(tmp_path):
+    for i in range(5):
+        (tmp_path / f'arquivo{i}.txt').write_text('x' * 100 * i)
+    progresso = []
+
+    async def main():
+        return await asyncio.gather(controle_de_diretorio_async(str(tmp_path), batch_size=2,
+                                                                progresso=progresso.append),
+                                    valida_arquivo_origem_async(str(tmp_path), 'arquivo0.txt'))
+
+    df_root, presente = asyncio.run(main())
+    assert presente
+    assert progresso == [2, 4, 5]
+    colunas = ['diretorio', 'arquivo', 'tamanho_kb', 'filescope_score']
+    df_sincrono = controle_de_diretorio(str(tmp_path))[colunas].reset_index(drop=True)
+    assert df_root[colunas].reset_index(drop=True).equals(df_sincrono)
+
+
+def test_copia_verificada_valida_presenca(tmp_path):
+    origem, destino = str(tmp_path / 'inexistente.bin'), str(tmp_path / 'destino' / 'inexistente.bin')
+    resultado = asyncio.run(copia_arquivo_async(origem, destino, valida_presenca=True, verificada=True))
+    assert not resultado.sucesso
+    assert isinstance(resultado.erro, FileNotFoundError)
+    assert not (tmp_path / 'destino').exists()
+
+    (tmp_path / 'origem.bin').write_bytes(b'conteudo')
+    resultado = asyncio.run(copia_arquivo_async(str(tmp_path / 'origem.bin'), destino, valida_presenca=True,
+                                                verificada=True))
+    assert resultado.sucesso
+
+
+def test_controle_de_diretorio_async_col_tamanho_invalida(tmp_path):
+    (tmp_path / 'arquivo.txt').write_text('conteudo')
+    assert asyncio.run(controle_de_diretorio_async(str(tmp_path), col_tamanho='bogus')) is None
+    df_root = asyncio.run(controle_de_diretorio_async(str(tmp_path), col_tamanho='tamanho_fisico_kb'))
+    assert list(df_root['arquivo']) == ['arquivo.txt']
+
+
+def test_executor_vaga_respeita_limite_e_contadores():
+    async def main():
+        async with ExecutorFilescope(max_workers=4, limites={'copia': 2}) as executor:
+            simultaneas, maximo = 0, 0
+
+            async def operacao():
+                nonlocal simultaneas, maximo
+                async with executor.vaga('copia'):
+                    simultaneas += 1
+                    maximo = max(maximo, simultaneas)
+                    await asyncio.sleep(.01)
+                    simultaneas -= 1
+
+            await asyncio.gather(*[operacao() for _ in range(6)])
+            return maximo, executor.status(), executor.max_workers
+
+    maximo, status, max_workers = asyncio.run(main())
+    assert maximo == 2
+    assert status == {'em_execucao': {'copia': 0}, 'concluidas': {'copia': 6}}
+    assert max_workers == 4
+
+
+def test_controle_de_diretorio_async_rollup(tmp_path):
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'arquivo.bin').write_bytes(b'x' * 2000)
+    df_root, df_rollup = asyncio.run(controle_de_diretorio_async(str(tmp_path), rollup=True, profundidade=0))
+    assert len(df_root) == 1
+    assert list(df_rollup['diretorio']) == [str(tmp_path)]
+    assert list(df_rollup['tamanho_kb']) == [2.0]
+
+
+def test_copia_verificada_cancelada_mantem_parcial(tmp_path):
+    origem, destino = tmp_path / 'origem.bin', tmp_path / 'destino.bin'
+    origem.write_bytes(os.urandom(4 * 8 * 1024**2))
+
+    async def main():
+        executor = ExecutorFilescope(max_workers=2)
+        tarefa = asyncio.create_task(copia_arquivo_async(str(origem), str(destino), verificada=True, executor=executor,
+                                                         progresso=lambda qtd, total: tarefa.cancel()))
+        with pytest.raises(asyncio.CancelledError):
+            await tarefa
+        executor.pool.shutdown(wait=True)
+
+    asyncio.run(main())
+    assert not destino.exists()
+    assert (tmp_path / '.destino.bin.parcial').exists()
+
+
+def test_copia_arquivo_verificado_repassa_cancelamento(tmp_path):
+    origem = tmp_path / 'origem.bin'
+    origem.write_bytes(b'x' * 1024)
+
+    def cancela(qtd, total):
+        raise CopiaCancelada('cancelada')
+    with pytest.raises(CopiaCancelada):
+        copia_arquivo_verificado(str(origem), str(tmp_path / 'destino.bin'), progresso=cancela)
@@ -0,0 +1,62 @@
+"""
+---------------------------------------------------
+--------- Testes - Armazenamento colunar ----------
+---------------------------------------------------
+Testes do armazenamento colunar da varredura com
+ColunasVarredura e colunas_para_dataframe()
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_colunas.py
+---------------------------------------------------
+"""
+
+# Filescope
+from filescope.scanner import ColunasVarredura, coleta_colunas, varre_scandir
+from filescope.manager import colunas_para_dataframe, np, pd
+
+DIA_NS = 86400 * 10**9
+
+
+def test_colunas_codificam_diretorios_uma_unica_vez():
+    colunas = ColunasVarredura()
+    for diretorio, arquivo in [('/b', 'x'), ('/b', 'y'), ('/a', 'z'), ('/b', 'w')]:
+        colunas.adiciona_valores(diretorio, arquivo, 1000, 0, 0, 0, 0, 0)
+
+    assert len(colunas) == 4
+    assert colunas.diretorios == ['/b', '/a']
+    assert list(colunas.cod_diretorio) == [0, 0, 1, 0]
+    assert np.frombuffer(colunas.tamanhos, dtype='int64').sum() == 4000
+
+
+def test_colunas_para_dataframe():
+    colunas = ColunasVarredura()
+    colunas.adiciona_valores('/z', 'antigo.txt', 2000, 0, 10 * DIA_NS, 20 * DIA_NS, 0, 0, alocado=4096)
+    colunas.adiciona_valores('/a', 'novo.txt', 500, 25 * DIA_NS, 25 * DIA_NS, 30 * DIA_NS, 0, 0)
+    dt_relatorio = np.datetime64(30 * DIA_NS, 'ns')
+
+    df = colunas_para_dataframe(colunas, tz='UTC', dt_relatorio=dt_relatorio)
+    assert list(df['arquivo']) == ['antigo.txt', 'novo.txt']
+    assert list(df['tamanho_kb']) == [2.0, 0.5]
+    assert list(df['tamanho_fisico_kb']) == [4.096, 0.5]
+    assert list(df['dias_desde_criacao']) == [30, 5]
+    assert list(df['dias_desde_ult_modif']) == [20, 5]
+    assert list(df['dias_desde_ult_acesso']) == [10, 0]
+    assert df['dt_ult_modif'].iloc[0] == pd.Timestamp('1970-01-11')
+
+    # Colunas categóricas com categorias em ordem alfabética
+    assert isinstance(df['diretorio'].dtype, pd.CategoricalDtype)
+    assert list(df['diretorio'].cat.categories) == ['/a', '/z']
+    assert list(df['diretorio']) == ['/z', '/a']
+    assert isinstance(df['usuario_owner'].dtype, pd.CategoricalDtype)
+
+
+def test_coleta_colunas_da_varredura(tmp_path):
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'a.txt').write_bytes(b'a' * 10)
+    (tmp_path / 'sub' / 'b.txt').write_bytes(b'b' * 20)
+
+    df = colunas_para_dataframe(coleta_colunas(varre_scandir(str(tmp_path))), grupo_owner=True)
+    assert dict(zip(df['arquivo'], df['tamanho_kb'])) == {'a.txt': .01, 'b.txt': .02}
+    assert set(df['diretorio']) == {str(tmp_path), str(tmp_path / 'sub')}
+    assert 'grupo_owner' in df.columns
@@ -0,0 +1,153 @@
+"""
+---------------------------------------------------
+------------ Testes - Cópia de arquivos -----------
+---------------------------------------------------
+Testes da cópia em lote com copia_lote() e da
+cópia verificada e retomável com copia_verificada()
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_copia.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import os
+import shutil
+
+# Bibliotecas de teste
+import pytest
+
+# Filescope
+from filescope.copia import copia_conteudo, copia_verificada, copia_lote
+from filescope import copia
+
+
+@pytest.mark.parametrize('chamadas_disponiveis', [('copy_file_range', 'sendfile'), ('sendfile',), ()])
+def test_copia_conteudo_metodos(tmp_path, monkeypatch, chamadas_disponiveis):
+    for chamada in ('copy_file_range', 'sendfile'):
+        if chamada not in chamadas_disponiveis:
+            monkeypatch.delattr(copia.os, chamada, raising=False)
+    origem, destino = tmp_path / 'origem.bin', tmp_path / 'destino.bin'
+    conteudo = os.urandom(3 * 1024**2 + 17)
+    origem.write_bytes(conteudo)
+
+    qtd_bytes, metodo = copia_conteudo(str(origem), str(destino))
+    assert qtd_bytes == len(conteudo)
+    assert metodo in chamadas_disponiveis + ('usuario',)
+    assert destino.read_bytes() == conteudo
+
+
+def test_copia_lote_estatisticas_e_falhas_isoladas(tmp_path):
+    origem = tmp_path / 'origem'
+    origem.mkdir()
+    pares = []
+    for i in range(10):
+        (origem / f'arquivo_{i}.bin').write_bytes(b'x' * 1000 * (i + 1))
+        pares.append((str(origem / f'arquivo_{i}.bin'), str(tmp_path / 'destino' / f'sub{i % 3}' / f'arquivo_{i}.bin')))
+    pares.append((str(origem / 'inexistente.bin'), str(tmp_path / 'destino' / 'inexistente.bin')))
+
+    resultados, estatisticas = copia_lote(pares, workers=4, valida_presenca=True)
+    assert [r.destino for r in resultados] == [destino for _, destino in pares]
+    assert [r.sucesso for r in resultados] == [True] * 10 + [False]
+    assert isinstance(resultados[-1].erro, FileNotFoundError)
+    assert {k: estatisticas[k] for k in ('qtd_arquivos', 'qtd_sucesso', 'qtd_falhas', 'qtd_bytes')} == \
+        {'qtd_arquivos': 11, 'qtd_sucesso': 10, 'qtd_falhas': 1, 'qtd_bytes': 55000}
+    for origem_par, destino_par in pares[:-1]:
+        with open(origem_par, 'rb') as f_origem, open(destino_par, 'rb') as f_destino:
+            assert f_origem.read() == f_destino.read()
+
+
+class Interrupcao(Exception):
+    pass
+
+
+def test_copia_retomada_contabiliza_apenas_bytes_gravados(tmp_path):
+    origem, destino = str(tmp_path / 'origem.bin'), str(tmp_path / 'destino.bin')
+    conteudo = os.urandom(10 * 1024)
+    with open(origem, 'wb') as f:
+        f.write(conteudo)
+
+    # Interrompendo a cópia após os 3 primeiros blocos
+    def interrompe(qtd_copiada, qtd_total):
+        if qtd_copiada >= 3 * 1024:
+            raise Interrupcao()
+    with pytest.raises(Interrupcao):
+        copia_verificada(origem, destino, tamanho_bloco=1024, progresso=interrompe)
+
+    resultado = copia_verificada(origem, destino, tamanho_bloco=1024)
+    assert resultado.metodo == 'retomado'
+    assert resultado.qtd_bytes == len(conteudo) - 3 * 1024
+    with open(destino, 'rb') as f:
+        assert f.read() == conteudo
+
+    # Cópia completa contabiliza o arquivo inteiro e cópia ignorada não contabiliza bytes
+    os.remove(destino)
+    assert copia_verificada(origem, destino, tamanho_bloco=1024).qtd_bytes == len(conteudo)
+    assert copia_verificada(origem, destino, tamanho_bloco=1024).qtd_bytes == 0
+
+
+def test_copia_lote_mesmo_arquivo_nao_trunca_origem(tmp_path):
+    origem = str(tmp_path / 'a.bin')
+    conteudo = os.urandom(10000)
+    with open(origem, 'wb') as f:
+        f.write(conteudo)
+    os.link(origem, str(tmp_path / 'link.bin'))
+
+    resultados, estatisticas = copia_lote([(origem, origem), (origem, str(tmp_path / 'link.bin'))])
+    assert [r.sucesso for r in resultados] == [False, False]
+    assert all(isinstance(r.erro, shutil.SameFileError) for r in resultados)
+    assert estatisticas['qtd_bytes'] == 0
+    with open(origem, 'rb') as f:
+        assert f.read() == conteudo
+
+
+def test_copia_verificada_nao_mantem_arquivos_auxiliares(tmp_path):
+    origem, destino = tmp_path / 'origem' / 'a.bin', tmp_path / 'destino' / 'a.bin'
+    origem.parent.mkdir()
+    destino.parent.mkdir()
+    origem.write_bytes(os.urandom(4096))
+
+    resultado = copia_verificada(str(origem), str(destino), tamanho_bloco=1024)
+    assert resultado.metodo == 'completo'
+    assert os.listdir(destino.parent) == ['a.bin']
+
+    # Execução repetida: ignorada apenas com chamadas stat ou comparando checksums de origem e destino
+    assert copia_verificada(str(origem), str(destino)).metodo == 'ignorado'
+    repetida = copia_verificada(str(origem), str(destino), verifica_hash=True)
+    assert (repetida.metodo, repetida.checksum) == ('ignorado', resultado.checksum)
+    assert os.listdir(destino.parent) == ['a.bin']
+
+
+def test_copia_verificada_registra_checksum_no_dir_estado(tmp_path):
+    origem, destino, estado = tmp_path / 'origem.bin', tmp_path / 'destino' / 'a.bin', tmp_path / 'estado'
+    destino.parent.mkdir()
+    origem.write_bytes(os.urandom(4096))
+
+    resultado = copia_verificada(str(origem), str(destino), dir_estado=str(estado))
+    assert os.listdir(destino.parent) == ['a.bin']
+    assert len(os.listdir(estado)) == 1
+
+    # Destino corrompido com tamanho e data preservados: o checksum registrado não relê o destino
+    st = os.stat(destino)
+    destino.write_bytes(b'\0' * 4096)
+    os.utime(destino, ns=(st.st_atime_ns, st.st_mtime_ns))
+    repetida = copia_verificada(str(origem), str(destino), verifica_hash=True, dir_estado=str(estado))
+    assert (repetida.metodo, repetida.checksum) == ('ignorado', resultado.checksum)
+
+    # Sem o registro, os checksums de origem e destino divergem e a cópia é refeita
+    assert copia_verificada(str(origem), str(destino), verifica_hash=True).metodo == 'completo'
+    assert destino.read_bytes() == origem.read_bytes()
+
+
+def test_copia_verificada_rejeita_mesmo_arquivo(tmp_path):
+    origem = tmp_path / 'a.bin'
+    conteudo = os.urandom(4096)
+    origem.write_bytes(conteudo)
+    os.link(origem, tmp_path / 'link.bin')
+
+    for destino in (origem, tmp_path / 'link.bin'):
+        with pytest.raises(shutil.SameFileError):
+            copia_verificada(str(origem), str(destino))
+    assert origem.read_bytes() == conteudo
+    assert sorted(os.listdir(tmp_path)) == ['a.bin', 'link.bin']
@@ -0,0 +1,66 @@
+"""
+---------------------------------------------------
+----------- Testes - Conversão de datas -----------
+---------------------------------------------------
+Testes da conversão vetorizada de timestamps com
+epoch_para_datetime()
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_datas.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import datetime
+import time
+
+# Bibliotecas de teste
+import pytest
+
+# Filescope
+from filescope import manager
+from filescope.manager import epoch_para_datetime, np
+
+
+@pytest.fixture
+def fuso_local(monkeypatch):
+    # Fuso com horário de verão (transições às 02:00 e 03:00 no horário local)
+    monkeypatch.setenv('TZ', 'Europe/Berlin')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def referencia(epochs_ns):
+    return np.array([np.datetime64(datetime.datetime.fromtimestamp(e // 10**9).replace(tzinfo=None), 'ns')
+                     + np.timedelta64(e % 10**9, 'ns') for e in epochs_ns])
+
+
+def test_fuso_local_igual_localtime(fuso_local):
+    # Instantes ao redor das transições de 2021 (28/03 e 31/10) e datas distantes
+    transicoes = [1616893200, 1635642000]
+    epochs_s = [t + d for t in transicoes for d in range(-7200, 7200, 600)] + [0, 86399, 1700000000, 4102444800]
+    epochs_ns = np.array(epochs_s, dtype='int64') * 10**9 + 123456789
+    np.testing.assert_array_equal(epoch_para_datetime(epochs_ns), referencia(epochs_ns))
+
+
+def test_fuso_utc(fuso_local):
+    epochs_ns = np.array([0, 1616893200 * 10**9], dtype='int64')
+    assert list(epoch_para_datetime(epochs_ns, tz='UTC')) == [np.datetime64('1970-01-01T00:00:00'),
+                                                               np.datetime64('2021-03-28T01:00:00')]
+
+
+def test_datas_isoladas_nao_ampliam_consultas(fuso_local, monkeypatch):
+    chamadas = []
+    localtime = time.localtime
+    def localtime_contado(*args):
+        chamadas.append(args)
+        return localtime(*args)
+    monkeypatch.setattr(manager.time, 'localtime', localtime_contado)
+
+    # Arquivo com data epoch 0, arquivos recentes e data distante no futuro
+    epochs_ns = np.array([0, 1700000000, 1700003600, 4102444800], dtype='int64') * 10**9
+    np.testing.assert_array_equal(epoch_para_datetime(epochs_ns), referencia(epochs_ns))
+    assert len(chamadas) <= 6
@@ -0,0 +1,112 @@
+"""
+---------------------------------------------------
+---------- Testes - Arquivos duplicados -----------
+---------------------------------------------------
+Testes da marcação de cópias no report a partir de
+duplicados_de_diretorio() e marca_duplicados()
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_duplicados.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import os
+
+# Bibliotecas de teste
+import pytest
+
+# Filescope
+from filescope import duplicados
+from filescope.duplicados import encontra_duplicados, CacheHashes
+from filescope.manager import controle_de_diretorio, duplicados_de_diretorio, marca_duplicados
+
+
+# Árvore com 3 cópias idênticas e 2 arquivos distintos de mesmo tamanho
+def cria_arvore(root):
+    os.makedirs(os.path.join(root, 'sub'))
+    for i, conteudo in enumerate([b'a' * 4096, b'a' * 4096, b'a' * 4096, b'b' * 4096, b'c' * 4096]):
+        with open(os.path.join(root, 'sub' if i % 2 else '', f'arquivo{i}.bin'), 'wb') as f:
+            f.write(conteudo)
+
+
+def test_marca_duplicados_root_nao_normalizado(tmp_path, monkeypatch):
+    cria_arvore(str(tmp_path / 'tree'))
+    monkeypatch.chdir(tmp_path)
+
+    df_root = controle_de_diretorio('./tree')
+    df_root = marca_duplicados(df_root, duplicados_de_diretorio(df_root))
+
+    copias = dict(zip(df_root['arquivo'], df_root['qtd_copias']))
+    assert copias == {'arquivo0.bin': 3, 'arquivo1.bin': 3, 'arquivo2.bin': 3, 'arquivo3.bin': 1,
+                      'arquivo4.bin': 1}
+
+
+@pytest.fixture
+def arquivos(tmp_path):
+    conteudos = {
+        'grande1.bin': b'i' * 1024 + b'm' * 4096 + b'f' * 1024,
+        'grande2.bin': b'i' * 1024 + b'm' * 4096 + b'f' * 1024,
+        'meio_distinto.bin': b'i' * 1024 + b'x' * 4096 + b'f' * 1024,
+        'pequeno1.bin': b'p' * 100,
+        'pequeno2.bin': b'p' * 100,
+        'unico.bin': b'u' * 777,
+        'vazio1.bin': b'',
+        'vazio2.bin': b'',
+    }
+    for nome, conteudo in conteudos.items():
+        (tmp_path / nome).write_bytes(conteudo)
+    os.link(tmp_path / 'grande1.bin', tmp_path / 'link_grande1.bin')
+    return [str(tmp_path / nome) for nome in sorted(os.listdir(tmp_path))] + [str(tmp_path / 'inexistente.bin')]
+
+
+@pytest.fixture
+def leituras(monkeypatch):
+    contagem = {'parcial': [], 'completo': []}
+    for etapa in contagem:
+        func = getattr(duplicados, f'checksum_{etapa}')
+        def contabilizada(caminho, *args, _func=func, _etapa=etapa, **kwargs):
+            contagem[_etapa].append(os.path.basename(caminho))
+            return _func(caminho, *args, **kwargs)
+        monkeypatch.setattr(duplicados, f'checksum_{etapa}', contabilizada)
+    return contagem
+
+
+def test_encontra_duplicados_em_etapas(tmp_path, arquivos, leituras):
+    grupos, falhas = encontra_duplicados(arquivos, workers=2, tamanho_bloco=1024)
+    assert list(falhas) == [str(tmp_path / 'inexistente.bin')]
+
+    # Grupos ordenados pelo espaço recuperável, com hard links separados das cópias
+    assert [sorted(os.path.basename(a) for a in g.arquivos) for g in grupos] == \
+        [['grande1.bin', 'grande2.bin'], ['pequeno1.bin', 'pequeno2.bin']]
+    assert len(grupos[0].hard_links) == 1 and grupos[0].tamanho == 6144
+
+    # Tamanhos únicos e arquivos vazios não são lidos; apenas arquivos grandes com blocos iguais são lidos por completo
+    assert sorted(leituras['parcial']) == ['grande1.bin', 'grande2.bin', 'meio_distinto.bin', 'pequeno1.bin',
+                                           'pequeno2.bin']
+    assert sorted(leituras['completo']) == ['grande1.bin', 'grande2.bin', 'meio_distinto.bin']
+
+
+def test_encontra_duplicados_com_cache(tmp_path, arquivos, leituras):
+    caminho_cache = str(tmp_path / 'cache' / 'hashes.db')
+    with CacheHashes(caminho_cache) as cache:
+        esperado, _ = encontra_duplicados(arquivos, cache=cache, tamanho_bloco=1024)
+    leituras['parcial'].clear()
+    leituras['completo'].clear()
+
+    # Nova execução: checksums reaproveitados do cache
+    with CacheHashes(caminho_cache) as cache:
+        grupos, _ = encontra_duplicados(arquivos, cache=cache, tamanho_bloco=1024)
+    assert [g.arquivos for g in grupos] == [g.arquivos for g in esperado]
+    assert leituras == {'parcial': [], 'completo': []}
+
+    # Arquivo modificado (mesmo tamanho e nova data de modificação) é lido novamente
+    pequeno2 = tmp_path / 'pequeno2.bin'
+    st = os.stat(pequeno2)
+    pequeno2.write_bytes(b'q' * 100)
+    os.utime(pequeno2, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    with CacheHashes(caminho_cache) as cache:
+        grupos, _ = encontra_duplicados(arquivos, cache=cache, tamanho_bloco=1024)
+    assert [g.arquivos for g in grupos] == [esperado[0].arquivos]
+    assert leituras == {'parcial': ['pequeno2.bin'], 'completo': []}
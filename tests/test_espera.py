@@ -0,0 +1,113 @@
+"""
+---------------------------------------------------
+--------- Testes - Espera por arquivos ------------
+---------------------------------------------------
+Testes das funções de espera pela disponibilidade
+de arquivos
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_espera.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import asyncio
+import os
+import threading
+import time
+
+# Bibliotecas de teste
+import pytest
+
+# Filescope
+from filescope import espera
+from filescope.manager import aguarda_arquivo_origem
+
+
+def test_arquivo_antigo_disponivel_imediatamente(tmp_path):
+    caminho = tmp_path / 'antigo.csv'
+    caminho.write_text('conteudo')
+    os.utime(caminho, (time.time() - 3600, time.time() - 3600))
+
+    inicio = time.monotonic()
+    assert espera.aguarda_arquivo(str(caminho), timeout=10, estabilidade=5)
+    assert time.monotonic() - inicio < 1
+
+
+def test_arquivo_recente_aguarda_estabilidade(tmp_path):
+    caminho = tmp_path / 'recente.csv'
+    caminho.write_text('conteudo')
+
+    inicio = time.monotonic()
+    assert espera.aguarda_arquivo(str(caminho), timeout=10, estabilidade=.5)
+    assert time.monotonic() - inicio >= .3
+
+
+def test_arquivo_criado_durante_a_espera(tmp_path):
+    caminho = tmp_path / 'novo.csv'
+    threading.Timer(.2, caminho.write_text, args=('conteudo',)).start()
+    assert espera.aguarda_arquivo(str(caminho), timeout=10, estabilidade=.1)
+    assert not espera.aguarda_arquivo(str(tmp_path / 'ausente.csv'), timeout=.2)
+
+
+def test_arquivos_simultaneos(tmp_path):
+    caminhos = [str(tmp_path / f'arquivo{i}.csv') for i in range(3)]
+    for caminho in caminhos[:2]:
+        threading.Timer(.1, open(caminho, 'w').close).start()
+    disponibilidade = espera.aguarda_arquivos(caminhos, timeout=1, estabilidade=.1)
+    assert disponibilidade == {caminhos[0]: True, caminhos[1]: True, caminhos[2]: False}
+
+
+@pytest.mark.skipif(not espera.INOTIFY_DISPONIVEL, reason='inotify indisponível')
+def test_espera_orientada_a_eventos(tmp_path):
+    caminho = tmp_path / 'evento.csv'
+    threading.Timer(.2, caminho.write_text, args=('conteudo',)).start()
+
+    # Sem polling: o arquivo é detectado pelo evento muito antes do intervalo de verificação
+    inicio = time.monotonic()
+    assert espera.aguarda_arquivo(str(caminho), timeout=20, estabilidade=.1, intervalo=20, intervalo_inotify=20)
+    assert time.monotonic() - inicio < 2
+
+
+def test_espera_pela_data_de_modificacao_minima(tmp_path):
+    caminho = tmp_path / 'diario.csv'
+    caminho.write_text('ontem')
+    ontem = time.time() - 86400
+    os.utime(caminho, (ontem, ontem))
+    hoje = int(time.strftime('%Y%m%d'))
+
+    assert not aguarda_arquivo_origem(str(tmp_path), caminho.name, timeout=.3, estabilidade=0, janela='anomesdia',
+                                      dt_valida=hoje)
+    threading.Timer(.2, caminho.write_text, args=('hoje',)).start()
+    assert aguarda_arquivo_origem(str(tmp_path), caminho.name, timeout=10, estabilidade=.1, janela='anomesdia',
+                                  dt_valida=hoje, intervalo=.05)
+    assert not aguarda_arquivo_origem(str(tmp_path), caminho.name, timeout=1, janela='anomes', dt_valida=hoje)
+
+
+def test_esperas_assincronas_compartilham_monitor(tmp_path):
+    caminhos = [tmp_path / f'arquivo{i}.csv' for i in range(3)]
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        for i, caminho in enumerate(caminhos[:2]):
+            loop.call_later(.1 * (i + 1), caminho.write_text, 'conteudo')
+        esperas = [espera.aguarda_arquivo_async(str(c), timeout=1.5, estabilidade=.1, intervalo=.05) for c in caminhos]
+        return await asyncio.gather(*esperas), loop in espera._monitores
+
+    disponibilidade, monitor_ativo = asyncio.run(main())
+    assert disponibilidade == [True, True, False]
+    assert not monitor_ativo
+
+
+@pytest.mark.skipif(not espera.INOTIFY_DISPONIVEL, reason='inotify indisponível')
+def test_monitor_encerrado_quando_registro_falha(tmp_path):
+    async def main():
+        loop = asyncio.get_running_loop()
+        descritores = len(os.listdir('/proc/self/fd'))
+        assert not await espera.aguarda_arquivo_async(str(tmp_path / 'inexistente' / 'arquivo.csv'), timeout=.1)
+        return loop in espera._monitores, len(os.listdir('/proc/self/fd')) - descritores
+
+    registrado, descritores_abertos = asyncio.run(main())
+    assert not registrado
+    assert descritores_abertos == 0
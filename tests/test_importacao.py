@@ -0,0 +1,73 @@
+"""
+---------------------------------------------------
+------------ Testes - Importação tardia -----------
+---------------------------------------------------
+Testes da importação do módulo filescope.manager sem
+bibliotecas de análise e sem configuração de log
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_importacao.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import os
+import subprocess
+import sys
+import textwrap
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def executa(codigo):
+    processo = subprocess.run([sys.executable, '-c', textwrap.dedent(codigo)], cwd=RAIZ, capture_output=True,
+                              text=True)
+    assert processo.returncode == 0, processo.stderr
+    return processo
+
+
+def test_importacao_apenas_biblioteca_padrao(tmp_path):
+    executa(f'''
+        import sys
+        from filescope.manager import valida_arquivo_origem, copia_arquivo
+        copia_arquivo({str(tmp_path / 'origem.txt')!r}, {str(tmp_path / 'destino.txt')!r})
+        assert valida_arquivo_origem({str(tmp_path)!r}, 'destino.txt') is False
+        pesadas = {{'numpy', 'pandas', 'matplotlib', 'seaborn'}} & set(sys.modules)
+        assert not pesadas, pesadas
+    ''')
+
+
+def test_bibliotecas_importadas_no_primeiro_uso(tmp_path):
+    (tmp_path / 'arquivo.txt').write_text('conteudo')
+    executa(f'''
+        import sys
+        from filescope.manager import controle_de_diretorio
+        df = controle_de_diretorio({str(tmp_path)!r})
+        assert list(df['arquivo']) == ['arquivo.txt']
+        assert {{'numpy', 'pandas'}} <= set(sys.modules)
+        assert not {{'matplotlib', 'seaborn'}} & set(sys.modules)
+    ''')
+
+
+def test_log_configurado_apenas_no_primeiro_uso():
+    processo = executa('''
+        import logging
+        from filescope import manager
+        assert not logging.getLogger(manager.__file__).handlers
+        manager.logger.info('mensagem de teste')
+        assert len(logging.getLogger(manager.__file__).handlers) == 1
+    ''')
+    assert 'mensagem de teste' in processo.stderr
+
+
+def test_log_configurado_pela_aplicacao():
+    processo = executa('''
+        import logging
+        from filescope import manager
+        handler = logging.StreamHandler()
+        logging.getLogger(manager.__file__).addHandler(handler)
+        manager.logger.warning('mensagem da aplicacao')
+        assert logging.getLogger(manager.__file__).handlers == [handler]
+    ''')
+    assert processo.stderr.count('mensagem da aplicacao') == 1
@@ -0,0 +1,132 @@
+"""
+---------------------------------------------------
+------- Testes - Índice de varredura SQLite -------
+---------------------------------------------------
+Testes da varredura incremental com varre_incremental()
+e controle_de_diretorio(indice=...)
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_index.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import errno
+import os
+import shutil
+
+# Filescope
+from filescope import index
+from filescope.manager import controle_de_diretorio, mudancas_de_diretorio
+
+
+# Árvore com arquivos na raíz, em um subdiretório e em um subdiretório aninhado
+def cria_arvore(root):
+    os.makedirs(os.path.join(root, 'a', 'b'))
+    for caminho in ['raiz.txt', os.path.join('a', 'a.txt'), os.path.join('a', 'b', 'b.txt')]:
+        with open(os.path.join(root, caminho), 'w') as f:
+            f.write('conteudo')
+
+
+def arquivos_indexados(root, caminho_indice):
+    return sorted((os.path.relpath(registro[0], root), registro[1])
+                  for registro in index.le_arquivos(root, caminho_indice))
+
+
+# Datas de modificação no passado (fora da margem de datas recentes do índice)
+def envelhece(*caminhos, dias=10):
+    for caminho in caminhos:
+        st = os.stat(caminho)
+        os.utime(caminho, ns=(st.st_atime_ns, st.st_mtime_ns - dias * 86400 * 10**9))
+
+
+def test_varre_incremental_lista_apenas_diretorios_alterados(tmp_path, monkeypatch):
+    root, caminho_indice = str(tmp_path / 'root'), str(tmp_path / 'indice.db')
+    cria_arvore(root)
+    dir_a, dir_b = os.path.join(root, 'a'), os.path.join(root, 'a', 'b')
+    envelhece(root, dir_a, dir_b)
+    mudancas = index.varre_incremental(root, caminho_indice)
+    assert sorted((tipo, arquivo) for tipo, _, arquivo in mudancas) == \
+        [(index.ADICIONADO, 'a.txt'), (index.ADICIONADO, 'b.txt'), (index.ADICIONADO, 'raiz.txt')]
+
+    lista_diretorio, listados = index.lista_diretorio, []
+    def lista_contabilizada(diretorio):
+        listados.append(diretorio)
+        return lista_diretorio(diretorio)
+    monkeypatch.setattr(index, 'lista_diretorio', lista_contabilizada)
+
+    # Sem alterações: nenhum diretório listado novamente
+    assert index.varre_incremental(root, caminho_indice) == []
+    assert listados == []
+
+    # Arquivo modificado sem alteração do diretório: detectado apenas com verifica_arquivos
+    envelhece(os.path.join(dir_a, 'a.txt'), dias=1)
+    assert index.varre_incremental(root, caminho_indice) == []
+    assert index.varre_incremental(root, caminho_indice, verifica_arquivos=True) == \
+        [(index.MODIFICADO, dir_a, 'a.txt')]
+
+    # Arquivo adicionado: apenas o diretório alterado é listado
+    with open(os.path.join(dir_b, 'novo.txt'), 'w') as f:
+        f.write('novo')
+    envelhece(dir_b, dias=5)
+    assert index.varre_incremental(root, caminho_indice) == [(index.ADICIONADO, dir_b, 'novo.txt')]
+    assert listados == [dir_b]
+    assert len(arquivos_indexados(root, caminho_indice)) == 4
+
+
+def test_controle_de_diretorio_incremental_igual_varredura_completa(tmp_path):
+    root, caminho_indice = str(tmp_path / 'root'), str(tmp_path / 'indice.db')
+    cria_arvore(root)
+    envelhece(root, os.path.join(root, 'a'), os.path.join(root, 'a', 'b'))
+    colunas = ['diretorio', 'arquivo', 'tamanho_kb', 'dt_ult_modif', 'filescope_score']
+
+    completo = controle_de_diretorio(root)[colunas].sort_values('arquivo', ignore_index=True)
+    for _ in range(2):
+        incremental = controle_de_diretorio(root, indice=caminho_indice)[colunas].sort_values('arquivo',
+                                                                                            ignore_index=True)
+        assert incremental.astype({'diretorio': str}).equals(completo.astype({'diretorio': str}))
+
+    os.remove(os.path.join(root, 'raiz.txt'))
+    envelhece(root, dias=5)
+    controle_de_diretorio(root, indice=caminho_indice)
+    df_mudancas = mudancas_de_diretorio(root, caminho_indice)
+    assert df_mudancas[['tipo', 'arquivo']].values.tolist() == [[index.REMOVIDO, 'raiz.txt']]
+
+
+def test_varre_incremental_falha_transitoria_mantem_subarvore(tmp_path, monkeypatch):
+    root, caminho_indice = str(tmp_path / 'root'), str(tmp_path / 'indice.db')
+    cria_arvore(root)
+    index.varre_incremental(root, caminho_indice)
+    indexados = arquivos_indexados(root, caminho_indice)
+    assert len(indexados) == 3
+
+    # Falha transitória no stat do subdiretório 'a'
+    stat, falho = os.stat, os.path.join(root, 'a')
+    def stat_com_falha(caminho, *args, **kwargs):
+        if caminho == falho:
+            raise OSError(errno.ESTALE, 'Stale file handle', caminho)
+        return stat(caminho, *args, **kwargs)
+    monkeypatch.setattr(index.os, 'stat', stat_com_falha)
+    erros = []
+    assert index.varre_incremental(root, caminho_indice, onerror=erros.append) == []
+    assert len(erros) == 1
+    assert arquivos_indexados(root, caminho_indice) == indexados
+
+    # Falha na listagem do subdiretório 'a' (stat bem-sucedido)
+    monkeypatch.setattr(index.os, 'stat', stat)
+    lista_diretorio = index.lista_diretorio
+    def lista_com_falha(diretorio):
+        if diretorio == falho:
+            return [], [], [PermissionError(errno.EACCES, 'Permission denied', diretorio)]
+        return lista_diretorio(diretorio)
+    monkeypatch.setattr(index, 'lista_diretorio', lista_com_falha)
+    assert index.varre_incremental(root, caminho_indice) == []
+    assert arquivos_indexados(root, caminho_indice) == indexados
+
+    # Diretório efetivamente removido
+    monkeypatch.setattr(index, 'lista_diretorio', lista_diretorio)
+    shutil.rmtree(falho)
+    mudancas = index.varre_incremental(root, caminho_indice)
+    assert sorted(arquivo for tipo, _, arquivo in mudancas if tipo == index.REMOVIDO) == ['a.txt', 'b.txt']
+    assert arquivos_indexados(root, caminho_indice) == [('.', 'raiz.txt')]
@@ -0,0 +1,62 @@
+"""
+---------------------------------------------------
+---------- Testes - Varredura em lotes ------------
+---------------------------------------------------
+Testes da varredura em lotes com iter_scan() e
+concatena_lotes()
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_iter_scan.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import os
+
+# Filescope
+from filescope.manager import iter_scan, concatena_lotes, np, pd
+
+
+def cria_arvore(root, n_dirs=3, n_arquivos=3):
+    for i in range(n_dirs):
+        subdir = os.path.join(root, f'd{i}')
+        os.makedirs(subdir)
+        for j in range(n_arquivos):
+            with open(os.path.join(subdir, f'arquivo_{j}.txt'), 'w') as f:
+                f.write('x' * (i * n_arquivos + j))
+
+
+def test_iter_scan_lotes_limitados(tmp_path):
+    cria_arvore(str(tmp_path))
+    dt_relatorio = np.datetime64('2030-01-01', 'ns')
+
+    lotes = list(iter_scan(str(tmp_path), batch_size=4, dt_relatorio=dt_relatorio))
+    assert [len(df_lote) for df_lote in lotes] == [4, 4, 1]
+    assert 'filescope_score' not in lotes[0].columns
+
+    # Lotes concatenados equivalentes à varredura em um único lote, com colunas categóricas preservadas
+    unico, = iter_scan(str(tmp_path), batch_size=None, dt_relatorio=dt_relatorio)
+    df = concatena_lotes(lotes)
+    assert isinstance(df['diretorio'].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(df.reset_index(drop=True), unico, check_categorical=False)
+
+
+def test_iter_scan_entrega_lotes_durante_a_varredura(tmp_path):
+    cria_arvore(str(tmp_path))
+    lotes = iter_scan(str(tmp_path), batch_size=3)
+    primeiro = next(lotes)
+
+    # Arquivos criados após o primeiro lote nos diretórios ainda não listados são encontrados
+    assert primeiro['diretorio'].nunique() == 1
+    pendentes = {str(tmp_path / f'd{i}') for i in range(3)} - set(primeiro['diretorio'])
+    for diretorio in pendentes:
+        open(os.path.join(diretorio, 'tardio.txt'), 'w').close()
+    df_restantes = concatena_lotes(list(lotes))
+    assert set(df_restantes.loc[df_restantes['arquivo'] == 'tardio.txt', 'diretorio']) == pendentes
+
+
+def test_iter_scan_diretorio_vazio(tmp_path):
+    lotes = list(iter_scan(str(tmp_path), batch_size=10))
+    assert len(lotes) == 1 and lotes[0].empty
+    assert list(iter_scan(str(tmp_path), backend='inexistente')) == []
@@ -0,0 +1,52 @@
+"""
+---------------------------------------------------
+------- Testes - Varredura de múltiplas raízes ----
+---------------------------------------------------
+Testes da varredura de múltiplos diretórios em um
+pool de processos com controle_multiplos_diretorios()
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_multiplos.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import os
+
+# Bibliotecas de teste
+import pytest
+
+# Filescope
+from filescope.manager import controle_multiplos_diretorios, controle_de_diretorio, calc_filescope_score, np
+
+
+def cria_raizes(tmp_path):
+    roots = []
+    for i, n_subdirs in enumerate([3, 1]):
+        root = tmp_path / f'raiz{i}'
+        for j in range(n_subdirs):
+            os.makedirs(root / f'sub{j}')
+            (root / f'sub{j}' / f'arquivo{j}.bin').write_bytes(b'x' * (1000 * (i + 1) * (j + 1)))
+        (root / 'raiz.txt').write_bytes(b'x' * 10)
+        roots.append(str(root))
+    return roots
+
+
+@pytest.mark.parametrize('fatiar', [False, True])
+def test_controle_multiplos_diretorios_score_global_e_falhas(tmp_path, fatiar):
+    roots = cria_raizes(tmp_path)
+    inexistente = str(tmp_path / 'inexistente')
+
+    df, falhas = controle_multiplos_diretorios(roots + [inexistente], processos=2, fatiar=fatiar, batch_size=2)
+    assert list(falhas) == [inexistente]
+    assert df['root'].value_counts().to_dict() == {roots[0]: 4, roots[1]: 2}
+    assert df['filescope_score'].is_monotonic_decreasing
+
+    # Score normalizado sobre os arquivos de todos os diretórios
+    esperado = calc_filescope_score(df.drop(columns='filescope_score').copy())['filescope_score']
+    np.testing.assert_allclose(df['filescope_score'].to_numpy(), esperado.to_numpy())
+
+    # Mesmos arquivos da varredura individual de cada diretório
+    individuais = {(d, a) for root in roots for d, a in controle_de_diretorio(root)[['diretorio', 'arquivo']].values}
+    assert set(map(tuple, df[['diretorio', 'arquivo']].values)) == individuais
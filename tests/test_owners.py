@@ -0,0 +1,61 @@
+"""
+---------------------------------------------------
+------------ Testes - Usuários e Grupos -----------
+---------------------------------------------------
+Testes da resolução cacheada de uids e gids com
+resolve_usuario() e resolve_usuarios()
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_owners.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import os
+from collections import Counter
+
+# Bibliotecas de teste
+import pytest
+
+# Filescope
+from filescope import owners
+from filescope.manager import controle_de_diretorio
+
+
+# Base de usuários simulada, contabilizando as consultas por uid
+@pytest.fixture
+def consultas(monkeypatch):
+    contagem = Counter()
+    class Usuario:
+        def __init__(self, uid):
+            self.pw_name = f'usuario{uid}'
+    def getpwuid(uid):
+        contagem[uid] += 1
+        if uid >= 50000:
+            raise KeyError(uid)
+        return Usuario(uid)
+    monkeypatch.setattr(owners, 'getpwuid', getpwuid)
+    owners.limpa_cache_owners()
+    yield contagem
+    owners.limpa_cache_owners()
+
+
+def test_resolve_usuario_consulta_cada_uid_uma_vez(consultas):
+    uids = [1000, 1001, 1000, 50001, 1000, 50001]
+    assert owners.resolve_usuarios(uids) == {1000: 'usuario1000', 1001: 'usuario1001', 50001: '50001'}
+    assert [owners.resolve_usuario(uid) for uid in uids] == ['usuario1000', 'usuario1001', 'usuario1000', '50001',
+                                                             'usuario1000', '50001']
+    assert consultas == {1000: 1, 1001: 1, 50001: 1}
+
+
+@pytest.mark.skipif(not hasattr(os, 'chown') or os.geteuid() != 0, reason='Alteração de owner exige root')
+def test_controle_de_diretorio_resolve_owners_distintos(tmp_path, consultas):
+    for i in range(6):
+        caminho = tmp_path / f'arquivo_{i}.txt'
+        caminho.touch()
+        os.chown(caminho, 1000 + i % 2, -1)
+
+    df = controle_de_diretorio(str(tmp_path))
+    assert df['usuario_owner'].value_counts().to_dict() == {'usuario1000': 3, 'usuario1001': 3}
+    assert consultas == {1000: 1, 1001: 1}
@@ -0,0 +1,73 @@
+"""
+---------------------------------------------------
+------ Testes - Consolidação por diretórios -------
+---------------------------------------------------
+Testes do report consolidado por diretório gerado
+com rollup_de_diretorio() e RollupDiretorios
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_rollup.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import os
+
+# Filescope
+from filescope.manager import controle_de_diretorio, rollup_de_diretorio
+from filescope.rollup import RollupDiretorios
+
+
+def escreve(caminho, qtd_bytes):
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with open(caminho, 'wb') as f:
+        f.write(b'x' * qtd_bytes)
+
+
+def test_rollup_diretorio_com_nome_iniciado_por_pontos(tmp_path, monkeypatch):
+    escreve(str(tmp_path / 't' / '..cache' / 'big.bin'), 5000)
+    escreve(str(tmp_path / 't' / 'a.bin'), 1000)
+    monkeypatch.chdir(tmp_path)
+
+    df_root, df_rollup = controle_de_diretorio('t', rollup=True)
+    tamanhos = dict(zip(df_rollup['diretorio'], df_rollup['tamanho_kb']))
+    raiz = os.path.abspath('t')
+    assert tamanhos[os.path.join(raiz, '..cache')] == 5.0
+    assert tamanhos[raiz] == df_root['tamanho_kb'].sum() == 6.0
+
+
+def test_profundidade_fora_da_raiz():
+    rollup = RollupDiretorios('/mnt/share')
+    assert rollup.profundidade('/mnt/share') == 0
+    assert rollup.profundidade('/mnt/share/..cache/x') == 2
+    assert rollup.profundidade('/mnt') is None
+    assert rollup.profundidade('/mnt/outro') is None
+
+
+def test_rollup_de_diretorio_igual_agregacao_do_report(tmp_path):
+    root = tmp_path / 'root'
+    escreve(str(root / 'raiz.bin'), 1000)
+    escreve(str(root / 'a' / 'a1.bin'), 2000)
+    escreve(str(root / 'a' / 'b' / 'c' / 'c1.bin'), 3000)
+    escreve(str(root / 'a' / 'b' / 'c' / 'c2.bin'), 4000)
+    escreve(str(root / 'd' / 'd1.bin'), 5000)
+
+    df_root = controle_de_diretorio(str(root))
+    df_rollup = rollup_de_diretorio(str(root), batch_size=2)
+    assert list(df_rollup['diretorio']) == [str(root), str(root / 'a'), str(root / 'a' / 'b'),
+                                            str(root / 'a' / 'b' / 'c'), str(root / 'd')]
+    for linha in df_rollup.itertuples():
+        # Totais do diretório e de todos os subdiretórios, incluindo diretórios intermediários sem arquivos
+        arquivos = df_root[df_root['diretorio'].astype(str).map(
+            lambda d: d == linha.diretorio or d.startswith(linha.diretorio + os.sep))]
+        assert (linha.qtd_arquivos, linha.tamanho_kb) == (len(arquivos), arquivos['tamanho_kb'].sum())
+        assert linha.profundidade == os.path.relpath(linha.diretorio, root).count(os.sep) + \
+            (linha.diretorio != str(root))
+        assert linha.pct_tamanho_usuario_principal == 100.0
+
+    # Profundidade máxima e consolidação por usuário
+    assert list(rollup_de_diretorio(str(root), profundidade=1)['diretorio']) == [str(root), str(root / 'a'),
+                                                                                  str(root / 'd')]
+    df_usuarios = rollup_de_diretorio(str(root), profundidade=0, por_usuario=True)
+    assert df_usuarios[['qtd_arquivos', 'tamanho_kb']].values.tolist() == [[5, 15.0]]
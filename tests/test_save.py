@@ -0,0 +1,98 @@
+"""
+---------------------------------------------------
+---------- Testes - Salvamento de reports ---------
+---------------------------------------------------
+Testes da escrita de reports em formato csv,
+parquet e feather com save_data(), le_report() e
+save_lotes_csv()
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_save.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import os
+
+# Bibliotecas de teste
+import pytest
+
+# Filescope
+from filescope.manager import save_data, le_report, save_lotes_csv, controle_de_diretorio, pd
+
+
+@pytest.fixture
+def report(tmp_path):
+    root = tmp_path / 'root'
+    os.makedirs(root / 'a')
+    (root / 'a' / 'x.txt').write_text('x' * 100)
+    (root / 'y.txt').write_text('y' * 10)
+    return controle_de_diretorio(str(root))
+
+
+@pytest.mark.parametrize('filename', ['controle.parquet', 'controle.feather'])
+def test_save_data_formatos_colunares_preservam_tipos(tmp_path, report, filename):
+    save_data(report, output_path=str(tmp_path / 'output'), filename=filename)
+    df = le_report(str(tmp_path / 'output' / filename))
+    pd.testing.assert_frame_equal(df, report.reset_index(drop=True))
+    assert isinstance(df['diretorio'].dtype, pd.CategoricalDtype)
+    assert os.listdir(tmp_path / 'output') == [filename]
+
+
+def test_save_data_dataset_particionado_com_append(tmp_path, report):
+    for _ in range(2):
+        save_data(report, output_path=str(tmp_path), filename='snapshots.parquet',
+                  particao=['dt_relatorio', 'diretorio_raiz'], append=True)
+    dataset = tmp_path / 'snapshots.parquet'
+    dt_particao = report['dt_relatorio'].iloc[0].strftime('%Y-%m-%d')
+    assert sorted(os.listdir(dataset / f'dt_particao={dt_particao}')) == ['diretorio_raiz=a', 'diretorio_raiz=root']
+
+    df = le_report(str(dataset))
+    assert len(df) == 2 * len(report)
+    df_a = le_report(str(dataset), colunas=['arquivo'], filtros=[('diretorio_raiz', '==', 'a')])
+    assert list(df_a['arquivo']) == ['x.txt', 'x.txt']
+
+    # Sem append, o dataset é substituído
+    save_data(report, output_path=str(tmp_path), filename='snapshots.parquet', particao='dt_relatorio')
+    assert len(le_report(str(dataset))) == len(report)
+
+
+def test_save_data_falha_mantem_destino(tmp_path, report, monkeypatch):
+    output = tmp_path / 'output'
+    save_data(report, output_path=str(output), filename='controle.parquet')
+    conteudo = (output / 'controle.parquet').read_bytes()
+
+    # Falha após a escrita parcial do arquivo temporário
+    def to_parquet_com_falha(self, caminho, **kwargs):
+        with open(caminho, 'wb') as f:
+            f.write(b'PAR1')
+        raise OSError('Disco cheio')
+    monkeypatch.setattr(pd.DataFrame, 'to_parquet', to_parquet_com_falha)
+    save_data(report.head(1), output_path=str(output), filename='controle.parquet')
+    assert (output / 'controle.parquet').read_bytes() == conteudo
+    assert os.listdir(output) == ['controle.parquet']
+
+
+def test_save_lotes_csv_lotes_vazios_mantem_destino(tmp_path):
+    destino = tmp_path / 'controle_diretorio.csv'
+    lotes = [pd.DataFrame({'arquivo': ['a.txt', 'b.txt'], 'tamanho_kb': [1.0, 2.0]}),
+             pd.DataFrame({'arquivo': ['c.txt'], 'tamanho_kb': [3.0]})]
+    save_lotes_csv(iter(lotes), output_path=str(tmp_path), filename=destino.name)
+    conteudo = destino.read_text()
+    assert conteudo.splitlines() == ['arquivo,tamanho_kb', 'a.txt,1.0', 'b.txt,2.0', 'c.txt,3.0']
+
+    # Iterável sem lotes não substitui o report anterior
+    save_lotes_csv(iter([]), output_path=str(tmp_path), filename=destino.name)
+    assert destino.read_text() == conteudo
+    assert [p.name for p in tmp_path.iterdir()] == [destino.name]
+
+
+@pytest.mark.parametrize('filename', ['controle.csv', 'controle.csv.gz'])
+def test_save_lotes_csv_igual_report_completo(tmp_path, filename):
+    lotes = [pd.DataFrame({'arquivo': [f'{i}_{j}.txt' for j in range(250)], 'tamanho_kb': [float(i)] * 250})
+             for i in range(4)]
+    save_lotes_csv(iter(lotes), output_path=str(tmp_path), filename=filename, chunksize=100, tamanho_buffer=4096)
+    df = pd.read_csv(tmp_path / filename)
+    pd.testing.assert_frame_equal(df, pd.concat(lotes, ignore_index=True))
+    assert os.listdir(tmp_path) == [filename]
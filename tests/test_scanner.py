@@ -0,0 +1,94 @@
+"""
+---------------------------------------------------
+--------- Testes - Varredura de diretórios --------
+---------------------------------------------------
+Testes da varredura de diretórios com
+varre_scandir(), varre_paralelo() e
+controle_de_diretorio()
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_scanner.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import os
+import threading
+import time
+
+# Bibliotecas de teste
+import pytest
+
+# Filescope
+from filescope import scanner
+from filescope.manager import controle_de_diretorio
+
+
+# Árvore com um arquivo na raíz e n_dirs subdiretórios com um arquivo cada
+def cria_arvore(root, n_dirs):
+    open(os.path.join(root, 'raiz.txt'), 'w').close()
+    for i in range(n_dirs):
+        subdir = os.path.join(root, f'd{i:03d}')
+        os.makedirs(subdir)
+        open(os.path.join(subdir, 'arquivo.txt'), 'w').close()
+
+
+def test_varre_scandir_igual_walk(tmp_path):
+    cria_arvore(str(tmp_path), n_dirs=5)
+    os.makedirs(tmp_path / 'vazio' / 'interno')
+    (tmp_path / 'd000' / 'dados.bin').write_bytes(b'x' * 2500)
+    os.symlink(tmp_path / 'd000', tmp_path / 'atalho')
+
+    def registros(varredura):
+        return sorted((d, a, st.st_size, st.st_mtime_ns) for d, a, st in varredura)
+    assert registros(scanner.varre_scandir(str(tmp_path))) == registros(scanner.varre_walk(str(tmp_path)))
+
+
+@pytest.mark.parametrize('backend,workers', [('scandir', 1), ('walk', 1), ('scandir', 4)])
+def test_controle_de_diretorio_backends(tmp_path, backend, workers):
+    cria_arvore(str(tmp_path), n_dirs=3)
+    (tmp_path / 'd001' / 'dados.bin').write_bytes(b'x' * 2500)
+
+    df = controle_de_diretorio(str(tmp_path), backend=backend, workers=workers)
+    assert len(df) == 5
+    linha = df[df['arquivo'] == 'dados.bin'].iloc[0]
+    assert (linha['diretorio'], linha['tamanho_kb']) == (str(tmp_path / 'd001'), 2.5)
+    assert (df[['dias_desde_criacao', 'dias_desde_ult_modif', 'dias_desde_ult_acesso']] == 0).all().all()
+    assert df['filescope_score'].between(0, 100).all()
+
+
+def test_varre_paralelo_ordem_serial(tmp_path):
+    cria_arvore(str(tmp_path), n_dirs=20)
+    serial = [(d, a) for d, a, _ in scanner.varre_scandir(str(tmp_path))]
+    paralelo = [(d, a) for d, a, _ in scanner.varre_paralelo(str(tmp_path), workers=4, max_pendentes=2)]
+    assert paralelo == serial
+
+
+def test_varre_paralelo_limita_diretorios_pendentes_com_cabeca_lenta(tmp_path, monkeypatch):
+    root, max_pendentes = str(tmp_path), 8
+    cria_arvore(root, n_dirs=200)
+    serial = [(d, a) for d, a, _ in scanner.varre_scandir(root)]
+    lenta = next(d for d, _ in serial if d != root)
+
+    # Listagem lenta do primeiro subdiretório na ordem serial (próximo a ser entregue após a raíz)
+    lista_diretorio = scanner.lista_diretorio
+    listados, trava = [], threading.Lock()
+    def lista_diretorio_lenta(diretorio):
+        if diretorio == lenta:
+            time.sleep(.5)
+        resultado = lista_diretorio(diretorio)
+        with trava:
+            listados.append(diretorio)
+        return resultado
+    monkeypatch.setattr(scanner, 'lista_diretorio', lista_diretorio_lenta)
+
+    entregues = []
+    for diretorio, arquivo, _ in scanner.varre_paralelo(root, workers=4, max_pendentes=max_pendentes):
+        if diretorio == lenta:
+            # Raíz, diretório lento e no máximo max_pendentes - 1 diretórios listados à frente
+            with trava:
+                assert len(listados) <= max_pendentes + 1
+        entregues.append((diretorio, arquivo))
+
+    assert entregues == serial
@@ -0,0 +1,131 @@
+"""
+---------------------------------------------------
+------------ Testes - Score filescope -------------
+---------------------------------------------------
+Testes do cálculo do score filescope sobre a base
+completa e sobre lotes da varredura
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_score.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import os
+import tempfile
+
+# Bibliotecas de teste
+import pytest
+
+# Filescope
+from filescope.manager import calc_filescope_score, score_em_lotes, concatena_lotes, np, pd
+
+
+def base(n=1000, semente=42):
+    rng = np.random.default_rng(semente)
+    return pd.DataFrame({
+        'arquivo': [f'arquivo{i}' for i in range(n)],
+        'tamanho_kb': rng.lognormal(mean=4, sigma=2, size=n),
+        'tamanho_fisico_kb': rng.lognormal(mean=4, sigma=2, size=n),
+        'dias_desde_criacao': rng.integers(0, 2000, size=n),
+        'dias_desde_ult_modif': rng.integers(0, 1000, size=n),
+        'dias_desde_ult_acesso': rng.integers(0, 500, size=n),
+    })
+
+
+def lotes_de(df, tamanho=128):
+    return [df.iloc[i:i + tamanho].reset_index(drop=True) for i in range(0, len(df), tamanho)]
+
+
+@pytest.mark.parametrize('spill_dir', [None, False])
+def test_score_em_lotes_igual_base_completa(spill_dir):
+    df = base()
+    esperado = calc_filescope_score(df.copy())['filescope_score'].to_numpy()
+    df_lotes = concatena_lotes(list(score_em_lotes(lotes_de(df), spill_dir=spill_dir)))
+    np.testing.assert_allclose(df_lotes['filescope_score'].to_numpy(), esperado)
+    assert list(df_lotes['arquivo']) == list(df['arquivo'])
+
+
+def test_score_em_lotes_grava_lotes_em_disco_por_padrao(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    lotes = score_em_lotes(iter(lotes_de(base())))
+
+    # Durante a segunda passagem, os lotes ainda não entregues permanecem apenas em disco
+    next(lotes)
+    spill = [os.path.join(tmp_path, d) for d in os.listdir(tmp_path)]
+    assert len(spill) == 1 and os.path.basename(spill[0]).startswith('filescope_')
+    assert len(os.listdir(spill[0])) == len(lotes_de(base())) - 1
+
+    list(lotes)
+    assert os.listdir(tmp_path) == []
+
+
+def test_score_em_lotes_vazio():
+    assert list(score_em_lotes(iter([]))) == []
+
+
+# Cálculo de referência do score, coluna a coluna com pandas
+def score_referencia(df, pesos=(2, 1, 1, 2), formula='produto', log_tamanho=False, clip_quantis=None):
+    cols = ['tamanho_kb', 'dias_desde_criacao', 'dias_desde_ult_modif', 'dias_desde_ult_acesso']
+    normalizadas = []
+    for col in cols:
+        serie = df[col].astype('float64')
+        if col == 'tamanho_kb' and log_tamanho:
+            serie = np.log1p(serie)
+        if clip_quantis is not None:
+            serie = serie.clip(*serie.quantile(list(clip_quantis)))
+        normalizadas.append((serie - serie.min()) / (serie.max() - serie.min()))
+    if formula == 'soma':
+        score = sum(p * s for p, s in zip(pesos, normalizadas)) / sum(pesos)
+    elif formula == 'geometrica':
+        score = np.prod([s ** (p / sum(pesos)) for p, s in zip(pesos, normalizadas)], axis=0)
+    else:
+        score = np.prod([p * s for p, s in zip(pesos, normalizadas)], axis=0) / np.prod(pesos)
+    score = np.asarray(score, dtype='float64')
+    return 100 * (score - score.min()) / (score.max() - score.min())
+
+
+@pytest.mark.parametrize('formula', ['produto', 'soma', 'geometrica'])
+@pytest.mark.parametrize('log_tamanho,clip_quantis', [(False, None), (True, None), (False, (.05, .95))])
+def test_calc_filescope_score_formulas(formula, log_tamanho, clip_quantis):
+    df = base()
+    calc_filescope_score(df, formula=formula, log_tamanho=log_tamanho, clip_quantis=clip_quantis)
+    np.testing.assert_allclose(df['filescope_score'].to_numpy(),
+                               score_referencia(df, formula=formula, log_tamanho=log_tamanho,
+                                                clip_quantis=clip_quantis))
+    assert df['filescope_score'].min() == 0 and df['filescope_score'].max() == 100
+
+
+def test_calc_filescope_score_chaves_repetidas_e_colunas_constantes():
+    df = base(n=10)
+    df['arquivo'] = 'mesmo_nome.txt'
+    df['dias_desde_criacao'] = 7
+
+    # Sem merge pelas chaves: uma linha de score por arquivo, na ordem da base
+    resultado = calc_filescope_score(df.copy())
+    assert list(resultado.index) == list(range(10))
+
+    # Coluna constante assume o valor neutro (1) do produto
+    normalizadas = [(df[col] - df[col].min()) / (df[col].max() - df[col].min())
+                    for col in ['tamanho_kb', 'dias_desde_ult_modif', 'dias_desde_ult_acesso']]
+    esperado = np.prod(normalizadas, axis=0)
+    esperado = 100 * (esperado - esperado.min()) / (esperado.max() - esperado.min())
+    np.testing.assert_allclose(resultado['filescope_score'].to_numpy(), esperado)
+
+    # Base sem variação: score nulo para todos os arquivos
+    constante = pd.DataFrame({col: [5.0] * 3 for col in ['tamanho_kb', 'dias_desde_criacao', 'dias_desde_ult_modif',
+                                                           'dias_desde_ult_acesso']})
+    assert list(calc_filescope_score(constante)['filescope_score']) == [0.0, 0.0, 0.0]
+
+
+def test_calc_filescope_score_formula_invalida():
+    df = base(n=10)
+    assert 'filescope_score' not in calc_filescope_score(df, formula='inexistente').columns
+
+
+def test_score_em_lotes_cria_spill_dir(tmp_path):
+    spill_dir = tmp_path / 'spill' / 'lotes'
+    df_lotes = concatena_lotes(list(score_em_lotes(lotes_de(base()), spill_dir=str(spill_dir))))
+    assert len(df_lotes) == len(base())
+    assert os.listdir(spill_dir) == []
@@ -0,0 +1,62 @@
+"""
+---------------------------------------------------
+---------- Testes - Espaço físico ocupado ---------
+---------------------------------------------------
+Testes da contabilização do espaço alocado em disco
+(tamanho_fisico_kb), com arquivos esparsos e hard links
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_tamanho_fisico.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import os
+
+# Bibliotecas de teste
+import pytest
+
+# Filescope
+from filescope.manager import controle_de_diretorio, calc_filescope_score
+
+
+@pytest.fixture
+def root(tmp_path):
+    root = tmp_path / 'root'
+    os.makedirs(root / 'sub')
+    with open(root / 'esparso.bin', 'wb') as f:
+        f.truncate(10 * 1024**2)
+    if os.stat(root / 'esparso.bin').st_blocks * 512 >= 10 * 1024**2:
+        pytest.skip('Sistema de arquivos sem suporte a arquivos esparsos')
+    (root / 'denso.bin').write_bytes(os.urandom(256 * 1024))
+    os.link(root / 'denso.bin', root / 'sub' / 'link_denso.bin')
+    return root
+
+
+@pytest.mark.parametrize('opcoes', [{}, {'batch_size': 1}, {'workers': 2}])
+def test_tamanho_fisico_esparsos_e_hard_links(root, opcoes):
+    df = controle_de_diretorio(str(root), **opcoes).set_index('arquivo')
+    alocado_denso = os.stat(root / 'denso.bin').st_blocks * 512 / 1000
+
+    assert df.loc['esparso.bin', 'tamanho_kb'] == 10 * 1024**2 / 1000
+    assert df.loc['esparso.bin', 'tamanho_fisico_kb'] < 10
+    assert df.loc['denso.bin', 'tamanho_kb'] == df.loc['link_denso.bin', 'tamanho_kb'] == 256 * 1024 / 1000
+
+    # Hard links: espaço físico contabilizado uma única vez, inclusive entre lotes
+    assert sorted(df.loc[['denso.bin', 'link_denso.bin'], 'tamanho_fisico_kb']) == [0, alocado_denso]
+    assert df['tamanho_fisico_kb'].sum() == pytest.approx(alocado_denso + df.loc['esparso.bin', 'tamanho_fisico_kb'])
+
+
+def test_score_pelo_tamanho_fisico(root):
+    df = controle_de_diretorio(str(root))
+    assert df.iloc[0]['arquivo'] == 'esparso.bin'
+
+    df_fisico = controle_de_diretorio(str(root), col_tamanho='tamanho_fisico_kb')
+    assert df_fisico.iloc[0]['arquivo'] != 'esparso.bin'
+    assert df_fisico.set_index('arquivo').loc['esparso.bin', 'filescope_score'] < 1
+    assert controle_de_diretorio(str(root), col_tamanho='bogus') is None
+
+    score = calc_filescope_score(df.copy(), col_tamanho='tamanho_fisico_kb').set_index('arquivo')['filescope_score']
+    esperado = df_fisico.set_index('arquivo')['filescope_score']
+    assert score[esperado.index].tolist() == pytest.approx(esperado.tolist())
@@ -0,0 +1,58 @@
+"""
+---------------------------------------------------
+------- Testes - Seleção dos top k arquivos -------
+---------------------------------------------------
+Testes da seleção parcial com top_k(),
+top_k_diretorio() e controle_de_diretorio(top_n=...)
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_topk.py
+---------------------------------------------------
+"""
+
+# Bibliotecas de teste
+import pytest
+
+# Filescope
+from filescope.manager import top_k, top_k_diretorio, controle_de_diretorio, np, pd
+
+
+def base(n=1000):
+    rng = np.random.default_rng(42)
+    return pd.DataFrame({'arquivo': [f'arquivo{i}' for i in range(n)], 'filescope_score': rng.uniform(0, 100, n)})
+
+
+@pytest.mark.parametrize('k', [10, np.int64(10), np.int32(10)])
+def test_top_k_dataframe(k):
+    df = base()
+    esperado = df.sort_values(by='filescope_score', ascending=False).head(10)
+    assert list(top_k(df, k)['arquivo']) == list(esperado['arquivo'])
+
+
+def test_top_k_lotes_igual_dataframe():
+    df = base()
+    lotes = (df.iloc[i:i + 64] for i in range(0, len(df), 64))
+    esperado = top_k(df, 25, col='filescope_score', ascending=True)
+    assert list(top_k(lotes, 25, col='filescope_score', ascending=True)['arquivo']) == list(esperado['arquivo'])
+
+
+@pytest.mark.parametrize('k', [0, -1, 2.5, '10'])
+def test_top_k_k_invalido(k):
+    assert top_k(base(), k) is None
+
+
+@pytest.mark.parametrize('col', ['filescope_score', 'tamanho_kb'])
+def test_top_k_diretorio_igual_report_completo(tmp_path, col):
+    root = tmp_path / 'root'
+    root.mkdir()
+    for i in range(30):
+        (root / f'arquivo{i}.bin').write_bytes(b'x' * ((i * 7919) % 101 + 1) * 100)
+    completo = controle_de_diretorio(str(root))
+    esperado = list(completo.sort_values(col, ascending=False, kind='stable')['arquivo'].head(5))
+
+    assert list(controle_de_diretorio(str(root), sort_col=col, top_n=5)['arquivo']) == esperado
+    df_top = top_k_diretorio(str(root), k=5, col=col, batch_size=7, spill_dir=str(tmp_path / 'spill'))
+    assert list(df_top['arquivo']) == esperado
+    if col == 'filescope_score':
+        np.testing.assert_allclose(df_top['filescope_score'], completo.set_index('arquivo').loc[esperado, col])
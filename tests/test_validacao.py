@@ -0,0 +1,107 @@
+"""
+---------------------------------------------------
+------- Testes - Validação de arquivos na origem --
+---------------------------------------------------
+Testes da validação de presença de arquivos com
+valida_arquivo_origem() e valida_arquivos_origem() e
+da validação em lote da janela de modificação com
+valida_dt_mod_arquivos()
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_validacao.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import os
+from datetime import datetime, timezone
+
+# Bibliotecas de teste
+import pytest
+
+# Filescope
+from filescope import manager
+from filescope.manager import valida_arquivo_origem, valida_arquivos_origem, limpa_cache_listagens, \
+    valida_dt_mod_arquivos, datas_para_inteiros, np, pd
+
+
+@pytest.fixture
+def listagens(monkeypatch):
+    limpa_cache_listagens()
+    listados = []
+    listdir = os.listdir
+    def listdir_contabilizado(caminho):
+        listados.append(caminho)
+        return listdir(caminho)
+    monkeypatch.setattr(manager.os, 'listdir', listdir_contabilizado)
+    yield listados
+    limpa_cache_listagens()
+
+
+def test_valida_arquivo_origem_sem_listar_diretorio(tmp_path, listagens):
+    (tmp_path / 'presente.txt').touch()
+    os.symlink(tmp_path / 'removido.txt', tmp_path / 'link_quebrado.txt')
+
+    assert valida_arquivo_origem(str(tmp_path), 'presente.txt')
+    assert valida_arquivo_origem(str(tmp_path), 'link_quebrado.txt')
+    assert not valida_arquivo_origem(str(tmp_path), 'ausente.txt')
+    assert not valida_arquivo_origem(str(tmp_path / 'inexistente'), 'presente.txt')
+    assert not valida_arquivo_origem(str(tmp_path / 'presente.txt'), 'presente.txt')
+    assert listagens == []
+
+
+def test_valida_arquivos_origem_reaproveita_listagem(tmp_path, listagens):
+    (tmp_path / 'a.txt').touch()
+    st = os.stat(tmp_path)
+    nomes = ['a.txt', 'b.txt']
+
+    assert valida_arquivos_origem(str(tmp_path), nomes) == {'a.txt': True, 'b.txt': False}
+    assert valida_arquivos_origem(str(tmp_path), nomes) == {'a.txt': True, 'b.txt': False}
+    assert len(listagens) == 1
+
+    # Diretório modificado: listagem refeita antes do ttl
+    (tmp_path / 'b.txt').touch()
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert valida_arquivos_origem(str(tmp_path), nomes) == {'a.txt': True, 'b.txt': True}
+    assert len(listagens) == 2
+
+    # Listagem expirada (ttl=0)
+    valida_arquivos_origem(str(tmp_path), nomes, ttl=0)
+    assert len(listagens) == 3
+    assert valida_arquivos_origem(str(tmp_path / 'inexistente'), nomes) == {'a.txt': False, 'b.txt': False}
+
+
+def test_datas_para_inteiros_igual_strftime():
+    epochs_s = np.random.default_rng(0).integers(-10**9, 4 * 10**9, size=10000)
+    datas = epochs_s.astype('datetime64[s]').astype('datetime64[ns]')
+    for janela, formato in [('ano', '%Y'), ('anomes', '%Y%m'), ('anomesdia', '%Y%m%d')]:
+        esperado = [int(datetime.fromtimestamp(int(e), tz=timezone.utc).strftime(formato)) for e in epochs_s]
+        assert datas_para_inteiros(datas, janela).tolist() == esperado
+
+
+@pytest.mark.parametrize('janela,dt_valida,validos', [('ano', 2021, [True, True, False]),
+                                                      ('anomes', 202104, [True, True, False]),
+                                                      ('anomesdia', 20210415, [False, True, False])])
+def test_valida_dt_mod_arquivos(tmp_path, janela, dt_valida, validos):
+    for nome, data in [('a.csv', '2021-04-01T12:00'), ('b.csv', '2021-04-30T23:59'), ('c.txt', '2021-04-30')]:
+        (tmp_path / nome).touch()
+        mtime_ns = int(pd.Timestamp(data, tz='UTC').value)
+        os.utime(tmp_path / nome, ns=(mtime_ns, mtime_ns))
+    arquivos = [str(tmp_path / 'a.csv'), str(tmp_path / 'b.csv'), str(tmp_path / 'ausente.csv')]
+
+    df = valida_dt_mod_arquivos(arquivos, janela=janela, dt_valida=dt_valida, workers=2, tz='UTC')
+    assert list(df['arquivo']) == arquivos
+    assert list(df['presente']) == [True, True, False]
+    assert list(df['valido']) == validos
+    assert df['dt_mod'].iloc[1] == {'ano': 2021, 'anomes': 202104, 'anomesdia': 20210430}[janela]
+    assert pd.isna(df['dt_mod'].iloc[2]) and pd.isna(df['dt_ult_modif'].iloc[2])
+
+    # Padrão glob
+    df_glob = valida_dt_mod_arquivos(str(tmp_path / '*.csv'), janela=janela, dt_valida=dt_valida, tz='UTC')
+    assert list(df_glob['arquivo']) == arquivos[:2]
+
+
+@pytest.mark.parametrize('janela,dt_valida', [('mes', 202104), ('anomes', 2021), ('ano', 'dois mil')])
+def test_valida_dt_mod_arquivos_argumentos_invalidos(tmp_path, janela, dt_valida):
+    assert valida_dt_mod_arquivos([str(tmp_path / 'a.csv')], janela=janela, dt_valida=dt_valida) is None
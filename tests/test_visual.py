@@ -0,0 +1,112 @@
+"""
+---------------------------------------------------
+------------ Testes - Report visual ---------------
+---------------------------------------------------
+Testes das funções de plotagem do report visual
+
+Execução
+---------------------------------------------------
+python -m pytest tests/test_visual.py
+---------------------------------------------------
+"""
+
+# Bibliotecas padrão
+import os
+import warnings
+
+# Bibliotecas de teste
+import pytest
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+
+# Filescope
+from filescope.manager import plot_file_param, visao_geral_dir, visao_geral_usuario, cria_figura, \
+    generate_visual_report, controle_de_diretorio, amostra_estratificada, MAX_PONTOS_RUG, np, pd
+
+
+@pytest.fixture
+def report(tmp_path):
+    root = tmp_path / 'root'
+    root.mkdir()
+    for i in range(20):
+        (root / f'arquivo{i}.bin').write_bytes(b'x' * 100 * (i + 1) ** 2)
+    return controle_de_diretorio(str(root))
+
+
+@pytest.mark.filterwarnings('ignore::FutureWarning')
+def test_generate_visual_report_processos(tmp_path, report):
+    output_path = str(tmp_path / 'imgs')
+    imagens = generate_visual_report(report, output_path=output_path, dpi=50, processos=2)
+    assert set(imagens) == {'viz_dir', 'viz_user', 'viz_file'}
+    for caminho in imagens.values():
+        assert os.path.dirname(caminho) == output_path and caminho.endswith('.png')
+        assert os.path.getsize(caminho) > 0
+
+    # Sem salvamento, as figuras são retornadas ao chamador sem o estado global do pyplot
+    figuras = generate_visual_report(report, save=False, viz_user=False)
+    assert set(figuras) == {'viz_dir', 'viz_file'}
+    assert all(isinstance(fig, Figure) for fig in figuras.values())
+    assert plt.get_fignums() == []
+    assert generate_visual_report(report, output_path=output_path, formato='bogus') is None
+
+
+@pytest.mark.parametrize('top_n, esperados', [(3, ['e', 'd', 'c']), (0, ['e', 'd', 'c', 'b', 'a']),
+                                              (-1, ['e', 'd', 'c', 'b', 'a'])])
+def test_plot_file_param_top_n(top_n, esperados):
+    df = pd.DataFrame({'arquivo': ['a', 'b', 'c', 'd', 'e'], 'tamanho_kb': [1.0, 2.0, 3.0, 4.0, 5.0]})
+    fig = cria_figura(figsize=(4, 4))
+    ax = fig.add_subplot()
+    plot_file_param(df, col='tamanho_kb', ax=ax, top_n=top_n)
+    assert [rotulo.get_text() for rotulo in ax.get_yticklabels()] == esperados
+
+
+@pytest.mark.parametrize('n_linhas, max_pontos', [(500, 50000), (5000, 50000), (5000, 1000)])
+def test_visao_geral_dir_rug_limitado(n_linhas, max_pontos):
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({'tamanho_kb': rng.lognormal(mean=4, sigma=2, size=n_linhas)})
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', FutureWarning)
+        warnings.simplefilter('error', DeprecationWarning)
+        fig = visao_geral_dir(df, max_pontos=max_pontos)
+
+    ax_densidade = fig.axes[1]
+    rug = [c for c in ax_densidade.collections if isinstance(c, LineCollection)]
+    assert len(rug) == 1
+    assert len(rug[0].get_segments()) == min(n_linhas, MAX_PONTOS_RUG)
+    assert any(isinstance(c, PolyCollection) for c in ax_densidade.collections)
+
+
+def base_usuarios(n_linhas, semente=42):
+    rng = np.random.default_rng(semente)
+    return pd.DataFrame({
+        'usuario_owner': rng.choice(['ana', 'bruno', 'carla'], p=[.9, .0995, .0005], size=n_linhas),
+        'arquivo': [f'arquivo{i}' for i in range(n_linhas)],
+        'tamanho_kb': rng.lognormal(mean=4, sigma=2, size=n_linhas),
+        'dias_desde_criacao': rng.integers(0, 2000, size=n_linhas),
+        'dias_desde_ult_acesso': rng.integers(0, 500, size=n_linhas),
+    })
+
+
+def test_amostra_estratificada_mantem_estratos_e_outliers():
+    df = base_usuarios(100000)
+    amostra = amostra_estratificada(df, col_estrato='usuario_owner', n=2000, cols_outliers=['tamanho_kb'], top_n=50)
+    assert abs(len(amostra) - 2000) <= 50
+    assert set(amostra['usuario_owner']) == set(df['usuario_owner'])
+    assert set(df.nlargest(50, 'tamanho_kb').index) <= set(amostra.index)
+    assert amostra.index.is_monotonic_increasing
+    assert amostra_estratificada(df.head(100), col_estrato='usuario_owner', n=2000).equals(df.head(100))
+
+
+@pytest.mark.filterwarnings('ignore::FutureWarning')
+def test_visao_geral_usuario_amostrada():
+    df = base_usuarios(20000)
+    fig = visao_geral_usuario(df, max_pontos=1000)
+    ax_barras, ax_dispersao = fig.axes[:2]
+
+    # Barras sobre a base completa e dispersão sobre a amostra
+    alturas = sorted(p.get_height() for p in ax_barras.patches if p.get_height() > 0)
+    np.testing.assert_allclose(alturas, sorted(df.groupby('usuario_owner')['tamanho_kb'].sum()))
+    qtd_pontos = sum(len(c.get_offsets()) for c in ax_dispersao.collections)
+    assert qtd_pontos < 1200
+    assert 'amostra' in ax_dispersao.get_title()